@@ -1,4 +1,6 @@
-from pyphony.lexicon import Lexicon  # noqa: F401
+from pyphony.lexicon import Lexicon, CompactLexicon  # noqa: F401
+from pyphony.mmap_lexicon import MmapLexicon  # noqa: F401
+from pyphony.sqlite_lexicon import SqliteLexicon  # noqa: F401
 from pyphony.alphabet import Alphabet, Symbol  # noqa: F401
 from pyphony.alphabet import UnknownSymbolException  # noqa: F401
 from pyphony.conversion import Converter  # noqa: F401
@@ -0,0 +1,211 @@
+"""
+Asyncio facade to look up, decode and convert transcriptions.
+Concurrent requests are collected into batches, that are processed
+in an executor without blocking the event loop.
+"""
+import asyncio
+import functools
+
+
+class Batcher:
+    """
+    Collects the items of concurrent calls to :meth:`submit`,
+    that arrive within ``window`` seconds, and processes them
+    with a single call to ``fn`` in an executor.
+
+    ``fn`` gets a list of items and has to return a list with a tuple
+    ``(error, result)`` for every item. If ``error`` is not ``None``,
+    it is raised in the corresponding call to :meth:`submit`.
+
+    Args:
+        fn (callable): Function processing a batch of items.
+        window (float): Seconds to wait for more items,
+                        after the first item of a batch arrived.
+        max_batch_size (int): Maximum number of items per batch.
+                              If reached, the batch is processed without
+                              waiting for the end of the window.
+        executor (concurrent.futures.Executor): Executor to run ``fn`` in.
+                                                If ``None``, the default
+                                                executor of the loop is used.
+    """
+
+    def __init__(self, fn, window=0.005, max_batch_size=1000, executor=None):
+        self.fn = fn
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.executor = executor
+
+        self._pending = []
+        self._timer = None
+
+    async def submit(self, item):
+        """
+        Add the item to the current batch and return its result,
+        once the batch is processed.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch = self._pending
+        self._pending = []
+
+        if len(batch) > 0:
+            loop = asyncio.get_running_loop()
+            items = [item for item, _ in batch]
+            task = loop.run_in_executor(self.executor, self.fn, items)
+            task.add_done_callback(
+                functools.partial(self._resolve, [f for _, f in batch])
+            )
+
+    @staticmethod
+    def _resolve(futures, task):
+        if task.cancelled():
+            for future in futures:
+                future.cancel()
+        elif task.exception() is not None:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(task.exception())
+        else:
+            for future, (error, result) in zip(futures, task.result()):
+                if future.done():
+                    continue
+                elif error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+
+
+class AsyncLexiconService:
+    """
+    Asyncio facade for lexicon lookups, decoding and conversion.
+    Requests that arrive within ``window`` seconds are processed
+    together, decoding with :meth:`pyphony.Alphabet.decode_many` and
+    conversion with :meth:`pyphony.Converter.convert_many`.
+    The batches run in an executor (a thread pool by default),
+    so the event loop is not blocked.
+
+    If a process pool is used as ``executor``, the lexicon, alphabet and
+    converter are pickled with every batch.
+
+    Args:
+        lexicon (Lexicon): Lexicon to look up words in.
+        alphabet (Alphabet): Alphabet to decode transcriptions with.
+        converter (Converter): Converter to convert transcriptions with.
+        strict (bool): Passed to decoding and conversion.
+        ignore_symbols (list): Passed to conversion.
+        window (float): Seconds to wait for more requests for a batch.
+        max_batch_size (int): Maximum number of requests per batch.
+        executor (concurrent.futures.Executor): Executor to process the
+                                                batches in.
+    """
+
+    def __init__(self, lexicon=None, alphabet=None, converter=None,
+                 strict=True, ignore_symbols=None, window=0.005,
+                 max_batch_size=1000, executor=None):
+        self.lexicon = lexicon
+        self.alphabet = alphabet
+        self.converter = converter
+        self.strict = strict
+        self.ignore_symbols = ignore_symbols
+
+        batcher = functools.partial(
+            Batcher,
+            window=window,
+            max_batch_size=max_batch_size,
+            executor=executor
+        )
+
+        self._lookup = batcher(functools.partial(_lookup_batch, lexicon))
+        self._decode = batcher(functools.partial(
+            _decode_batch,
+            alphabet,
+            strict
+        ))
+        self._convert = batcher(functools.partial(
+            _convert_batch,
+            converter,
+            strict,
+            ignore_symbols
+        ))
+
+    async def lookup(self, word):
+        """
+        Return the transcriptions of the given word
+        (see :meth:`pyphony.Lexicon.get`).
+        """
+        return await self._lookup.submit(word)
+
+    async def decode(self, transcription):
+        """
+        Decode the given transcription
+        (see :meth:`pyphony.Alphabet.decode`).
+        """
+        return await self._decode.submit(transcription)
+
+    async def convert(self, symbols):
+        """
+        Convert the given symbols (see :meth:`pyphony.Converter.convert`).
+        """
+        return await self._convert.submit(symbols)
+
+
+def _lookup_batch(lexicon, words):
+    return _single(lexicon.get, words)
+
+
+def _decode_batch(alphabet, strict, transcriptions):
+    try:
+        decoded = alphabet.decode_many(transcriptions, strict=strict)
+        return [(None, d) for d in decoded]
+    except Exception:
+        # Decode one by one, to only fail the erroneous requests
+        return _single(
+            lambda t: alphabet.decode(t, strict=strict),
+            transcriptions
+        )
+
+
+def _convert_batch(converter, strict, ignore_symbols, transcriptions):
+    try:
+        converted = converter.convert_many(
+            transcriptions,
+            strict=strict,
+            ignore_symbols=ignore_symbols
+        )
+        return [(None, c) for c in converted]
+    except Exception:
+        # Convert one by one, to only fail the erroneous requests
+        return _single(
+            lambda t: converter.convert(
+                t,
+                strict=strict,
+                ignore_symbols=ignore_symbols
+            ),
+            transcriptions
+        )
+
+
+def _single(fn, items):
+    results = []
+
+    for item in items:
+        try:
+            results.append((None, fn(item)))
+        except Exception as ex:
+            results.append((ex, None))
+
+    return results
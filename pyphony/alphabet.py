@@ -1,8 +1,14 @@
 import os
+import re
+import copy
 import json
+import time
+import itertools
 import unicodedata
 
 from pyphony import resources
+from pyphony.cache import LRUCache
+from pyphony.trie import PrefixTrie
 
 
 class UnknownSymbolException(Exception):
@@ -38,14 +44,87 @@ class Symbol:
         self.ipa_counterpart = ipa_counterpart
 
 
+class DecompositionTable(dict):
+    """
+    Translation table for ``str.translate``, that maps characters
+    to their unicode decomposition (e.g. '00f5' to '006f' '0303').
+
+    Characters that are kept as they are (e.g. the symbols of an alphabet),
+    are added on creation. The decomposition of any other character is
+    computed on its first lookup and stored in the table.
+
+    Args:
+        keep (iterable): Characters that are not decomposed.
+    """
+
+    def __init__(self, keep=None):
+        super(DecompositionTable, self).__init__(
+            (ord(c), c) for c in keep or []
+        )
+
+    def __missing__(self, code):
+        decomp = unicodedata.decomposition(chr(code))
+
+        if len(decomp) > 0:
+            chars = []
+
+            for p in decomp.split(' '):
+                if p not in ['<compat>']:
+                    chars.append(chr(int(p, 16)))
+
+            value = ''.join(chars)
+        else:
+            value = chr(code)
+
+        self[code] = value
+        return value
+
+
 class Alphabet:
     """
     Represents a collection of symbols of a specific alphabet (e.g. IPA).
+
+    For decoding, the symbols and ignore-symbols are compiled into
+    prefix tries on creation. Hence, ``symbols`` and ``ignore_symbols``
+    should not be modified afterwards.
+
+    Args:
+        symbols (list): List of symbols (:class:`Symbol`).
+        ignore_symbols (list): List of symbols (str) that are skipped
+                               when decoding.
+        cache_size (int): Number of decoded transcriptions to cache
+                          (see :meth:`set_cache_size`).
+        stats (Stats): If not ``None``, the counters of every decoded
+                       transcription are added to it
+                       (see :class:`pyphony.stats.Stats`). Transcriptions
+                       taken from the decode cache are not counted.
+        backend (str): Algorithm used for decoding
+                       (see :meth:`set_backend`).
     """
 
-    def __init__(self, symbols=None, ignore_symbols=None):
+    def __init__(self, symbols=None, ignore_symbols=None, cache_size=0,
+                 stats=None, backend='trie'):
         self.symbols = {p.value: p for p in symbols or []}
         self.ignore_symbols = ignore_symbols or []
+        self._ignore_set = set(self.ignore_symbols)
+        self._decomposition = DecompositionTable(
+            c for c in itertools.chain(self.symbols.keys(), self._ignore_set)
+            if len(c) == 1
+        )
+
+        self._symbol_trie = PrefixTrie((s, s) for s in self.symbols.keys())
+        self._ignore_trie = PrefixTrie((s, s) for s in self.ignore_symbols)
+
+        self._cache = None
+        self.set_cache_size(cache_size)
+
+        self.stats = stats
+
+        self.backend = None
+        self._regex = None
+        self._symbol_regex = None
+        self._ignore_regex = None
+        self.set_backend(backend)
 
     def decompose(self, text):
         """
@@ -55,28 +134,96 @@ class Alphabet:
         they are decomposed and added as separate symbols.
         (e.g. '00f5' to ['006f', '0303']
         """
-        chars = []
+        return text.translate(self._decomposition)
 
-        for x in text:
-            if x not in self.symbols.keys() and \
-                    x not in self.ignore_symbols:
+    def set_backend(self, backend):
+        """
+        Set the algorithm used for decoding.
+        Both give the same result.
 
-                decomp = unicodedata.decomposition(x)
+        * ``trie``: The transcription is matched symbol by symbol with
+          prefix tries of the symbols and ignore-symbols.
+        * ``regex``: The symbols and ignore-symbols are compiled into
+          a single regular expression and the transcription is tokenized
+          with one ``findall`` call. This avoids the python-level loop
+          and is faster for most transcriptions.
 
-                if len(decomp) > 0:
-                    parts = decomp.split(' ')
+        If ``stats`` are attached, both backends collect the same counters,
+        with one step per matched token.
 
-                    for p in parts:
-                        if p not in ['<compat>']:
-                            char = chr(int(p, 16))
-                            chars.append(char)
-                else:
-                    chars.append(x)
+        Args:
+            backend (str): ``trie`` or ``regex``.
+        """
+        if backend not in ('trie', 'regex'):
+            raise ValueError('Unknown backend: {}'.format(backend))
 
-            else:
-                chars.append(x)
+        if backend == 'regex':
+            symbols = self._symbol_trie.to_regex(longest=True)
+            ignore = self._ignore_trie.to_regex(longest=False)
+
+            # Symbols take precedence over ignore-symbols, any other
+            # character is matched on its own
+            parts = [p for p in (symbols, ignore) if p is not None]
+            parts.append('.')
 
-        return ''.join(chars)
+            self._regex = re.compile('|'.join(parts), re.DOTALL)
+            self._symbol_regex = _compile(symbols)
+            self._ignore_regex = _compile(ignore)
+        else:
+            self._regex = None
+            self._symbol_regex = None
+            self._ignore_regex = None
+
+        self.backend = backend
+
+    def copy(self):
+        """
+        Return a copy of the alphabet, that can be configured
+        independently (e.g. with :meth:`set_backend`,
+        :meth:`set_cache_size` or ``stats``).
+
+        The symbols, prefix tries and compiled regular expressions are
+        shared with this alphabet, so copying is cheap. The copy has its
+        own, empty decode cache of the same size and no stats attached.
+
+        Returns:
+            Alphabet: The copy.
+        """
+        other = copy.copy(self)
+        other.stats = None
+
+        if self._cache is not None:
+            other._cache = LRUCache(maxsize=self._cache.maxsize)
+
+        return other
+
+    def set_cache_size(self, size):
+        """
+        Set the number of decoded transcriptions to keep in a cache.
+        If a transcription is decoded again, the cached result is used.
+        If the cache is full, the least recently used transcription is
+        discarded. The cache is cleared when calling this method.
+
+        Args:
+            size (int): Maximum number of cached transcriptions.
+                        If ``0``, caching is disabled.
+                        If ``None``, the cache is unbounded.
+        """
+        if size == 0:
+            self._cache = None
+        else:
+            self._cache = LRUCache(maxsize=size)
+
+    def cache_info(self):
+        """
+        Return the hit/miss statistics of the decode cache.
+
+        Returns:
+            CacheInfo: Tuple ``(hits, misses, maxsize, currsize)``
+            or ``None`` if caching is disabled.
+        """
+        if self._cache is not None:
+            return self._cache.info()
 
     def decode(self, transcription, strict=True):
         """
@@ -91,62 +238,260 @@ class Alphabet:
         Return:
             list: List of symbols (str).
         """
+        if self._cache is None:
+            return self._decode(transcription, strict)
+
+        return self._decode_cached(transcription, strict, self._cache)
+
+    def decode_many(self, transcriptions, strict=True, return_info=False):
+        """
+        Decode all the given transcriptions (see :meth:`decode`).
+        Transcriptions that occur multiple times are only decoded once.
+        If the decode cache is enabled, it is used and shared with
+        :meth:`decode`. Otherwise a cache is used only for this call.
+
+        Args:
+            transcriptions (iterable): Transcriptions (str) to decode.
+            strict (bool): If ``True``, symbols that can't be decode raise
+                           an error. If ``False``, non-matching symbols are
+                           ignored silently.
+            return_info (bool): If ``True``, returns a tuple
+                                (decoded, info) with the cache statistics
+                                (:class:`pyphony.cache.CacheInfo`)
+                                of this call.
+
+        Return:
+            list: List with a list of symbols (str) per transcription.
+        """
+        cache = self._cache
+
+        if cache is None:
+            cache = LRUCache()
+
+        hits = cache.hits
+        misses = cache.misses
+
+        decoded = [
+            self._decode_cached(t, strict, cache)
+            for t in transcriptions
+        ]
+
+        if return_info:
+            info = cache.info()._replace(
+                hits=cache.hits - hits,
+                misses=cache.misses - misses
+            )
+            return decoded, info
+        else:
+            return decoded
+
+    def _decode_cached(self, transcription, strict, cache):
+        key = (transcription, strict)
+        decoded = cache.get(key)
+
+        if decoded is None:
+            decoded = tuple(self._decode(transcription, strict))
+            cache.put(key, decoded)
+
+        return list(decoded)
+
+    def _decode(self, transcription, strict):
+        if self.stats is not None:
+            if self._regex is not None:
+                return self._decode_regex_profiled(
+                    transcription,
+                    strict,
+                    self.stats
+                )
+
+            return self._decode_profiled(transcription, strict, self.stats)
+        elif self._regex is not None:
+            return self._decode_regex(transcription, strict)
 
         decoded = []
-        rest = self.decompose(transcription)
+        text = self.decompose(transcription)
+        symbol_trie = self._symbol_trie
+        ignore_trie = self._ignore_trie
+        pos = 0
+        end = len(text)
 
-        while len(rest) > 0:
-            best_match = self.best_matching_start_symbol(rest)
+        while pos < end:
+            match = symbol_trie.longest_match(text, pos)
 
-            if best_match is None:
-                ignore_match = self.best_matching_start_ignore_symbol(rest)
+            if match is None:
+                ignore_match = ignore_trie.shortest_match(text, pos)
 
                 if ignore_match is not None:
-                    rest = rest[len(ignore_match):]
+                    pos += ignore_match[0]
                 elif strict:
-                    raise UnknownSymbolException(rest[0], rest)
+                    raise UnknownSymbolException(text[pos], text[pos:])
                 else:
-                    rest = rest[1:]
+                    pos += 1
             else:
-                decoded.append(best_match)
-                rest = rest[len(best_match):]
+                decoded.append(match[1])
+                pos += match[0]
+
+        return decoded
+
+    def _decode_regex(self, transcription, strict):
+        text = self.decompose(transcription)
+        tokens = self._regex.findall(text)
+        symbols = self.symbols
+        decoded = [t for t in tokens if t in symbols]
+
+        # Every token is a symbol, an ignore-symbol or a single
+        # unknown character
+        if strict and len(decoded) < len(tokens):
+            for m in self._regex.finditer(text):
+                token = m.group()
+
+                if token not in symbols and token not in self._ignore_set:
+                    raise UnknownSymbolException(token, text[m.start():])
+
+        return decoded
+
+    def _decode_profiled(self, transcription, strict, stats):
+        """
+        Same as :meth:`_decode`, but collects the counters
+        and adds them to ``stats``.
+        """
+        start_time = time.perf_counter()
+        decoded = []
+        text = self.decompose(transcription)
+        symbol_trie = self._symbol_trie
+        ignore_trie = self._ignore_trie
+        hits = {}
+        lengths = {}
+        ignored = {}
+        unknown = {}
+        steps = 0
+        pos = 0
+        end = len(text)
+
+        try:
+            while pos < end:
+                steps += 1
+                match = symbol_trie.longest_match(text, pos)
+
+                if match is None:
+                    ignore_match = ignore_trie.shortest_match(text, pos)
+
+                    if ignore_match is not None:
+                        symbol = ignore_match[1]
+                        ignored[symbol] = ignored.get(symbol, 0) + 1
+                        pos += ignore_match[0]
+                    else:
+                        symbol = text[pos]
+                        unknown[symbol] = unknown.get(symbol, 0) + 1
+
+                        if strict:
+                            raise UnknownSymbolException(symbol, text[pos:])
+
+                        pos += 1
+                else:
+                    length, symbol = match
+                    hits[symbol] = hits.get(symbol, 0) + 1
+                    lengths[length] = lengths.get(length, 0) + 1
+                    decoded.append(symbol)
+                    pos += length
+        finally:
+            stats.record(
+                calls=1,
+                steps=steps,
+                time=time.perf_counter() - start_time,
+                rule_hits=hits,
+                match_lengths=lengths,
+                ignored=ignored,
+                unknown=unknown
+            )
 
         return decoded
 
-    def best_matching_start_symbol(self, transcription):
+    def _decode_regex_profiled(self, transcription, strict, stats):
+        """
+        Same as :meth:`_decode_regex`, but collects the counters
+        and adds them to ``stats``. Every token is one step,
+        so the counters are the same as with :meth:`_decode_profiled`.
+        """
+        start_time = time.perf_counter()
+        decoded = []
+        text = self.decompose(transcription)
+        symbols = self.symbols
+        ignore_set = self._ignore_set
+        hits = {}
+        lengths = {}
+        ignored = {}
+        unknown = {}
+        steps = 0
+
+        try:
+            for m in self._regex.finditer(text):
+                steps += 1
+                token = m.group()
+
+                if token in symbols:
+                    hits[token] = hits.get(token, 0) + 1
+                    lengths[len(token)] = lengths.get(len(token), 0) + 1
+                    decoded.append(token)
+                elif token in ignore_set:
+                    ignored[token] = ignored.get(token, 0) + 1
+                else:
+                    unknown[token] = unknown.get(token, 0) + 1
+
+                    if strict:
+                        raise UnknownSymbolException(token, text[m.start():])
+        finally:
+            stats.record(
+                calls=1,
+                steps=steps,
+                time=time.perf_counter() - start_time,
+                rule_hits=hits,
+                match_lengths=lengths,
+                ignored=ignored,
+                unknown=unknown
+            )
+
+        return decoded
+
+    def best_matching_start_symbol(self, transcription, start=0):
         """
         Return the symbol that matches the start of the transcription.
         If multiple symbols match, the longer one is returned.
         If multiple symbols match with the same length the first occurrence
         is returned.
         Return ``None`` if no symbol matches at all.
-        """
 
-        best_match = None
+        Args:
+            transcription (str): The transcription to match.
+            start (int): Index in the transcription to start matching at.
+        """
+        if self._symbol_regex is not None:
+            return _regex_match(self._symbol_regex, transcription, start)
 
-        for symbol in self.symbols.keys():
-            if transcription.startswith(symbol) and \
-                    (best_match is None or len(symbol) > len(best_match)):
-                best_match = symbol
+        match = self._symbol_trie.longest_match(transcription, start)
 
-        return best_match
+        if match is not None:
+            return match[1]
 
-    def best_matching_start_ignore_symbol(self, transcription):
+    def best_matching_start_ignore_symbol(self, transcription, start=0):
         """
         Return the ignore-symbol that matches the start of the transcription.
         If multiple ignore-symbols match, the shorter one is returned.
         If multiple ignore-symbols match with the same length the first
         occurence is returned.
         Return ``None`` if no ignore-symbol matches at all.
+
+        Args:
+            transcription (str): The transcription to match.
+            start (int): Index in the transcription to start matching at.
         """
-        best_match = None
+        if self._ignore_regex is not None:
+            return _regex_match(self._ignore_regex, transcription, start)
 
-        for sym in self.ignore_symbols:
-            if transcription.startswith(sym) and \
-                    (best_match is None or len(sym) < len(best_match)):
-                best_match = sym
+        match = self._ignore_trie.shortest_match(transcription, start)
 
-        return best_match
+        if match is not None:
+            return match[1]
 
     @classmethod
     def load(cls, path):
@@ -156,6 +501,13 @@ class Alphabet:
         with open(path, 'r') as f:
             data = json.load(f)
 
+        return cls._from_data(data)
+
+    @classmethod
+    def _from_data(cls, data):
+        """
+        Create an alphabet from the content of an alphabet-file.
+        """
         symbols = []
         ignore_symbols = []
 
@@ -177,6 +529,11 @@ class Alphabet:
     def with_name(cls, name):
         """
         Load the alphabet-file with the given name.
+
+        The alphabet is only loaded once per process
+        (see :func:`pyphony.resources.load_cached`). Every call returns
+        a cheap copy of it (see :meth:`copy`), so configuring the returned
+        alphabet doesn't affect other callers.
         """
         alphabet_file_path = resources.get_resource_path([
             'alphabets',
@@ -188,7 +545,11 @@ class Alphabet:
                 'There is no alphabet file with name'.format(name)
             )
 
-        return cls.load(alphabet_file_path)
+        return resources.load_cached(
+            alphabet_file_path,
+            resources.load_json,
+            build=cls._from_data
+        ).copy()
 
     @classmethod
     def ipa(cls):
@@ -205,3 +566,18 @@ class Alphabet:
     @classmethod
     def marytts_de(cls):
         return cls.with_name('marytts_de')
+
+
+def _compile(pattern):
+    if pattern is None:
+        # Never matches
+        pattern = '(?!)'
+
+    return re.compile(pattern, re.DOTALL)
+
+
+def _regex_match(regex, text, start):
+    m = regex.match(text, start)
+
+    if m is not None:
+        return m.group()
@@ -0,0 +1,258 @@
+import sqlite3
+import collections
+import threading
+
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo',
+    ['hits', 'misses', 'maxsize', 'currsize']
+)
+
+
+class LRUCache:
+    """
+    A thread-safe cache, that discards the least recently used
+    items first, if it grows beyond ``maxsize`` items.
+
+    Args:
+        maxsize (int): Maximum number of items to keep.
+                       If ``None``, the cache is unbounded.
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return the value for the given key or ``default``,
+        if the key is not in the cache.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Add a value for the given key.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            if self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove all items and reset the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """
+        Return the hit/miss statistics of the cache.
+
+        Returns:
+            CacheInfo: Tuple ``(hits, misses, maxsize, currsize)``.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+
+class PersistentCache:
+    """
+    A cache stored in a sqlite database, to keep results across runs.
+    Keys are ``str`` or ``bytes`` and values ``str``.
+
+    The cache is bound to a digest of the data the values are computed
+    from (see :meth:`bind`). If a different digest is bound,
+    all values are discarded.
+
+    Looking up most of the values with :meth:`get_many` is faster after
+    loading all of them into memory with :meth:`preload`.
+
+    Args:
+        path (str): Path of the database file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+
+        # All values, if preloaded
+        self._memory = None
+
+        with self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS meta '
+                '(key TEXT PRIMARY KEY, value TEXT)'
+            )
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS entries '
+                '(key BLOB PRIMARY KEY, value TEXT)'
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute(
+                'SELECT COUNT(*) FROM entries'
+            ).fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Close the database.
+        """
+        self._db.close()
+
+    def bind(self, digest):
+        """
+        Bind the cache to the given digest.
+        If the cache was bound to a different digest before,
+        all values are removed.
+
+        Args:
+            digest (str): Digest of the data the values depend on.
+
+        Returns:
+            bool: ``True`` if the values were removed.
+        """
+        with self._lock, self._db:
+            row = self._db.execute(
+                'SELECT value FROM meta WHERE key = ?',
+                ('digest',)
+            ).fetchone()
+
+            if row is not None and row[0] == digest:
+                return False
+
+            self._db.execute('DELETE FROM entries')
+            self._db.execute(
+                'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                ('digest', digest)
+            )
+
+            if self._memory is not None:
+                self._memory.clear()
+
+            return row is not None
+
+    def preload(self):
+        """
+        Load all values into memory. Afterwards :meth:`get_many` looks
+        up the keys in memory instead of querying the database.
+        This is much faster, if most of the values are needed anyway
+        (e.g. when converting a whole lexicon again).
+        """
+        with self._lock:
+            if self._memory is None:
+                self._memory = dict(self._db.execute(
+                    'SELECT key, value FROM entries'
+                ))
+
+    def get_many(self, keys):
+        """
+        Return the values of the given keys.
+
+        Args:
+            keys (list): Keys to look up.
+
+        Returns:
+            dict: The values of the keys, that are in the cache.
+        """
+        keys = list(keys)
+        values = {}
+
+        with self._lock:
+            if self._memory is not None:
+                memory = self._memory
+                values = {k: memory[k] for k in keys if k in memory}
+            else:
+                # Stay below the maximum number of sql variables
+                for i in range(0, len(keys), 500):
+                    batch = keys[i:i + 500]
+                    rows = self._db.execute(
+                        'SELECT key, value FROM entries '
+                        'WHERE key IN ({})'.format(
+                            ','.join('?' * len(batch))
+                        ),
+                        batch
+                    )
+                    values.update(rows)
+
+            self.hits += len(values)
+            self.misses += len(set(keys)) - len(values)
+
+        return values
+
+    def put_many(self, items):
+        """
+        Add the given values in a single transaction.
+
+        Args:
+            items (iterable): Tuples ``(key, value)``.
+        """
+        items = list(items)
+
+        with self._lock, self._db:
+            self._db.executemany(
+                'INSERT OR REPLACE INTO entries (key, value) VALUES (?, ?)',
+                items
+            )
+
+            if self._memory is not None:
+                self._memory.update(items)
+
+    def clear(self):
+        """
+        Remove all values and reset the statistics.
+        """
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM entries')
+            self.hits = 0
+            self.misses = 0
+
+            if self._memory is not None:
+                self._memory.clear()
+
+    def info(self):
+        """
+        Return the hit/miss statistics of the cache.
+
+        Returns:
+            CacheInfo: Tuple ``(hits, misses, maxsize, currsize)``.
+        """
+        return CacheInfo(self.hits, self.misses, None, len(self))
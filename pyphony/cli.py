@@ -0,0 +1,325 @@
+"""
+Command line interface to decode, convert and validate lexica.
+
+The lexica are read from a file or stdin and written to a file or stdout
+line by line, so arbitrary large lexica can be processed in pipelines.
+Files ending with ``.gz`` or ``.bz2`` are (de)compressed transparently,
+compressed input on stdin is detected automatically.
+"""
+import sys
+import contextlib
+
+import click
+
+from pyphony import Alphabet, Converter
+from pyphony.alphabet import UnknownSymbolException
+from pyphony.conversion import MissingMapping
+from pyphony import files
+from pyphony import lexicon
+from pyphony import parallel
+
+
+ALPHABETS = ['ipa', 'sampa', 'xsampa', 'marytts_de']
+
+
+class LinePipeline:
+    """
+    Processes the lines of a lexicon: parses every line,
+    decodes/splits the transcription, converts it optionally
+    and formats it again.
+
+    Args:
+        word_sep (str): Separator between the word and the tokens.
+        in_token_sep (str): Separator between the tokens of the input.
+                            If empty, the transcription is decoded
+                            with ``alphabet``.
+        out_token_sep (str): Separator between the tokens of the output.
+        alphabet (Alphabet): Alphabet of the input.
+                             If ``in_token_sep`` is not empty,
+                             it is used to validate the tokens.
+        converter (Converter): Converter to apply to the tokens.
+        strict (bool): If ``False``, unknown symbols and missing mappings
+                       are ignored.
+    """
+
+    def __init__(self, word_sep=' ', in_token_sep=' ', out_token_sep=' ',
+                 alphabet=None, converter=None, strict=True):
+        self.word_sep = word_sep
+        self.in_token_sep = in_token_sep
+        self.out_token_sep = out_token_sep
+        self.alphabet = alphabet
+        self.converter = converter
+        self.strict = strict
+
+    def process(self, lines, first_line=1):
+        """
+        Process the given lines.
+
+        Args:
+            lines (list): Lines of the lexicon.
+            first_line (int): Line number of the first line.
+
+        Returns:
+            tuple: The output lines and a list of error messages
+            for the lines that could not be processed.
+        """
+        out_lines = []
+        errors = []
+
+        for line_no, line in enumerate(lines, first_line):
+            try:
+                entries = lexicon.Lexicon.iter_parse(
+                    [line],
+                    word_sep=self.word_sep,
+                    token_sep=self.in_token_sep,
+                    alphabet=self.alphabet,
+                    strict=self.strict
+                )
+
+                for word, tokens in entries:
+                    out_lines.append(self.process_entry(word, tokens))
+            except (ValueError, UnknownSymbolException, MissingMapping) as ex:
+                errors.append('Line {}: {}'.format(line_no, ex))
+
+        return out_lines, errors
+
+    def process_entry(self, word, tokens):
+        """
+        Validate and convert the tokens of a parsed line
+        and return the output line.
+        """
+        if self.in_token_sep != '' and \
+                self.alphabet is not None and self.strict:
+            for t in tokens:
+                if t not in self.alphabet.symbols:
+                    raise ValueError('Unknown symbol: {}'.format(t))
+
+        if self.converter is not None:
+            tokens = self.converter.convert(tokens, strict=self.strict)
+
+        return '{}{}{}'.format(
+            word,
+            self.word_sep,
+            self.out_token_sep.join(tokens)
+        )
+
+
+_worker_pipeline = None
+
+
+def _init_worker(pipeline):
+    global _worker_pipeline
+    _worker_pipeline = pipeline
+
+
+def _process_chunk(task):
+    first_line, lines = task
+    return _worker_pipeline.process(lines, first_line=first_line)
+
+
+def run_pipeline(pipeline, in_file, workers=None, chunksize=1000):
+    """
+    Process the lines of ``in_file`` in chunks with the given pipeline.
+    If ``workers`` is greater than 1, the chunks are processed in a pool
+    of processes.
+
+    Returns:
+        generator: Tuples ``(out_lines, errors)`` per chunk,
+                   in the order of the input.
+    """
+    tasks = (
+        (i * chunksize + 1, chunk)
+        for i, chunk in enumerate(parallel.chunked(in_file, chunksize))
+    )
+
+    if workers is not None and workers > 1:
+        return parallel.imap_ordered(
+            _process_chunk,
+            tasks,
+            workers,
+            initializer=_init_worker,
+            initargs=(pipeline,)
+        )
+    else:
+        return (
+            pipeline.process(lines, first_line=first_line)
+            for first_line, lines in tasks
+        )
+
+
+@contextlib.contextmanager
+def open_input(path):
+    if path == '-':
+        with files.open_stream(sys.stdin.buffer, encoding='utf-8') as f:
+            yield f
+    else:
+        with files.open_file(path, 'r', encoding='utf-8') as f:
+            yield f
+
+
+@contextlib.contextmanager
+def open_output(path):
+    if path == '-':
+        yield sys.stdout
+    else:
+        with files.open_file(path, 'w', encoding='utf-8') as f:
+            yield f
+
+
+def process(pipeline, in_path, out_path, workers, chunksize, skip_errors):
+    """
+    Run the pipeline on the input and write the output.
+    If ``skip_errors`` is ``False``, it aborts on the first error.
+    Otherwise erroneous lines are reported on stderr and skipped.
+    """
+    with open_input(in_path) as in_file, open_output(out_path) as out_file:
+        results = run_pipeline(pipeline, in_file, workers, chunksize)
+
+        for out_lines, errors in results:
+            if len(errors) > 0 and not skip_errors:
+                raise click.ClickException(errors[0])
+
+            for error in errors:
+                click.echo(error, err=True)
+
+            if len(out_lines) > 0:
+                out_file.write('\n'.join(out_lines))
+                out_file.write('\n')
+
+
+def common_options(fn):
+    options = [
+        click.argument('in_path', default='-'),
+        click.option('-o', '--output', 'out_path', default='-',
+                     help='Path to write to (default: stdout).'),
+        click.option('--word-sep', default=' ', show_default=True,
+                     help='Separator between word and transcription.'),
+        click.option('--workers', type=int, default=None,
+                     help='Number of processes to use.'),
+        click.option('--chunksize', type=int, default=1000,
+                     show_default=True,
+                     help='Number of lines per chunk.'),
+    ]
+
+    for option in reversed(options):
+        fn = option(fn)
+
+    return fn
+
+
+@click.group()
+def main():
+    """
+    Decode, convert and validate lexica.
+
+    The lexicon is read from IN_PATH (default: stdin).
+    Files ending with .gz or .bz2 are (de)compressed transparently.
+    """
+
+
+@main.command()
+@click.argument('alphabet', type=click.Choice(ALPHABETS))
+@common_options
+@click.option('--token-sep', default=' ', show_default=True,
+              help='Separator between the tokens of the output.')
+@click.option('--strict/--no-strict', default=True,
+              help='Fail on unknown symbols (default) or ignore them.')
+@click.option('--skip-errors', is_flag=True,
+              help='Skip erroneous lines instead of aborting.')
+def decode(alphabet, in_path, out_path, word_sep, workers, chunksize,
+           token_sep, strict, skip_errors):
+    """
+    Split transcriptions without separators into the symbols of ALPHABET.
+    """
+    pipeline = LinePipeline(
+        word_sep=word_sep,
+        in_token_sep='',
+        out_token_sep=token_sep,
+        alphabet=Alphabet.with_name(alphabet),
+        strict=strict
+    )
+
+    process(pipeline, in_path, out_path, workers, chunksize, skip_errors)
+
+
+@main.command()
+@click.argument('src_alphabet', type=click.Choice(ALPHABETS))
+@click.argument('target_alphabet', type=click.Choice(ALPHABETS))
+@common_options
+@click.option('--in-token-sep', default=' ', show_default=True,
+              help='Separator between the tokens of the input. '
+                   'If empty, the transcriptions are decoded '
+                   'with SRC_ALPHABET.')
+@click.option('--out-token-sep', default=' ', show_default=True,
+              help='Separator between the tokens of the output.')
+@click.option('--strict/--no-strict', default=True,
+              help='Fail on missing mappings (default) or ignore them.')
+@click.option('--skip-errors', is_flag=True,
+              help='Skip erroneous lines (e.g. unmappable words) '
+                   'instead of aborting.')
+def convert(src_alphabet, target_alphabet, in_path, out_path, word_sep,
+            workers, chunksize, in_token_sep, out_token_sep, strict,
+            skip_errors):
+    """
+    Convert transcriptions from SRC_ALPHABET to TARGET_ALPHABET.
+    """
+    try:
+        converter = Converter.with_names(src_alphabet, target_alphabet)
+    except FileNotFoundError:
+        raise click.ClickException('No conversion from {} to {}'.format(
+            src_alphabet,
+            target_alphabet
+        ))
+
+    alphabet = None
+
+    if in_token_sep == '':
+        alphabet = Alphabet.with_name(src_alphabet)
+
+    pipeline = LinePipeline(
+        word_sep=word_sep,
+        in_token_sep=in_token_sep,
+        out_token_sep=out_token_sep,
+        alphabet=alphabet,
+        converter=converter,
+        strict=strict
+    )
+
+    process(pipeline, in_path, out_path, workers, chunksize, skip_errors)
+
+
+@main.command()
+@click.argument('alphabet', type=click.Choice(ALPHABETS))
+@common_options
+@click.option('--token-sep', default=' ', show_default=True,
+              help='Separator between the tokens. '
+                   'If empty, the transcriptions are decoded.')
+def validate(alphabet, in_path, out_path, word_sep, workers, chunksize,
+             token_sep):
+    """
+    Check that all transcriptions consist of symbols of ALPHABET.
+    The invalid lines are reported. Exits with status 1,
+    if there are any.
+    """
+    pipeline = LinePipeline(
+        word_sep=word_sep,
+        in_token_sep=token_sep,
+        alphabet=Alphabet.with_name(alphabet)
+    )
+
+    num_errors = 0
+
+    with open_input(in_path) as in_file, open_output(out_path) as out_file:
+        for _, errors in run_pipeline(pipeline, in_file, workers, chunksize):
+            for error in errors:
+                out_file.write('{}\n'.format(error))
+
+            num_errors += len(errors)
+
+    if num_errors > 0:
+        click.echo('Found {} invalid lines'.format(num_errors), err=True)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
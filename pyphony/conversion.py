@@ -1,10 +1,25 @@
+import copy
 import json
+import time
+import hashlib
+import itertools
 import collections
 
-from tqdm import tqdm
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
 
 import pyphony
 from pyphony import resources
+from pyphony import parallel
+from pyphony import progress as progress_
+from pyphony.trie import PrefixTrie
+
+
+# Version of the keys and values in a PersistentCache used by
+# Converter.convert_lexicon. Has to be increased, whenever they change.
+CACHE_FORMAT = 2
 
 
 class MissingMapping(Exception):
@@ -16,18 +31,78 @@ class MissingMapping(Exception):
 
         self.symbol = symbol
 
+    def __reduce__(self):
+        return (self.__class__, (self.symbol,))
+
 
 class Converter:
     """
     Class to convert transcript from one alphabet to another.
+
+    Args:
+        mapping (list, dict): List of tuples ``(in_symbols, out_symbols)``.
+                              Alternatively a dictionary mapping single
+                              input symbols to a list of output symbols.
+        stats (Stats): If not ``None``, the counters of every converted
+                       transcription are added to it
+                       (see :class:`pyphony.stats.Stats`).
+
+    The mapping is compiled into a prefix trie on creation.
+    Hence, it should not be modified afterwards.
     """
 
-    def __init__(self, mapping):
+    def __init__(self, mapping, stats=None):
+        if isinstance(mapping, dict):
+            mapping = [([k], v) for k, v in mapping.items()]
+
         self.mapping = mapping
+        self._index = PrefixTrie(
+            (in_sym, (in_sym, out_sym)) for in_sym, out_sym in mapping
+        )
+
+        # Lookup arrays for convert_many, created on first use
+        self._id_table = None
+
+        # Digest of the mapping, created on first use
+        self._digest = None
+
+        self.stats = stats
+
+    def copy(self):
+        """
+        Return a copy of the converter, that can be configured
+        independently (e.g. with ``stats``).
+
+        The mapping and the compiled prefix trie are shared
+        with this converter, so copying is cheap.
+        The copy has no stats attached.
+
+        Returns:
+            Converter: The copy.
+        """
+        other = copy.copy(self)
+        other.stats = None
+        return other
+
+    def digest(self):
+        """
+        Return a hash of the mapping, that changes
+        whenever the mapping changes.
+
+        Returns:
+            str: Hex digest of the mapping.
+        """
+        if self._digest is None:
+            data = json.dumps(self.mapping, ensure_ascii=False)
+            self._digest = hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+        return self._digest
 
     def convert_lexicon(self, in_lex, strict=True,
                         ignore_symbols=None, return_errors=False,
-                        ignore_unmappable_words=False):
+                        ignore_unmappable_words=False,
+                        workers=None, chunksize=1000, progress=None,
+                        cache=None, out_lex=None):
         """
         Convert the given lexicon.
 
@@ -42,33 +117,208 @@ class Converter:
             ignore_unmappable_words (bool): If ``True``, no exception is
                                             thrown if word can't get mapped,
                                             but is just ignored.
+            workers (int): If greater than 1, the entries are converted
+                           in chunks in a pool of ``workers`` processes.
+                           The result is the same as with a single process.
+            chunksize (int): Number of words per chunk,
+                             if ``workers`` is used.
+            progress (Progress): Hook to report the number of converted
+                                 words (see :func:`pyphony.progress.resolve`).
+                                 By default nothing is reported.
+            cache (PersistentCache): Cache of converted transcriptions.
+                                     If given, only transcriptions that are
+                                     not in the cache are converted.
+            out_lex (Lexicon): Lexicon to add the converted transcriptions
+                               to (e.g. a :class:`pyphony.SqliteLexicon`).
+                               By default a new :class:`pyphony.Lexicon`
+                               is created.
+
+        A ``cache`` (:class:`pyphony.cache.PersistentCache`) keeps the
+        converted transcriptions across runs, so a lexicon with few changes
+        is converted again quickly. The cache is bound to the
+        :meth:`digest` of the mapping and the options ``strict`` and
+        ``ignore_symbols``, hence it is cleared, if one of them changed.
+        It is loaded into memory once (see
+        :meth:`pyphony.cache.PersistentCache.preload`), so taking a
+        transcription from the cache is cheaper than converting it.
+        With a cache, the conversion runs in this process and
+        ``workers`` are not used.
 
         Returns:
             Lexicon: Converted lexicon.
         """
-        out_lex = pyphony.Lexicon()
-        errors = collections.Counter()
+        if out_lex is None:
+            out_lex = pyphony.Lexicon()
 
-        for entry, transcriptions in tqdm(in_lex.entries.items()):
-            for t in transcriptions:
-                try:
-                    conv, t_errors = self.convert(
-                        t,
-                        strict=strict,
-                        ignore_symbols=ignore_symbols,
-                        return_errors=True
-                    )
-                    errors.update(t_errors)
+        errors = collections.Counter()
+        progress = progress_.resolve(progress)
+        total = len(in_lex.entries)
+
+        if cache is not None:
+            cache.bind(self._cache_digest(strict, ignore_symbols))
+            cache.preload()
+            items = progress(
+                in_lex.entries.items(),
+                desc='Convert lexicon',
+                total=total
+            )
+
+            for chunk in parallel.chunked(items, chunksize):
+                self._convert_cached(
+                    chunk,
+                    strict,
+                    ignore_symbols,
+                    ignore_unmappable_words,
+                    errors,
+                    cache,
+                    out_lex
+                )
+        elif workers is not None and workers > 1:
+            chunks = parallel.chunked(in_lex.entries.items(), chunksize)
+            tasks = (
+                (chunk, strict, ignore_symbols, ignore_unmappable_words)
+                for chunk in chunks
+            )
+            results = parallel.imap_ordered(
+                _convert_chunk,
+                tasks,
+                workers,
+                initializer=_init_worker,
+                initargs=(self,)
+            )
+            results = progress(
+                results,
+                desc='Convert lexicon',
+                total=total,
+                weight=lambda r: len(r[0])
+            )
+
+            for converted, chunk_errors, chunk_stats in results:
+                errors.update(chunk_errors)
+
+                if chunk_stats is not None:
+                    self.stats.merge(chunk_stats)
+
+                for entry, transcriptions in converted:
+                    for conv in transcriptions:
+                        out_lex.add(entry, conv)
+        else:
+            items = progress(
+                in_lex.entries.items(),
+                desc='Convert lexicon',
+                total=total
+            )
+
+            for entry, transcriptions in items:
+                converted = self._convert_transcriptions(
+                    transcriptions,
+                    strict,
+                    ignore_symbols,
+                    ignore_unmappable_words,
+                    errors
+                )
+
+                for conv in converted:
                     out_lex.add(entry, conv)
-                except MissingMapping as ex:
-                    if not ignore_unmappable_words:
-                        raise ex
 
         if return_errors:
             return out_lex, errors
         else:
             return out_lex
 
+    def _convert_cached(self, entries, strict, ignore_symbols,
+                        ignore_unmappable_words, errors, cache, out_lex):
+        """
+        Convert the transcriptions of the given entries
+        ``(word, transcriptions)`` like :meth:`_convert_transcriptions`
+        and add them to ``out_lex``, taking the results from the cache
+        where possible. The results of all other transcriptions are
+        added to the cache.
+        """
+        keys = [
+            _cache_key(t)
+            for _, transcriptions in entries
+            for t in transcriptions
+        ]
+        cached = cache.get_many(keys)
+        new = {}
+        keys = iter(keys)
+        add = out_lex.add
+
+        try:
+            for entry, transcriptions in entries:
+                for t in transcriptions:
+                    key = next(keys)
+                    value = cached.get(key)
+
+                    if value is None:
+                        value = new.get(key)
+
+                    if value is None:
+                        try:
+                            value = _encode_converted(*self.convert(
+                                t,
+                                strict=strict,
+                                ignore_symbols=ignore_symbols,
+                                return_errors=True
+                            ))
+                        except MissingMapping as ex:
+                            # Unmappable transcriptions are cached as well
+                            value = _encode_converted(None, ex.symbol)
+
+                        new[key] = value
+
+                    conv, t_errors = _decode_converted(value)
+
+                    if conv is None:
+                        if not ignore_unmappable_words:
+                            raise MissingMapping(t_errors)
+                    else:
+                        if t_errors:
+                            errors.update(t_errors)
+
+                        add(entry, conv)
+        finally:
+            cache.put_many(new.items())
+
+    def _cache_digest(self, strict, ignore_symbols):
+        """
+        Return the digest a :class:`PersistentCache` is bound to,
+        when converting with the given options.
+        The transcriptions are used as keys within the cache.
+        """
+        options = json.dumps(
+            [CACHE_FORMAT, self.digest(), strict,
+             sorted(ignore_symbols or [])],
+            ensure_ascii=False
+        )
+        return hashlib.sha1(options.encode('utf-8')).hexdigest()
+
+    def _convert_transcriptions(self, transcriptions, strict, ignore_symbols,
+                                ignore_unmappable_words, errors):
+        """
+        Convert all transcriptions of a single word.
+        Failed mappings are added to ``errors``.
+        Return the list of converted transcriptions.
+        """
+        converted = []
+
+        for t in transcriptions:
+            try:
+                conv, t_errors = self.convert(
+                    t,
+                    strict=strict,
+                    ignore_symbols=ignore_symbols,
+                    return_errors=True
+                )
+                errors.update(t_errors)
+                converted.append(conv)
+            except MissingMapping as ex:
+                if not ignore_unmappable_words:
+                    raise ex
+
+        return converted
+
     def convert(self, in_symbols, strict=True,
                 ignore_symbols=None, return_errors=False):
         """
@@ -86,54 +336,356 @@ class Converter:
         Returns:
             list: List of output symbols.
         """
-        ignore_symbols = ignore_symbols or []
-        rest_in_symbols = list(in_symbols)
+        if self.stats is not None:
+            return self._convert_profiled(
+                in_symbols,
+                strict,
+                ignore_symbols,
+                return_errors,
+                self.stats
+            )
+
+        ignore_symbols = set(ignore_symbols or [])
+        in_symbols = list(in_symbols)
+        index = self._index
         out_symbols = []
         errors = collections.Counter()
+        pos = 0
+        end = len(in_symbols)
 
-        while len(rest_in_symbols) > 0:
-            next_match = self.best_match(rest_in_symbols)
+        while pos < end:
+            next_match = index.longest_match(in_symbols, pos)
 
             if next_match is not None:
-                out_symbols.extend(next_match[1])
-                rest_in_symbols = rest_in_symbols[len(next_match[0]):]
+                out_symbols.extend(next_match[1][1])
+                pos += next_match[0]
             else:
-                can_be_ignored = rest_in_symbols[0] in ignore_symbols
+                symbol = in_symbols[pos]
 
-                if not can_be_ignored:
+                if symbol not in ignore_symbols:
                     if strict:
-                        raise MissingMapping(rest_in_symbols[0])
+                        raise MissingMapping(symbol)
                     else:
-                        errors.update(rest_in_symbols[:1])
+                        errors[symbol] += 1
 
-                rest_in_symbols = rest_in_symbols[1:]
+                pos += 1
 
         if return_errors:
             return out_symbols, errors
         else:
             return out_symbols
 
-    def best_match(self, symbols):
+    def _convert_profiled(self, in_symbols, strict, ignore_symbols,
+                          return_errors, stats):
+        """
+        Same as :meth:`convert`, but collects the counters
+        and adds them to ``stats``.
+        """
+        start_time = time.perf_counter()
+        ignore_symbols = set(ignore_symbols or [])
+        in_symbols = list(in_symbols)
+        index = self._index
+        out_symbols = []
+        errors = collections.Counter()
+        hits = {}
+        lengths = {}
+        ignored = {}
+        unknown = {}
+        steps = 0
+        pos = 0
+        end = len(in_symbols)
+
+        try:
+            while pos < end:
+                steps += 1
+                next_match = index.longest_match(in_symbols, pos)
+
+                if next_match is not None:
+                    length, (rule_in, rule_out) = next_match
+                    rule = tuple(rule_in)
+                    hits[rule] = hits.get(rule, 0) + 1
+                    lengths[length] = lengths.get(length, 0) + 1
+                    out_symbols.extend(rule_out)
+                    pos += length
+                else:
+                    symbol = in_symbols[pos]
+
+                    if symbol in ignore_symbols:
+                        ignored[symbol] = ignored.get(symbol, 0) + 1
+                    else:
+                        unknown[symbol] = unknown.get(symbol, 0) + 1
+
+                        if strict:
+                            raise MissingMapping(symbol)
+                        else:
+                            errors[symbol] += 1
+
+                    pos += 1
+        finally:
+            stats.record(
+                calls=1,
+                steps=steps,
+                time=time.perf_counter() - start_time,
+                rule_hits=hits,
+                match_lengths=lengths,
+                ignored=ignored,
+                unknown=unknown
+            )
+
+        if return_errors:
+            return out_symbols, errors
+        else:
+            return out_symbols
+
+    def convert_many(self, transcriptions, strict=True,
+                     ignore_symbols=None, return_errors=False):
+        """
+        Convert all the given transcriptions (see :meth:`convert`).
+
+        If numpy is available, the symbols of all transcriptions are
+        mapped to integer ids. Transcriptions that only contain symbols
+        with a mapping of a single input symbol, which is not the start of
+        a mapping of multiple symbols, are converted with a single lookup
+        for all of them. All others are converted with :meth:`convert`.
+        The result is the same in both cases.
+        If ``stats`` are attached, all transcriptions are converted with
+        :meth:`convert`, so every one of them is counted.
+
+        Args:
+            transcriptions (list): List of transcriptions
+                                   (list of input symbols).
+            strict (bool): If ``False``, missing mappings are ignored.
+            ignore_symbols (list): List of symbols that can be ignored,
+                                   if no mapping is available.
+            return_errors (bool): If ``True``, returns a tuple
+                                  (out_transcriptions, errors) containing
+                                  failed mappings.
+
+        Returns:
+            list: List with a list of output symbols per transcription.
+        """
+        transcriptions = list(transcriptions)
+        errors = collections.Counter()
+
+        if np is None or self.stats is not None:
+            simple = [False] * len(transcriptions)
+        else:
+            simple, out_symbols, out_offsets = self._convert_simple(
+                transcriptions
+            )
+
+        converted = []
+
+        for i, t in enumerate(transcriptions):
+            if simple[i]:
+                converted.append(out_symbols[out_offsets[i]:out_offsets[i + 1]])
+            else:
+                conv, t_errors = self.convert(
+                    t,
+                    strict=strict,
+                    ignore_symbols=ignore_symbols,
+                    return_errors=True
+                )
+                errors.update(t_errors)
+                converted.append(conv)
+
+        if return_errors:
+            return converted, errors
+        else:
+            return converted
+
+    def _convert_simple(self, transcriptions):
+        """
+        Convert the given transcriptions with numpy, using only the
+        mappings of single symbols.
+
+        Returns:
+            tuple: A list that indicates for every transcription,
+            whether it could be converted, the flat list of output symbols
+            and the offset of every transcription in the output symbols.
+        """
+        if self._id_table is None:
+            self._id_table = self._create_id_table()
+
+        symbol_ids, is_simple, out_starts, out_lengths, out_ids, \
+            out_values = self._id_table
+
+        # Ragged array of all transcriptions, unknown symbols get the last id
+        unknown = len(is_simple) - 1
+        lengths = np.fromiter(
+            (len(t) for t in transcriptions),
+            dtype=np.int64,
+            count=len(transcriptions)
+        )
+        in_offsets = np.zeros(len(transcriptions) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=in_offsets[1:])
+
+        ids = np.fromiter(
+            map(
+                symbol_ids.get,
+                itertools.chain.from_iterable(transcriptions),
+                itertools.repeat(unknown)
+            ),
+            dtype=np.int64,
+            count=int(in_offsets[-1])
+        )
+
+        # A transcription is simple, if all of its symbols are simple
+        pos_simple = is_simple[ids]
+        complex_count = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(~pos_simple, out=complex_count[1:])
+        simple = (complex_count[in_offsets[1:]] -
+                  complex_count[in_offsets[:-1]]) == 0
+
+        # Gather the output of every position,
+        # positions that are not simple have no output
+        pos_lengths = np.where(pos_simple, out_lengths[ids], 0)
+        pos_out_offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(pos_lengths, out=pos_out_offsets[1:])
+
+        total = int(pos_out_offsets[-1])
+        gather = np.arange(total, dtype=np.int64) + np.repeat(
+            out_starts[ids] - pos_out_offsets[:-1],
+            pos_lengths
+        )
+        out_symbols = out_values[out_ids[gather]].tolist()
+        out_offsets = pos_out_offsets[in_offsets].tolist()
+
+        return simple.tolist(), out_symbols, out_offsets
+
+    def _create_id_table(self):
+        """
+        Create the lookup arrays for :meth:`_convert_simple`.
+        """
+        symbol_ids = {}
+        starts_multiple = set()
+
+        for in_sym, _ in self.mapping:
+            for x in in_sym:
+                symbol_ids.setdefault(x, len(symbol_ids))
+
+            if len(in_sym) > 1:
+                starts_multiple.add(in_sym[0])
+
+        out_symbol_ids = {}
+        is_simple = np.zeros(len(symbol_ids) + 1, dtype=bool)
+        out_starts = np.zeros(len(symbol_ids) + 1, dtype=np.int64)
+        out_lengths = np.zeros(len(symbol_ids) + 1, dtype=np.int64)
+        out_ids = []
+
+        for x, symbol_id in symbol_ids.items():
+            match = self._index.longest_match([x])
+
+            if match is None or x in starts_multiple:
+                continue
+
+            out_sym = match[1][1]
+            is_simple[symbol_id] = True
+            out_starts[symbol_id] = len(out_ids)
+            out_lengths[symbol_id] = len(out_sym)
+
+            for y in out_sym:
+                out_ids.append(
+                    out_symbol_ids.setdefault(y, len(out_symbol_ids))
+                )
+
+        out_values = np.empty(len(out_symbol_ids), dtype=object)
+        out_values[:] = list(out_symbol_ids.keys())
+
+        return (
+            symbol_ids,
+            is_simple,
+            out_starts,
+            out_lengths,
+            np.array(out_ids, dtype=np.int64),
+            out_values
+        )
+
+    def best_match(self, symbols, start=0):
         """
         Return the best matching mapping for the next possible symbol(s).
         Longer input symbols are prioritized.
+
+        Args:
+            symbols (list): List of input symbols.
+            start (int): Index in ``symbols`` to start matching at.
+
+        Returns:
+            tuple: The matching mapping ``(in_symbols, out_symbols)``
+            or ``None`` if there is no match.
         """
-        best_match = None
+        match = self._index.longest_match(symbols, start)
+
+        if match is not None:
+            return match[1]
 
-        for in_sym, out_sym in self.mapping:
-            matches = True
+    @classmethod
+    def compose(cls, first, second, return_errors=False):
+        """
+        Create a converter, that converts with ``first`` and
+        then with ``second`` in a single pass.
+        The output of every mapping of ``first`` is converted with
+        ``second`` upfront, so the longest match is done only on
+        the input of ``first``.
+
+        The result is equal to a conversion with both converters, except
+        for the mappings reported in the errors:
+
+        * ``unmappable``: Mappings whose output contains symbols,
+          ``second`` has no mapping for. They are left out.
+        * ``ambiguous``: Mappings whose output ends with the beginning
+          of a multi-symbol mapping of ``second``, that may be continued
+          by the output of the following mapping. Such a mapping of
+          ``second`` across the outputs of ``first`` is not applied.
 
-            for i, x in enumerate(in_sym):
-                if len(symbols) <= i:
-                    matches = False
-                elif symbols[i] != x:
-                    matches = False
+        Args:
+            first (Converter): Converter that is applied first.
+            second (Converter): Converter that is applied on the output
+                                of ``first``.
+            return_errors (bool): If ``True``, returns a tuple
+                                  (converter, errors), where errors is a
+                                  dictionary with the input symbols
+                                  (tuples) of the affected mappings
+                                  of ``first``.
 
-            if matches and \
-                    (best_match is None or len(in_sym) > len(best_match[0])):
-                best_match = (in_sym, out_sym)
+        Returns:
+            Converter: The composed converter.
+        """
+        mapping = []
+        errors = {
+            'unmappable': [],
+            'ambiguous': [],
+        }
+
+        starts = {out_sym[0] for _, out_sym in first.mapping if out_sym}
+        heads = [
+            list(in_sym[:k])
+            for in_sym, _ in second.mapping
+            for k in range(1, len(in_sym))
+            if in_sym[k] in starts
+        ]
+
+        for in_sym, out_sym in first.mapping:
+            try:
+                conv = second.convert(out_sym)
+            except MissingMapping:
+                errors['unmappable'].append(tuple(in_sym))
+                continue
+
+            mapping.append((list(in_sym), conv))
+
+            for head in heads:
+                if len(head) <= len(out_sym) and \
+                        list(out_sym[len(out_sym) - len(head):]) == head:
+                    errors['ambiguous'].append(tuple(in_sym))
+                    break
+
+        composed = cls(mapping)
 
-        return best_match
+        if return_errors:
+            return composed, errors
+        else:
+            return composed
 
     @classmethod
     def load(cls, path):
@@ -150,6 +702,14 @@ class Converter:
 
     @classmethod
     def with_names(cls, src_alphabet, target_alphabet):
+        """
+        Load the converter for the alphabets with the given names.
+
+        The converter is only loaded once per process
+        (see :func:`pyphony.resources.load_cached`). Every call returns
+        a cheap copy of it (see :meth:`copy`), so configuring the returned
+        converter doesn't affect other callers.
+        """
         path = resources.get_resource_path([
             'conversion',
             '{}_to_{}.json'.format(
@@ -158,7 +718,11 @@ class Converter:
             )]
         )
 
-        return cls.load(path)
+        return resources.load_cached(
+            path,
+            resources.load_json,
+            build=cls
+        ).copy()
 
     @classmethod
     def ipa_to_xsampa(cls):
@@ -171,3 +735,91 @@ class Converter:
     @classmethod
     def marytts_de_to_ipa(cls):
         return cls.with_names('marytts_de', 'ipa')
+
+
+def _cache_key(transcription):
+    """
+    Return the key of a transcription in a :class:`PersistentCache`.
+    Every token is terminated with ``\\0``, so the key is unique
+    (e.g. for ``[]`` and ``['']``). Transcriptions with ``\\0`` in
+    a token use the representation of the list, which contains
+    no ``\\0`` and doesn't end with it.
+    """
+    key = '\0'.join(transcription) + '\0'
+
+    if key.count('\0') != len(transcription):
+        return repr(list(transcription))
+
+    return key
+
+
+def _encode_converted(converted, errors):
+    """
+    Encode a converted transcription and its errors to store it in a
+    :class:`PersistentCache`. Unmappable transcriptions have
+    ``None`` as ``converted`` and the missing symbol as ``errors``.
+    """
+    if converted is not None and not errors and \
+            all(s and '\0' not in s for s in converted):
+        # Short form for the common case,
+        # only used if it can be split unambiguously
+        return '=' + '\0'.join(converted)
+
+    return json.dumps([converted, errors], ensure_ascii=False)
+
+
+def _decode_converted(value):
+    """
+    Decode a value created with :func:`_encode_converted`.
+    Return the converted transcription and its errors.
+    """
+    if value[:1] == '=':
+        if len(value) == 1:
+            return [], None
+
+        return value[1:].split('\0'), None
+
+    return json.loads(value)
+
+
+_worker_converter = None
+
+
+def _init_worker(converter):
+    """
+    Initialize a worker process of :meth:`Converter.convert_lexicon`.
+    The converter is passed once per process instead of once per chunk.
+    """
+    global _worker_converter
+    _worker_converter = converter
+
+    # Only the counts of the worker are sent back to the parent
+    if converter.stats is not None:
+        converter.stats.reset()
+
+
+def _convert_chunk(task):
+    """
+    Convert a chunk of lexicon entries in a worker process.
+    Return the converted entries, the failed mappings and
+    the stats of the chunk, if the converter has stats.
+    """
+    entries, strict, ignore_symbols, ignore_unmappable_words = task
+    errors = collections.Counter()
+    converted = []
+
+    for entry, transcriptions in entries:
+        converted.append((entry, _worker_converter._convert_transcriptions(
+            transcriptions,
+            strict,
+            ignore_symbols,
+            ignore_unmappable_words,
+            errors
+        )))
+
+    stats = None
+
+    if _worker_converter.stats is not None:
+        stats = _worker_converter.stats.pop()
+
+    return converted, errors, stats
@@ -0,0 +1,106 @@
+"""
+Helpers to work with (compressed) files.
+"""
+import io
+import os
+import bz2
+import gzip
+
+
+GZIP_MAGIC = b'\x1f\x8b'
+BZ2_MAGIC = b'BZh'
+
+
+def open_file(path, mode='r', encoding=None):
+    """
+    Open the file at the given path.
+    Files ending with ``.gz`` or ``.bz2`` are (de)compressed transparently.
+
+    Args:
+        path (str): Path of the file.
+        mode (str): Mode to open the file with (e.g. ``r``, ``rb``, ``w``).
+        encoding (str): Encoding used in text mode.
+
+    Returns:
+        file: The opened file object.
+    """
+    if 'b' not in mode and 't' not in mode:
+        mode = '{}t'.format(mode)
+
+    if path.endswith('.gz'):
+        return gzip.open(path, mode, encoding=encoding)
+    elif path.endswith('.bz2'):
+        return bz2.open(path, mode, encoding=encoding)
+    else:
+        return open(path, mode, encoding=encoding)
+
+
+def open_stream(stream, encoding=None):
+    """
+    Wrap the given binary stream (e.g. ``sys.stdin.buffer``)
+    to read text from it. Compressed streams (gzip or bz2) are detected
+    by their first bytes and decompressed transparently.
+
+    Args:
+        stream (file): Binary stream to read from.
+        encoding (str): Encoding of the text.
+
+    Returns:
+        file: The text file object.
+    """
+    if not hasattr(stream, 'peek'):
+        stream = io.BufferedReader(stream)
+
+    magic = stream.peek(4)[:4]
+
+    if magic.startswith(GZIP_MAGIC):
+        stream = gzip.GzipFile(fileobj=stream, mode='rb')
+    elif magic.startswith(BZ2_MAGIC) and magic[3:4].isdigit():
+        stream = bz2.BZ2File(stream, mode='rb')
+
+    return io.TextIOWrapper(stream, encoding=encoding)
+
+
+def line_ranges(path, count):
+    """
+    Split the file at the given path into at most ``count`` byte ranges
+    of about the same size. Every range starts at the beginning
+    of a line and ends after a newline (or at the end of the file),
+    so the ranges can be read independently of each other.
+
+    Args:
+        path (str): Path of an uncompressed file.
+        count (int): Number of ranges.
+
+    Returns:
+        list: Tuples ``(start, end)`` of byte offsets,
+        covering the whole file in order.
+    """
+    if count < 1:
+        raise ValueError('Number of ranges has to be at least 1')
+
+    size = os.path.getsize(path)
+    bounds = [0]
+
+    with open(path, 'rb') as f:
+        for i in range(1, count):
+            pos = max(size * i // count, bounds[-1])
+
+            if pos >= size:
+                break
+
+            # Move to the start of the next line
+            f.seek(pos - 1 if pos > 0 else 0)
+            f.readline()
+            pos = f.tell()
+
+            if bounds[-1] < pos < size:
+                bounds.append(pos)
+
+    bounds.append(size)
+
+    return [
+        (start, end)
+        for start, end in zip(bounds[:-1], bounds[1:])
+        if end > start
+    ]
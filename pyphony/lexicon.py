@@ -1,14 +1,99 @@
-from tqdm import tqdm
+import io
+import array
+import logging
+import itertools
+import collections
+import collections.abc
+
+from pyphony import files
+from pyphony import parallel
+from pyphony import progress as progress_
 
 
 IGNORE_LINES = ['#', '//']
 
+# Number of lines that are joined before writing them to a file
+WRITE_CHUNK_SIZE = 10000
+
+# Number of shards per worker, when loading a lexicon in parallel
+SHARDS_PER_WORKER = 4
+
+logger = logging.getLogger(__name__)
+
+
+class SymbolIndex:
+    """
+    Index of the symbols in the transcriptions of a lexicon.
+
+    Attributes:
+        counts (Counter): Number of occurrences per symbol.
+        words (dict): Words whose transcriptions contain a symbol,
+                      per symbol. The words of a symbol are the keys of a
+                      dictionary, in the order they were added.
+                      ``None`` until :meth:`index_words` is called,
+                      since it is much larger than ``counts``.
+    """
+
+    def __init__(self):
+        self.counts = collections.Counter()
+        self.words = None
+
+    def add(self, word, tokens):
+        """
+        Add the symbols of a transcription of the given word.
+        """
+        self.counts.update(tokens)
+
+        if self.words is not None:
+            self._add_words(word, tokens)
+
+    def index_words(self, items):
+        """
+        Create ``words`` from the given items ``(word, transcriptions)``.
+        """
+        self.words = {}
+
+        for word, transcriptions in items:
+            for tokens in transcriptions:
+                self._add_words(word, tokens)
+
+    def _add_words(self, word, tokens):
+        for t in tokens:
+            words = self.words.get(t)
+
+            if words is None:
+                words = {}
+                self.words[t] = words
+
+            words[word] = None
+
 
 class Lexicon:
+    """
+    A lexicon with the transcriptions of words.
+
+    ``entries`` is a dictionary with a list of transcriptions
+    (lists of tokens) per word. It should only be modified with
+    :meth:`add`, :meth:`add_many` and :meth:`update`, which keep the
+    duplicate checks and the symbol index up to date. After modifying
+    ``entries`` directly, :meth:`reset_index` has to be called.
+
+    Args:
+        entries (dict): Dictionary with a list of transcriptions per word.
+                        It is used as ``entries`` without copying.
+    """
+
+    # Created on first use and updated by ``add`` afterwards
+    _symbol_index = None
 
     def __init__(self, entries=None):
         self.entries = entries or {}
 
+        # Set of transcriptions (tuples) per word with multiple add-calls,
+        # to check for duplicates in constant time.
+        # Should not be modified outside of ``add``.
+        self._variant_keys = {}
+
     def get(self, word):
         """
         Return transcriptions for the given word.
@@ -29,56 +114,336 @@ class Lexicon:
             word (str): Word to add a transcription to.
             tokens (list): List of tokens.
         """
-        if word not in self.entries.keys():
-            self.entries[word] = []
+        transcriptions = self.entries.get(word)
+
+        if transcriptions is None:
+            self.entries[word] = [tokens]
+            self._index_added(word, tokens)
+            return
+
+        keys = self._variant_keys.get(word)
 
-        if tokens not in self.entries[word]:
-            self.entries[word].append(tokens)
+        if keys is None:
+            keys = {tuple(t) for t in transcriptions}
+            self._variant_keys[word] = keys
 
-    def save(self, path, word_sep=' ', token_sep=' '):
+        key = tuple(tokens)
+
+        if key not in keys:
+            keys.add(key)
+            transcriptions.append(tokens)
+            self._index_added(word, tokens)
+
+    def _index_added(self, word, tokens):
+        """
+        Update the symbol index with a transcription, that was added.
+        Has to be called by every implementation of :meth:`add`.
+        """
+        if self._symbol_index is not None:
+            self._symbol_index.add(word, tokens)
+
+    def _get_symbol_index(self, with_words=False):
+        """
+        Return the symbol index. If it doesn't exist yet,
+        it is created from all entries. The words per symbol
+        are only indexed, if ``with_words`` is ``True``.
+        """
+        index = self._symbol_index
+
+        if index is None:
+            index = SymbolIndex()
+            index.counts.update(itertools.chain.from_iterable(
+                itertools.chain.from_iterable(self.entries.values())
+            ))
+            self._symbol_index = index
+
+        if with_words and index.words is None:
+            index.index_words(self.entries.items())
+
+        return index
+
+    def reset_index(self):
+        """
+        Discard the symbol index and the duplicate checks,
+        which are recreated from ``entries`` when needed.
+        Has to be called after ``entries`` was modified directly.
+        """
+        self._symbol_index = None
+        self._variant_keys = {}
+
+    def add_many(self, entries):
+        """
+        Add all the given transcriptions (see :meth:`add`).
+
+        Args:
+            entries (iterable): Iterable of tuples ``(word, tokens)``.
+        """
+        for word, tokens in entries:
+            self.add(word, tokens)
+
+    def update(self, other):
+        """
+        Add all transcriptions of the other lexicon to this lexicon.
+        The order of words and transcriptions is kept.
+
+        Args:
+            other (Lexicon): Lexicon to add the transcriptions from.
+        """
+        for word, transcriptions in other.entries.items():
+            for tokens in transcriptions:
+                self.add(word, tokens)
+
+    def save(self, path, word_sep=' ', token_sep=' ', all_variants=False,
+             sort=True):
         """
         Save the lexicon in file at the given path.
+        The lines are written in chunks, while iterating over the entries.
 
         Args:
             path (str): Path to write to.
             word_sep (str): Separator to use between word and transcription.
             token_sep (str): Separator to use between tokens of transcription.
+            all_variants (bool): If ``True``, a line is written for every
+                                 transcription of a word. Otherwise only
+                                 the first transcription is written.
+            sort (bool): If ``True``, the words are written in sorted order.
+                         Otherwise they are written in the order
+                         of ``entries``, which avoids sorting all words.
+        """
+        if sort:
+            items = self._sorted_items()
+        else:
+            items = self.entries.items()
+
+        skipped = []
+
+        def lines():
+            for word, transcriptions in items:
+                if all_variants:
+                    for tokens in transcriptions:
+                        yield word, tokens
+                else:
+                    if len(transcriptions) > 1:
+                        skipped.append(word)
+
+                    yield word, transcriptions[0]
+
+        self.save_entries(
+            path,
+            lines(),
+            word_sep=word_sep,
+            token_sep=token_sep
+        )
+
+        if len(skipped) > 0:
+            logger.info(
+                'Ignored additional transcriptions of %d words',
+                len(skipped)
+            )
+
+    def _sorted_items(self):
         """
+        Return the items of ``entries`` sorted by word.
+        Only the words are sorted, the transcriptions are
+        looked up one after another.
+        """
+        entries = self.entries
+
+        for word in sorted(entries):
+            yield word, entries[word]
+
+    def save_mmap(self, path):
+        """
+        Save the lexicon in the binary format at the given path,
+        that can be opened with :meth:`open_mmap`.
+
+        Args:
+            path (str): Path to write to.
+        """
+        from pyphony import mmap_lexicon
+        mmap_lexicon.write(self, path)
+
+    def symbols(self):
+        """
+        Return set of occuring symbols in the lexicon.
+
+        The symbols are taken from an index, that is created
+        from all entries on the first call of :meth:`symbols`,
+        :meth:`symbol_counts` or :meth:`words_with_symbol`.
+        Afterwards it is updated with every added transcription,
+        so subsequent calls don't scan the lexicon again
+        (see :meth:`reset_index`).
+        """
+        return set(self._get_symbol_index().counts.keys())
+
+    def symbol_counts(self):
+        """
+        Return the number of occurrences of every symbol
+        in all transcriptions (see :meth:`symbols`).
+
+        Returns:
+            Counter: Number of occurrences per symbol.
+        """
+        return collections.Counter(self._get_symbol_index().counts)
+
+    def words_with_symbol(self, symbol):
+        """
+        Return the words with a transcription,
+        that contains the given symbol (see :meth:`symbols`).
+        The index of the words per symbol is only created
+        on the first call of this method.
+
+        Args:
+            symbol (str): The symbol to look for.
+
+        Returns:
+            list: The words in the order they were added to the index.
+        """
+        index = self._get_symbol_index(with_words=True)
+        return list(index.words.get(symbol, ()))
 
+    @staticmethod
+    def save_entries(path, entries, word_sep=' ', token_sep=' '):
+        """
+        Write the given entries to a file at the given path,
+        one line per entry. In contrast to :meth:`save`, the entries are
+        written in the given order as they are consumed, so arbitrary
+        large iterables can be written without holding them in memory.
+
+        Args:
+            path (str): Path to write to.
+            entries (iterable): Iterable of tuples ``(word, tokens)``.
+            word_sep (str): Separator to use between word and transcription.
+            token_sep (str): Separator to use between tokens of transcription.
+
+        Returns:
+            int: Number of written entries.
+        """
+        count = 0
         lines = []
-        sorted_entries = sorted(self.entries.items(), key=lambda x: x[0])
 
-        for word, transcriptions in sorted_entries:
-            if len(transcriptions) > 1:
-                print('Ignore additional transcriptions')
-            else:
+        with open(path, 'w', encoding='utf-8') as f:
+            for word, tokens in entries:
                 lines.append('{}{}{}'.format(
                     word,
                     word_sep,
-                    token_sep.join(transcriptions[0])
+                    token_sep.join(tokens)
                 ))
 
-        # Force newline at end of file
-        lines.append('')
+                if len(lines) >= WRITE_CHUNK_SIZE:
+                    count += Lexicon._write_lines(f, lines)
+                    lines = []
 
-        with open(path, 'w', encoding='utf-8') as f:
+            count += Lexicon._write_lines(f, lines)
+
+        return count
+
+    @staticmethod
+    def _write_lines(f, lines):
+        if len(lines) > 0:
             f.write('\n'.join(lines))
+            f.write('\n')
 
-    def symbols(self):
+        return len(lines)
+
+    @staticmethod
+    def open_mmap(path):
         """
-        Return set of occuring symbols in the lexicon.
+        Open a lexicon in the binary format (see :meth:`save_mmap`)
+        without parsing it. The returned lexicon is read-only.
+
+        Args:
+            path (str): Path of the binary lexicon.
+
+        Returns:
+            MmapLexicon: The opened lexicon.
         """
-        symbols = set()
+        from pyphony import mmap_lexicon
+        return mmap_lexicon.MmapLexicon(path)
 
-        for word, transcriptions in self.entries.items():
-            for t in transcriptions:
-                symbols.update(t)
+    @staticmethod
+    def iter_parse(lines, word_sep=' ', token_sep=' ', alphabet=None,
+                   skip_invalid_lines=False, strict=True):
+        """
+        Parse the given lines of a lexicon one after another.
+        Comments and empty lines are skipped.
 
-        return symbols
+        Args:
+            lines (iterable): Iterable of lines (str).
+            word_sep (str): Separator between the word and the tokens.
+            token_sep (str): Separator between the different tokens.
+            alphabet (Alphabet): If ``token_sep`` is the empty string,
+                                 the phone-table is used to decode the
+                                 transcription, if available.
+            skip_invalid_lines (bool): If ``True``, ignores
+                                       invalid entries.
+            strict (bool): Passed to :meth:`pyphony.Alphabet.decode`.
+
+        Returns:
+            generator: Tuples ``(word, tokens)`` in the order of the lines.
+        """
+        for l in lines:
+            line = l.strip()
+            is_comment = False
+
+            for ignore_start in IGNORE_LINES:
+                if line.startswith(ignore_start):
+                    is_comment = True
+
+            if not is_comment and line not in ['']:
+                parts = line.split(word_sep, maxsplit=1)
+
+                if len(parts) < 2:
+                    if not skip_invalid_lines:
+                        raise ValueError('Invalid line: {}'.format(line))
+                    else:
+                        logger.warning('Invalid line: %s', line)
+                else:
+                    word, transcription = parts
+
+                    if token_sep == '':
+                        tokens = alphabet.decode(
+                            transcription.strip(),
+                            strict=strict
+                        )
+                    else:
+                        tokens = transcription.strip().split(token_sep)
+
+                    yield word, tokens
+
+    @staticmethod
+    def iter_load(path, word_sep=' ', token_sep=' ', alphabet=None,
+                  skip_invalid_lines=False):
+        """
+        Read the lexicon at the given path line by line.
+        In contrast to :meth:`load`, the entries are yielded
+        as they are parsed, without building a lexicon in memory.
+
+        Args:
+            path (str): Path to the lexicon.
+            word_sep (str): Separator between the word and the tokens.
+            token_sep (str): Separator between the different tokens.
+            alphabet (Alphabet): If ``token_sep`` is the empty string,
+                                 the phone-table is used to decode the
+                                 transcription, if available.
+            skip_invalid_lines (bool): If ``True``, ignores
+                                       invalid entries.
+
+        Returns:
+            generator: Tuples ``(word, tokens)`` in the order of the file.
+        """
+        with open(path, 'r') as f:
+            yield from Lexicon.iter_parse(
+                f,
+                word_sep=word_sep,
+                token_sep=token_sep,
+                alphabet=alphabet,
+                skip_invalid_lines=skip_invalid_lines
+            )
 
     @classmethod
     def load(cls, path, word_sep=' ', token_sep=' ', alphabet=None,
-             skip_invalid_lines=False):
+             skip_invalid_lines=False, progress=None, workers=None):
         """
         Load a lexicon from the given path.
 
@@ -91,6 +456,18 @@ class Lexicon:
                                  transcription, if available.
             skip_invalid_lines (bool): If ``True``, ignores
                                        invalid entries.
+            progress (Progress): Hook to report the number of loaded
+                                 entries (see
+                                 :func:`pyphony.progress.resolve`).
+                                 By default nothing is reported.
+            workers (int): If greater than 1, the file is split into
+                           shards of lines, that are parsed in a pool of
+                           ``workers`` processes. The result is the same
+                           as with a single process.
+
+        If an ``alphabet`` is used, enable its decode cache
+        (:meth:`pyphony.Alphabet.set_cache_size`) to decode repeated
+        transcriptions only once.
 
         Returns:
             Lexicon: A parsed lexicon.
@@ -98,32 +475,242 @@ class Lexicon:
         """
 
         lex = cls()
+        progress = progress_.resolve(progress)
+
+        if workers is not None and workers > 1:
+            ranges = files.line_ranges(path, workers * SHARDS_PER_WORKER)
+            tasks = (
+                (path, start, end, word_sep, token_sep, skip_invalid_lines)
+                for start, end in ranges
+            )
+            results = parallel.imap_ordered(
+                _load_shard,
+                tasks,
+                workers,
+                initializer=_init_load_worker,
+                initargs=(alphabet,)
+            )
+            results = progress(
+                results,
+                desc='Load lexicon',
+                weight=lambda r: r[1]
+            )
+
+            # The shards are merged in the order of the file,
+            # so words and transcriptions keep their order
+            for entries, _, shard_stats in results:
+                lex.update(Lexicon(entries))
+
+                if shard_stats is not None:
+                    alphabet.stats.merge(shard_stats)
+        else:
+            entries = cls.iter_load(
+                path,
+                word_sep=word_sep,
+                token_sep=token_sep,
+                alphabet=alphabet,
+                skip_invalid_lines=skip_invalid_lines
+            )
+
+            lex.add_many(progress(entries, desc='Load lexicon'))
 
-        with open(path, 'r') as f:
-            for l in tqdm(f.readlines(), desc='Load lexicon'):
-                line = l.strip()
-                is_comment = False
-
-                for ignore_start in IGNORE_LINES:
-                    if line.startswith(ignore_start):
-                        is_comment = True
-
-                if not is_comment and line not in ['']:
-                    parts = line.split(word_sep, maxsplit=1)
-
-                    if len(parts) < 2:
-                        if not skip_invalid_lines:
-                            raise ValueError('Invalid line: {}'.format(line))
-                        else:
-                            print('Invalid line: {}'.format(line))
-                    else:
-                        word, transcription = parts
+        return lex
 
-                        if token_sep == '':
-                            tokens = alphabet.decode(transcription.strip())
-                        else:
-                            tokens = transcription.strip().split(token_sep)
 
-                        lex.add(word, tokens)
+class CompactLexicon(Lexicon):
+    """
+    A lexicon that stores the transcriptions in a compact form.
+    Every symbol is mapped to an integer id. The ids of all transcriptions
+    are stored in a single flat array, with an offset table pointing
+    to the start of every transcription. This avoids the overhead of a
+    python list and string per transcription and token.
 
-        return lex
+    The API is the same as :class:`Lexicon`. ``entries`` is a read-only
+    mapping, that creates the lists of tokens on access.
+    Modifications have to be done with :meth:`add`.
+
+    Args:
+        entries (dict): Dictionary with a list of transcriptions per word
+                        to add initially.
+    """
+
+    def __init__(self, entries=None):
+        self.entries = CompactEntries(self)
+
+        self._symbol_ids = {}
+        self._id_symbols = []
+
+        # The tokens of variant ``i`` are
+        # ``_tokens[_offsets[i]:_offsets[i + 1]]``.
+        self._tokens = array.array('H')
+        self._offsets = array.array('Q', [0])
+
+        # The first variant of every word and the next variant
+        # of the same word for every variant (-1 if there is none).
+        self._first_variant = {}
+        self._next_variant = array.array('q')
+
+        for word, transcriptions in (entries or {}).items():
+            for tokens in transcriptions:
+                self.add(word, tokens)
+
+    def get(self, word):
+        """
+        Return transcriptions for the given word.
+
+        Args:
+            word (str): Word to get possible transcriptions.
+
+        Returns:
+            list: List of lists with tokens.
+        """
+        id_symbols = self._id_symbols
+
+        return [
+            [id_symbols[x] for x in self._variant_ids(v)]
+            for v in self._variants(self._first_variant[word])
+        ]
+
+    def add(self, word, tokens):
+        """
+        Add a transcription for the given word.
+
+        Args:
+            word (str): Word to add a transcription to.
+            tokens (list): List of tokens.
+        """
+        ids = self._encode(tokens)
+        first = self._first_variant.get(word)
+        last = -1
+
+        if first is not None:
+            for v in self._variants(first):
+                if self._variant_ids(v) == ids:
+                    return
+
+                last = v
+
+        variant = len(self._next_variant)
+        self._tokens.extend(ids)
+        self._offsets.append(len(self._tokens))
+        self._next_variant.append(-1)
+
+        if first is None:
+            self._first_variant[word] = variant
+        else:
+            self._next_variant[last] = variant
+
+        self._index_added(word, tokens)
+
+    def symbols(self):
+        """
+        Return set of occuring symbols in the lexicon.
+        """
+        return set(self._id_symbols)
+
+    def _encode(self, tokens):
+        ids = array.array(self._tokens.typecode)
+
+        for t in tokens:
+            symbol_id = self._symbol_ids.get(t)
+
+            if symbol_id is None:
+                symbol_id = len(self._id_symbols)
+
+                if symbol_id > 0xFFFF and self._tokens.typecode == 'H':
+                    # More symbols than fit into 16 bits
+                    self._tokens = array.array('L', self._tokens)
+                    ids = array.array('L', ids)
+
+                self._symbol_ids[t] = symbol_id
+                self._id_symbols.append(t)
+
+            ids.append(symbol_id)
+
+        return ids
+
+    def _variants(self, first):
+        v = first
+
+        while v >= 0:
+            yield v
+            v = self._next_variant[v]
+
+    def _variant_ids(self, variant):
+        offsets = self._offsets
+        return self._tokens[offsets[variant]:offsets[variant + 1]]
+
+
+class CompactEntries(collections.abc.Mapping):
+    """
+    Read-only mapping of the words of a :class:`CompactLexicon`
+    to their transcriptions.
+    """
+
+    def __init__(self, lexicon):
+        self.lexicon = lexicon
+
+    def __getitem__(self, word):
+        return self.lexicon.get(word)
+
+    def __iter__(self):
+        return iter(self.lexicon._first_variant)
+
+    def __len__(self):
+        return len(self.lexicon._first_variant)
+
+    def __contains__(self, word):
+        return word in self.lexicon._first_variant
+
+
+_worker_alphabet = None
+
+
+def _init_load_worker(alphabet):
+    """
+    Initialize a worker process of :meth:`Lexicon.load`.
+    The alphabet is passed once per process instead of once per shard.
+    """
+    global _worker_alphabet
+    _worker_alphabet = alphabet
+
+    # Only the counts of the worker are sent back to the parent
+    if alphabet is not None and alphabet.stats is not None:
+        alphabet.stats.reset()
+
+
+def _load_shard(task):
+    """
+    Parse the lines of a byte range of a lexicon file in a worker process.
+    Return the entries of the range, the number of parsed entries and
+    the stats of the range, if the alphabet has stats.
+    """
+    path, start, end, word_sep, token_sep, skip_invalid_lines = task
+    alphabet = _worker_alphabet
+
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    # Decode like ``open(path, 'r')`` does
+    lines = io.TextIOWrapper(io.BytesIO(data))
+    entries = Lexicon.iter_parse(
+        lines,
+        word_sep=word_sep,
+        token_sep=token_sep,
+        alphabet=alphabet,
+        skip_invalid_lines=skip_invalid_lines
+    )
+    lex = Lexicon()
+    count = 0
+
+    for word, tokens in entries:
+        lex.add(word, tokens)
+        count += 1
+
+    stats = None
+
+    if alphabet is not None and alphabet.stats is not None:
+        stats = alphabet.stats.pop()
+
+    return lex.entries, count, stats
@@ -0,0 +1,321 @@
+"""
+Binary lexicon format, that can be opened with ``mmap``.
+
+The file consists of a header followed by these sections
+(every section starts at a multiple of 8 bytes):
+
+* ``symbols``: JSON list of all symbols (utf-8), the id of a
+  symbol is its index in the list.
+* ``word_offsets``: uint64 per word plus one, the start of every word
+  in ``words``.
+* ``word_variants``: uint64 per word plus one, the first variant of every
+  word. The variants of word ``i`` are
+  ``word_variants[i]`` to ``word_variants[i + 1] - 1``.
+* ``variant_offsets``: uint64 per variant plus one, the start of every
+  variant in ``tokens``.
+* ``tokens``: uint32 symbol id per token of all variants.
+* ``words``: utf-8 encoded words, sorted by their encoded bytes.
+
+Integers are stored in the byte order of the machine writing the file.
+"""
+import sys
+import json
+import mmap
+import array
+import struct
+import collections.abc
+
+from pyphony.lexicon import Lexicon, CompactLexicon
+
+
+MAGIC = b'PYPHLEX1'
+
+# magic, byteorder, n_words, n_variants, n_tokens, symbols size, words size
+HEADER = struct.Struct('=8s8sQQQQQ')
+
+
+def write(lexicon, path):
+    """
+    Write the given lexicon to a binary file at the given path,
+    that can be opened with :meth:`pyphony.Lexicon.open_mmap`.
+
+    Args:
+        lexicon (Lexicon): The lexicon to write.
+        path (str): Path to write to.
+    """
+    words = sorted(w.encode('utf-8') for w in lexicon.entries.keys())
+
+    symbol_ids = {}
+    word_offsets = array.array('Q', [0])
+    word_variants = array.array('Q', [0])
+    variant_offsets = array.array('Q', [0])
+    tokens = array.array('I')
+    words_blob = bytearray()
+
+    for word in words:
+        words_blob.extend(word)
+        word_offsets.append(len(words_blob))
+
+        for transcription in lexicon.get(word.decode('utf-8')):
+            for t in transcription:
+                symbol_id = symbol_ids.get(t)
+
+                if symbol_id is None:
+                    symbol_id = len(symbol_ids)
+                    symbol_ids[t] = symbol_id
+
+                tokens.append(symbol_id)
+
+            variant_offsets.append(len(tokens))
+
+        word_variants.append(len(variant_offsets) - 1)
+
+    symbols = json.dumps(list(symbol_ids.keys()), ensure_ascii=False)
+    symbols = symbols.encode('utf-8')
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(
+            MAGIC,
+            sys.byteorder.encode('ascii'),
+            len(words),
+            len(variant_offsets) - 1,
+            len(tokens),
+            len(symbols),
+            len(words_blob)
+        ))
+
+        for section in [symbols, word_offsets, word_variants,
+                        variant_offsets, tokens, words_blob]:
+            _pad(f)
+            f.write(section)
+
+
+def convert_text(in_path, out_path, word_sep=' ', token_sep=' ',
+                 alphabet=None, skip_invalid_lines=False):
+    """
+    Convert a lexicon in the text format (see :meth:`Lexicon.load`)
+    to the binary format.
+
+    Args:
+        in_path (str): Path to the text lexicon.
+        out_path (str): Path to write the binary lexicon to.
+        word_sep (str): Separator between the word and the tokens.
+        token_sep (str): Separator between the different tokens.
+        alphabet (Alphabet): If ``token_sep`` is the empty string,
+                             the phone-table is used to decode the
+                             transcription, if available.
+        skip_invalid_lines (bool): If ``True``, ignores
+                                   invalid entries.
+    """
+    lex = CompactLexicon.load(
+        in_path,
+        word_sep=word_sep,
+        token_sep=token_sep,
+        alphabet=alphabet,
+        skip_invalid_lines=skip_invalid_lines
+    )
+    write(lex, out_path)
+
+
+def _pad(f):
+    rest = f.tell() % 8
+
+    if rest > 0:
+        f.write(b'\0' * (8 - rest))
+
+
+class MmapLexicon(Lexicon):
+    """
+    A read-only lexicon, that is backed by a memory-mapped binary file
+    (see :func:`write`). Opening is independent of the size of the lexicon,
+    since nothing is parsed upfront. Words are looked up with a binary
+    search on the sorted words. The pages of the file are shared between
+    all processes that open it (e.g. forked workers).
+
+    ``entries`` is a read-only mapping, iterating over the words
+    in sorted order.
+
+    Args:
+        path (str): Path of the binary lexicon.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = MmapEntries(self)
+
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._views = []
+
+        try:
+            self._load()
+        except Exception:
+            self.close()
+            raise
+
+    def _load(self):
+        magic, byteorder, n_words, n_variants, n_tokens, symbols_size, \
+            words_size = HEADER.unpack_from(self._mmap, 0)
+
+        if magic != MAGIC:
+            raise ValueError('{} is no binary lexicon'.format(self.path))
+
+        if byteorder.rstrip(b'\0').decode('ascii') != sys.byteorder:
+            raise ValueError(
+                '{} was written with a different byteorder'.format(self.path)
+            )
+
+        self._offset = HEADER.size
+        symbols = self._section(symbols_size)
+        self.symbol_list = json.loads(bytes(symbols).decode('utf-8'))
+
+        self._word_offsets = self._section(8 * (n_words + 1), 'Q')
+        self._word_variants = self._section(8 * (n_words + 1), 'Q')
+        self._variant_offsets = self._section(8 * (n_variants + 1), 'Q')
+        self._tokens = self._section(4 * n_tokens, 'I')
+        self._words = self._section(words_size)
+        self._size = n_words
+
+    def _section(self, size, fmt=None):
+        start = self._offset + (-self._offset % 8)
+        self._offset = start + size
+
+        view = memoryview(self._mmap)[start:start + size]
+        self._views.append(view)
+
+        if fmt is not None:
+            view = view.cast(fmt)
+            self._views.append(view)
+
+        return view
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Close the underlying file.
+        """
+        for view in reversed(self._views):
+            view.release()
+
+        self._views = []
+        self._mmap.close()
+
+    def get(self, word):
+        """
+        Return transcriptions for the given word.
+
+        Args:
+            word (str): Word to get possible transcriptions.
+
+        Returns:
+            list: List of lists with tokens.
+        """
+        index = self._find(word.encode('utf-8'))
+
+        if index is None:
+            raise KeyError(word)
+
+        return self._transcriptions(index)
+
+    def add(self, word, tokens):
+        """
+        Not supported, since the lexicon is read-only.
+        This also applies to :meth:`add_many` and :meth:`update`.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError('A memory-mapped lexicon is read-only')
+
+    def symbols(self):
+        """
+        Return set of occuring symbols in the lexicon.
+        """
+        return set(self.symbol_list)
+
+    def _sorted_items(self):
+        # The utf-8 byte order is the same as the order of the code points
+        return self.entries.items()
+
+    def _word(self, index):
+        offsets = self._word_offsets
+        return bytes(self._words[offsets[index]:offsets[index + 1]])
+
+    def _find(self, word):
+        low = 0
+        high = self._size
+
+        while low < high:
+            mid = (low + high) // 2
+            current = self._word(mid)
+
+            if current < word:
+                low = mid + 1
+            elif current > word:
+                high = mid
+            else:
+                return mid
+
+        return None
+
+    def _transcriptions(self, index):
+        symbols = self.symbol_list
+        offsets = self._variant_offsets
+        tokens = self._tokens
+        transcriptions = []
+
+        for v in range(self._word_variants[index],
+                       self._word_variants[index + 1]):
+            transcriptions.append([
+                symbols[x] for x in tokens[offsets[v]:offsets[v + 1]]
+            ])
+
+        return transcriptions
+
+
+class MmapEntries(collections.abc.Mapping):
+    """
+    Read-only mapping of the words of a :class:`MmapLexicon`
+    to their transcriptions.
+    """
+
+    def __init__(self, lexicon):
+        self.lexicon = lexicon
+
+    def __getitem__(self, word):
+        return self.lexicon.get(word)
+
+    def __iter__(self):
+        for i in range(self.lexicon._size):
+            yield self.lexicon._word(i).decode('utf-8')
+
+    def __len__(self):
+        return self.lexicon._size
+
+    def __contains__(self, word):
+        return self.lexicon._find(word.encode('utf-8')) is not None
+
+    def items(self):
+        return MmapItems(self)
+
+
+class MmapItems(collections.abc.ItemsView):
+    """
+    Items of :class:`MmapEntries`, iterating over the words
+    without looking them up.
+    """
+
+    def __iter__(self):
+        lexicon = self._mapping.lexicon
+
+        for i in range(lexicon._size):
+            yield (
+                lexicon._word(i).decode('utf-8'),
+                lexicon._transcriptions(i)
+            )
@@ -0,0 +1,83 @@
+"""
+Helpers to distribute work across a pool of processes.
+"""
+import collections
+import itertools
+import concurrent.futures
+
+
+def chunked(iterable, size):
+    """
+    Split the given iterable into lists of at most ``size`` items.
+
+    Args:
+        iterable (iterable): Items to split.
+        size (int): Maximum number of items per chunk.
+
+    Returns:
+        generator: Lists of items.
+    """
+    if size < 1:
+        raise ValueError('Chunk size has to be at least 1')
+
+    it = iter(iterable)
+
+    while True:
+        chunk = list(itertools.islice(it, size))
+
+        if len(chunk) <= 0:
+            return
+
+        yield chunk
+
+
+def imap_ordered(fn, iterable, workers, initializer=None, initargs=(),
+                 max_pending=None):
+    """
+    Apply ``fn`` to every item of ``iterable`` in a pool of
+    ``workers`` processes and yield the results in the order of the input.
+
+    In contrast to ``Executor.map`` the input is consumed lazily,
+    so at most ``max_pending`` items are submitted at the same time.
+    This allows to process arbitrary long iterables with constant memory.
+
+    Args:
+        fn (callable): Picklable function to apply.
+        iterable (iterable): Picklable items to process.
+        workers (int): Number of processes.
+        initializer (callable): Called with ``initargs`` once
+                                in every worker process.
+        initargs (tuple): Arguments for the ``initializer``.
+        max_pending (int): Maximum number of submitted items,
+                           whose results were not yet yielded.
+                           Defaults to ``2 * workers``.
+
+    Returns:
+        generator: The results of ``fn`` for every item.
+    """
+    max_pending = max_pending or 2 * workers
+    pending = collections.deque()
+    items = iter(iterable)
+
+    executor = concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=initializer,
+        initargs=initargs
+    )
+
+    try:
+        for item in itertools.islice(items, max_pending):
+            pending.append(executor.submit(fn, item))
+
+        while len(pending) > 0:
+            result = pending.popleft().result()
+
+            for item in itertools.islice(items, 1):
+                pending.append(executor.submit(fn, item))
+
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+        executor.shutdown(wait=True)
@@ -1,10 +1,12 @@
 import string
 import re
+import logging
 import xml.etree.ElementTree as ET
 
-from tqdm import tqdm
-
 import pyphony
+from pyphony import files
+from pyphony import parallel
+from pyphony import progress as progress_
 
 
 DE_IPA_PATTERN = re.compile(r'\{\{IPA\}\} \{\{Lautschrift\|(.*?)\}\}')
@@ -12,6 +14,8 @@ DE_TITLE_PATTERN = re.compile(r'== (.*?) \(\{\{Sprache\|(.*?)\}\}\) ==')
 DE_WORD_CHARS = list(string.ascii_lowercase)
 DE_WORD_CHARS.extend(['ö', 'ü', 'ä'])
 
+logger = logging.getLogger(__name__)
+
 
 class WiktionaryParser:
 
@@ -23,38 +27,133 @@ class WiktionaryParser:
         self.ipa_pattern = ipa_pattern
         self.title_lang_pattern = title_lang_pattern
 
-    def parse_xml_dump(self, path):
-        tree = ET.parse(path)
-        root = tree.getroot()
+    def parse_xml_dump(self, path, workers=None, chunksize=1000,
+                       progress=None):
+        """
+        Parse the pronunciations of all pages of the given xml dump.
+        The dump is parsed page by page, so the memory usage doesn't
+        depend on the size of the dump.
+
+        Args:
+            path (str): Path to the dump.
+                        If it ends with ``.bz2`` it is decompressed
+                        while reading.
+            workers (int): If greater than 1, the pages are parsed
+                           in chunks in a pool of ``workers`` processes.
+                           The result is the same as with a single process.
+            chunksize (int): Number of pages per chunk,
+                             if ``workers`` is used.
+            progress (Progress): Hook to report the number of found
+                                 pronunciations
+                                 (see :func:`pyphony.progress.resolve`).
+                                 By default nothing is reported.
+
+        Returns:
+            Lexicon: Lexicon with the found pronunciations.
+        """
+        lex = pyphony.Lexicon()
+        count = 0
+        progress = progress_.resolve(progress)
+        pages = self.iter_page_texts(path)
+
+        if workers is not None and workers > 1:
+            results = parallel.imap_ordered(
+                _parse_chunk,
+                parallel.chunked(pages, chunksize),
+                workers,
+                initializer=_init_worker,
+                initargs=(self,)
+            )
+        else:
+            results = (
+                self.parse_entries(title, text)
+                for title, text in pages
+            )
 
-        print('Get all pages')
-        pages = root.findall('./mn:page', self.ns)
+        results = progress(results, desc='Parse pages', weight=len)
 
-        print('Parse pages')
-        result = []
+        for entries in results:
+            for word, transcription in entries:
+                lex.add(word, [transcription])
+                count += 1
 
-        for page in tqdm(pages, total=len(pages)):
-            res = self.parse_page(page)
+        logger.info('Found %d pronunciations', count)
 
-            if res is not None:
-                result.append(res)
+        return lex
+
+    def iter_pages(self, path):
+        """
+        Iterate over all ``<page>`` elements of the given xml dump.
+        Every page is yielded as soon as it is parsed completely
+        and cleared afterwards.
+
+        Args:
+            path (str): Path to the dump.
+                        If it ends with ``.bz2`` it is decompressed
+                        while reading.
+
+        Returns:
+            generator: ``<page>`` elements
+                       (``xml.etree.ElementTree.Element``).
+        """
+        page_tag = '{{{}}}page'.format(self.ns['mn'])
+
+        with files.open_file(path, 'rb') as f:
+            context = ET.iterparse(f, events=('start', 'end'))
+            _, root = next(context)
+
+            for event, elem in context:
+                if event == 'end' and elem.tag == page_tag:
+                    yield elem
+
+                    # Drop processed pages, so they don't pile up in memory
+                    elem.clear()
+                    root.clear()
+
+    def iter_page_texts(self, path):
+        """
+        Iterate over the title and the text of all pages
+        of the given xml dump (see :meth:`iter_pages`).
+
+        Returns:
+            generator: Tuples ``(title, text)``.
+        """
+        for page in self.iter_pages(path):
+            yield (
+                page.find('mn:title', self.ns).text,
+                page.find('mn:revision/mn:text', self.ns).text
+            )
 
-        print('Filter results')
-        result = self.filter_entries(result)
-        print('Found {} pronunciations'.format(len(result)))
+    def parse_entries(self, title, text):
+        """
+        Parse and filter the pronunciations of a single page.
 
-        print('Create lexicon')
-        lex = pyphony.Lexicon()
+        Args:
+            title (str): The title of the page.
+            text (str): The wikitext of the page.
 
-        for word, transcription in result:
-            lex.add(word, [transcription])
+        Returns:
+            list: List of tuples ``(word, transcription)``.
+        """
+        res = self.parse_page_text(title, text)
 
-        return lex
+        if res is not None:
+            filtered = self.filter_entry(res[0], res[1], res[2])
+
+            if filtered is not None:
+                return filtered
+
+        return []
 
     def parse_page(self, page):
-        title = page.find('mn:title', self.ns).text.lower().strip()
+        title = page.find('mn:title', self.ns).text
         text = page.find('mn:revision/mn:text', self.ns).text
 
+        return self.parse_page_text(title, text)
+
+    def parse_page_text(self, title, text):
+        title = title.lower().strip()
+
         if text is None or title is None:
             return
 
@@ -94,10 +193,11 @@ class WiktionaryParser:
 
         return title, lang, pronunciation
 
-    def filter_entries(self, entries):
+    def filter_entries(self, entries, progress=None):
         result = []
+        progress = progress_.resolve(progress)
 
-        for entry in tqdm(entries):
+        for entry in progress(entries, desc='Filter entries'):
             res = self.filter_entry(
                 entry[0],
                 entry[1],
@@ -147,3 +247,27 @@ class DeWiktionaryParser(WiktionaryParser):
             DE_IPA_PATTERN,
             DE_TITLE_PATTERN
         )
+
+
+_worker_parser = None
+
+
+def _init_worker(parser):
+    """
+    Initialize a worker process of :meth:`WiktionaryParser.parse_xml_dump`.
+    """
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _parse_chunk(pages):
+    """
+    Parse a chunk of pages ``(title, text)`` in a worker process.
+    Return the found pronunciations of all pages.
+    """
+    entries = []
+
+    for title, text in pages:
+        entries.extend(_worker_parser.parse_entries(title, text))
+
+    return entries
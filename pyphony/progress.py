@@ -0,0 +1,169 @@
+"""
+Hooks to report the progress of long running loops
+(e.g. loading or converting a lexicon).
+
+Functions with a ``progress`` argument pass their main loop through
+:func:`resolve`. By default (``None``) nothing is reported and
+the loop runs without any overhead.
+"""
+import time
+import logging
+import collections
+
+
+ProgressInfo = collections.namedtuple(
+    'ProgressInfo',
+    ['desc', 'count', 'total', 'elapsed', 'rate', 'done']
+)
+
+
+class Progress:
+    """
+    Base class of the progress hooks, that doesn't report anything.
+
+    A hook is called with the iterable of a loop and returns
+    an iterable with the same items, that reports the progress
+    while it is consumed.
+    """
+
+    def __call__(self, iterable, desc=None, total=None, weight=None):
+        """
+        Wrap the given iterable.
+
+        Args:
+            iterable (iterable): Items of the loop.
+            desc (str): Description of the loop.
+            total (int): Expected number of units, if known.
+            weight (callable): Function returning the number of units
+                               an item counts as (e.g. the size of a chunk).
+                               By default every item is one unit.
+
+        Returns:
+            iterable: The items of ``iterable``.
+        """
+        return iterable
+
+
+class CallbackProgress(Progress):
+    """
+    Counts the units of the loop and calls ``callback`` with a
+    :class:`ProgressInfo` at most every ``interval`` seconds
+    and once the loop is finished.
+
+    Args:
+        callback (callable): Function called with a :class:`ProgressInfo`.
+        interval (float): Minimum number of seconds between two calls
+                          of ``callback`` during the loop.
+    """
+
+    def __init__(self, callback, interval=1.0):
+        self.callback = callback
+        self.interval = interval
+
+    def __call__(self, iterable, desc=None, total=None, weight=None):
+        start = time.perf_counter()
+        next_report = start + self.interval
+        count = 0
+
+        for item in iterable:
+            yield item
+
+            if weight is None:
+                count += 1
+            else:
+                count += weight(item)
+
+            now = time.perf_counter()
+
+            if now >= next_report:
+                next_report = now + self.interval
+                self._report(desc, count, total, now - start, False)
+
+        self._report(desc, count, total, time.perf_counter() - start, True)
+
+    def _report(self, desc, count, total, elapsed, done):
+        rate = count / elapsed if elapsed > 0 else 0.0
+        self.callback(ProgressInfo(desc, count, total, elapsed, rate, done))
+
+
+class LoggingProgress(CallbackProgress):
+    """
+    Logs the progress with the given logger
+    at most every ``interval`` seconds.
+
+    Args:
+        logger (logging.Logger): Logger to use.
+                                 By default the logger of this module.
+        level (int): Level of the messages.
+        interval (float): Minimum number of seconds between two messages
+                          during the loop.
+    """
+
+    def __init__(self, logger=None, level=logging.INFO, interval=10.0):
+        super(LoggingProgress, self).__init__(self._log, interval=interval)
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def _log(self, info):
+        if info.total is None:
+            count = '{}'.format(info.count)
+        else:
+            count = '{}/{}'.format(info.count, info.total)
+
+        self.logger.log(
+            self.level,
+            '%s: %s in %.1fs (%.1f/s)%s',
+            info.desc or 'Progress',
+            count,
+            info.elapsed,
+            info.rate,
+            ' done' if info.done else ''
+        )
+
+
+class TqdmProgress(Progress):
+    """
+    Shows a progress bar on the terminal with ``tqdm``.
+
+    Args:
+        kwargs: Additional arguments passed to ``tqdm``.
+    """
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def __call__(self, iterable, desc=None, total=None, weight=None):
+        from tqdm import tqdm
+
+        if weight is None:
+            yield from tqdm(iterable, desc=desc, total=total, **self.kwargs)
+        else:
+            with tqdm(desc=desc, total=total, **self.kwargs) as bar:
+                for item in iterable:
+                    yield item
+                    bar.update(weight(item))
+
+
+NO_PROGRESS = Progress()
+
+
+def resolve(progress):
+    """
+    Return the hook for the given ``progress`` argument.
+
+    Args:
+        progress (Progress, bool): ``None`` or ``False`` disables reporting,
+                                   ``True`` shows a progress bar
+                                   (:class:`TqdmProgress`).
+                                   A :class:`Progress` or any callable with
+                                   the same signature is used as is.
+
+    Returns:
+        Progress: The hook.
+    """
+    if progress is None or progress is False:
+        return NO_PROGRESS
+    elif progress is True:
+        return TqdmProgress()
+    else:
+        return progress
@@ -1,4 +1,10 @@
 import os
+import json
+import threading
+
+
+_registry = {}
+_registry_lock = threading.Lock()
 
 
 def get_resource_path(sub_path_components):
@@ -16,3 +22,53 @@ def get_resource_path(sub_path_components):
     )
 
     return os.path.abspath(path)
+
+
+def clear_registry():
+    """
+    Remove all resources that were loaded with :func:`load_cached`
+    from memory.
+    """
+    with _registry_lock:
+        _registry.clear()
+
+
+def load_json(path):
+    """
+    Load the json file at the given path.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def load_cached(path, loader, build=None):
+    """
+    Load the resource at the given path with ``loader(path)``.
+    The resource is only loaded once per process,
+    subsequent calls return the same object.
+
+    Args:
+        path (str): Path of the resource file.
+        loader (callable): Function that loads the data
+                           from the given path.
+        build (callable): Function that creates the resource
+                          from the loaded data. If ``None``,
+                          the data itself is returned.
+
+    Returns:
+        object: The loaded resource.
+    """
+    key = (path, loader, build)
+
+    with _registry_lock:
+        if key in _registry:
+            return _registry[key]
+
+        obj = loader(path)
+
+        if build is not None:
+            obj = build(obj)
+
+        _registry[key] = obj
+
+        return obj
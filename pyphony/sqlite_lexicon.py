@@ -0,0 +1,266 @@
+"""
+Lexicon stored in a sqlite database, for lexica that don't fit into memory.
+
+Every transcription is a row of the table ``transcriptions`` with the
+columns ``word`` and ``tokens`` (JSON list of the tokens). The rowid keeps
+the order in which the transcriptions of a word were added.
+"""
+import json
+import sqlite3
+import itertools
+import threading
+import collections.abc
+
+from pyphony.lexicon import Lexicon
+
+
+# Number of rows inserted with a single statement in bulk inserts
+INSERT_CHUNK_SIZE = 10000
+
+# Number of rows fetched at once when streaming query results
+FETCH_CHUNK_SIZE = 1000
+
+SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS transcriptions '
+    '(word TEXT NOT NULL, tokens TEXT NOT NULL, UNIQUE (word, tokens))',
+    # Contains the rowid implicitly, so it also provides
+    # the order of the transcriptions of a word
+    'CREATE INDEX IF NOT EXISTS transcriptions_word '
+    'ON transcriptions (word)',
+]
+
+
+class SqliteLexicon(Lexicon):
+    """
+    A lexicon, that stores the transcriptions in a sqlite database
+    instead of memory. Words are looked up with an index.
+
+    ``entries`` is a read-only mapping, iterating over the words in sorted
+    order. Its items are streamed from the database, so saving or
+    converting the lexicon doesn't load it into memory.
+
+    Added transcriptions are visible immediately, but only written
+    to the file with :meth:`commit` or :meth:`close`.
+    :meth:`add_many` and :meth:`update` commit pending transcriptions
+    first and insert all transcriptions in a single transaction.
+
+    The lexicon can be used from multiple threads (e.g. with
+    :class:`pyphony.aio.AsyncLexiconService`), all access to the
+    database is serialized with a lock.
+
+    Args:
+        path (str): Path of the database file.
+                    If empty (default), a temporary database is created,
+                    which is deleted when it is closed.
+    """
+
+    def __init__(self, path=''):
+        self.path = path
+        self.entries = SqliteEntries(self)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+
+        with self._db:
+            for statement in SCHEMA:
+                self._db.execute(statement)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def commit(self):
+        """
+        Write all added transcriptions to the database file.
+        """
+        with self._lock:
+            self._db.commit()
+
+    def close(self):
+        """
+        Commit and close the database.
+        """
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+    def _fetch_all(self, sql, params=()):
+        """
+        Execute the query and return all rows.
+        """
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def _iter_rows(self, sql, params=()):
+        """
+        Execute the query and stream the rows. The lock is only held
+        while fetching, so other threads aren't blocked by the consumer.
+        """
+        with self._lock:
+            cursor = self._db.execute(sql, params)
+
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(FETCH_CHUNK_SIZE)
+
+            if len(rows) <= 0:
+                break
+
+            yield from rows
+
+    def get(self, word):
+        """
+        Return transcriptions for the given word.
+
+        Args:
+            word (str): Word to get possible transcriptions.
+
+        Returns:
+            list: List of lists with tokens.
+        """
+        rows = self._fetch_all(
+            'SELECT tokens FROM transcriptions WHERE word = ? ORDER BY rowid',
+            (word,)
+        )
+
+        if len(rows) <= 0:
+            raise KeyError(word)
+
+        return [json.loads(r[0]) for r in rows]
+
+    def add(self, word, tokens):
+        """
+        Add a transcription for the given word.
+
+        Args:
+            word (str): Word to add a transcription to.
+            tokens (list): List of tokens.
+        """
+        with self._lock:
+            cursor = self._db.execute(
+                'INSERT OR IGNORE INTO transcriptions (word, tokens) '
+                'VALUES (?, ?)',
+                (word, _encode(tokens))
+            )
+            inserted = cursor.rowcount > 0
+
+        if inserted:
+            self._index_added(word, tokens)
+
+    def add_many(self, entries):
+        """
+        Add all the given transcriptions (see :meth:`add`)
+        in a single transaction. Transcriptions added before
+        are committed first, so they are kept if the transaction fails.
+
+        Args:
+            entries (iterable): Iterable of tuples ``(word, tokens)``.
+        """
+        rows = ((word, _encode(tokens)) for word, tokens in entries)
+
+        # Recreated on the next use, instead of checking
+        # which of the rows were actually inserted
+        self._symbol_index = None
+
+        with self._lock:
+            self._db.commit()
+
+            with self._db:
+                while True:
+                    chunk = list(itertools.islice(rows, INSERT_CHUNK_SIZE))
+
+                    if len(chunk) <= 0:
+                        break
+
+                    self._db.executemany(
+                        'INSERT OR IGNORE INTO transcriptions (word, tokens) '
+                        'VALUES (?, ?)',
+                        chunk
+                    )
+
+    def update(self, other):
+        """
+        Add all transcriptions of the other lexicon to this lexicon
+        in a single transaction.
+
+        Args:
+            other (Lexicon): Lexicon to add the transcriptions from.
+        """
+        self.add_many(
+            (word, tokens)
+            for word, transcriptions in other.entries.items()
+            for tokens in transcriptions
+        )
+
+    def symbols(self):
+        """
+        Return set of occuring symbols in the lexicon.
+
+        In contrast to :meth:`pyphony.Lexicon.symbols`, the symbols are
+        queried from the database, without keeping an index in memory.
+        """
+        symbols = set()
+
+        for row in self._iter_rows('SELECT DISTINCT tokens '
+                                   'FROM transcriptions'):
+            symbols.update(json.loads(row[0]))
+
+        return symbols
+
+    def _sorted_items(self):
+        return self.entries.items()
+
+
+def _encode(tokens):
+    return json.dumps(list(tokens), ensure_ascii=False)
+
+
+class SqliteEntries(collections.abc.Mapping):
+    """
+    Read-only mapping of the words of a :class:`SqliteLexicon`
+    to their transcriptions.
+    """
+
+    def __init__(self, lexicon):
+        self.lexicon = lexicon
+
+    def __getitem__(self, word):
+        return self.lexicon.get(word)
+
+    def __iter__(self):
+        rows = self.lexicon._iter_rows(
+            'SELECT DISTINCT word FROM transcriptions ORDER BY word'
+        )
+
+        for row in rows:
+            yield row[0]
+
+    def __len__(self):
+        return self.lexicon._fetch_all(
+            'SELECT COUNT(DISTINCT word) FROM transcriptions'
+        )[0][0]
+
+    def __contains__(self, word):
+        return len(self.lexicon._fetch_all(
+            'SELECT 1 FROM transcriptions WHERE word = ? LIMIT 1',
+            (word,)
+        )) > 0
+
+    def items(self):
+        return SqliteItems(self)
+
+
+class SqliteItems(collections.abc.ItemsView):
+    """
+    Items of :class:`SqliteEntries`, streamed from the database
+    in sorted order.
+    """
+
+    def __iter__(self):
+        rows = self._mapping.lexicon._iter_rows(
+            'SELECT word, tokens FROM transcriptions ORDER BY word, rowid'
+        )
+
+        for word, group in itertools.groupby(rows, key=lambda r: r[0]):
+            yield word, [json.loads(r[1]) for r in group]
@@ -0,0 +1,150 @@
+import collections
+import threading
+
+
+class Stats:
+    """
+    Counters to profile decoding (:class:`pyphony.Alphabet`) or
+    conversion (:class:`pyphony.Converter`). Attach an instance via the
+    ``stats`` attribute, to collect the counters of every decoded or
+    converted transcription.
+
+    The counters are collected per transcription and added with
+    a single call to :meth:`record`, which is thread-safe.
+    Stats can be pickled and merged (see :meth:`merge`),
+    e.g. to collect the stats of worker processes.
+
+    Attributes:
+        calls (int): Number of decoded/converted transcriptions.
+        steps (int): Number of matching steps (one per position
+                     in the input, where a match is searched).
+        time (float): Seconds spent decoding/converting.
+        rule_hits (Counter): Number of matches per symbol (decoding) or per
+                             tuple of input symbols of a mapping (conversion).
+        match_lengths (Counter): Number of matches per length of the match.
+        ignored (Counter): Number of skipped ignore-symbols per symbol.
+        unknown (Counter): Number of unknown symbols (decoding) or
+                           missing mappings (conversion) per symbol.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.steps = 0
+        self.time = 0.0
+        self.rule_hits = collections.Counter()
+        self.match_lengths = collections.Counter()
+        self.ignored = collections.Counter()
+        self.unknown = collections.Counter()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return 'Stats(calls={}, steps={}, time={:.6f})'.format(
+            self.calls,
+            self.steps,
+            self.time
+        )
+
+    def record(self, calls=0, steps=0, time=0.0, rule_hits=None,
+               match_lengths=None, ignored=None, unknown=None):
+        """
+        Add the given counts.
+
+        Args:
+            calls (int): Number of transcriptions.
+            steps (int): Number of matching steps.
+            time (float): Seconds spent.
+            rule_hits (dict): Number of matches per rule.
+            match_lengths (dict): Number of matches per length.
+            ignored (dict): Number of ignored symbols per symbol.
+            unknown (dict): Number of unknown symbols per symbol.
+        """
+        with self._lock:
+            self.calls += calls
+            self.steps += steps
+            self.time += time
+
+            if rule_hits:
+                self.rule_hits.update(rule_hits)
+
+            if match_lengths:
+                self.match_lengths.update(match_lengths)
+
+            if ignored:
+                self.ignored.update(ignored)
+
+            if unknown:
+                self.unknown.update(unknown)
+
+    def merge(self, other):
+        """
+        Add the counts of the other stats to these stats.
+
+        Args:
+            other (Stats): Stats to add.
+
+        Returns:
+            Stats: These stats.
+        """
+        self.record(*other._counters())
+        return self
+
+    def copy(self):
+        """
+        Return a copy of the current counts.
+        """
+        return Stats().merge(self)
+
+    def reset(self):
+        """
+        Set all counts to zero.
+        """
+        with self._lock:
+            self.calls = 0
+            self.steps = 0
+            self.time = 0.0
+            self.rule_hits.clear()
+            self.match_lengths.clear()
+            self.ignored.clear()
+            self.unknown.clear()
+
+    def pop(self):
+        """
+        Return a copy of the current counts and reset them afterwards.
+        """
+        current = Stats()
+
+        with self._lock:
+            current.calls, self.calls = self.calls, 0
+            current.steps, self.steps = self.steps, 0
+            current.time, self.time = self.time, 0.0
+            current.rule_hits, self.rule_hits = \
+                self.rule_hits, collections.Counter()
+            current.match_lengths, self.match_lengths = \
+                self.match_lengths, collections.Counter()
+            current.ignored, self.ignored = \
+                self.ignored, collections.Counter()
+            current.unknown, self.unknown = \
+                self.unknown, collections.Counter()
+
+        return current
+
+    def _counters(self):
+        with self._lock:
+            return (
+                self.calls,
+                self.steps,
+                self.time,
+                collections.Counter(self.rule_hits),
+                collections.Counter(self.match_lengths),
+                collections.Counter(self.ignored),
+                collections.Counter(self.unknown),
+            )
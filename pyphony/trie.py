@@ -0,0 +1,163 @@
+"""
+Prefix trie used to find matching symbols at a given position of a sequence.
+"""
+import re
+
+_END = None
+
+
+class PrefixTrie:
+    """
+    A prefix trie over sequences (e.g. ``str`` or lists of symbols).
+
+    Every node is a dictionary mapping the next element to the child node.
+    The value of a key ending in a node is stored under the key ``None``,
+    which never occurs as element of a sequence.
+
+    If the same key is added multiple times, the value of the
+    first occurrence is kept.
+    """
+
+    def __init__(self, items=None):
+        self.root = {}
+        self.size = 0
+
+        for key, value in items or []:
+            self.add(key, value)
+
+    def __len__(self):
+        return self.size
+
+    def add(self, key, value):
+        """
+        Add the key with the given value.
+        Empty keys are ignored, since they can't be matched.
+
+        Args:
+            key (Sequence): The key (e.g. ``str`` or list of symbols).
+            value (object): The value to store for the key.
+        """
+        if len(key) <= 0:
+            return
+
+        node = self.root
+
+        for x in key:
+            child = node.get(x)
+
+            if child is None:
+                child = {}
+                node[x] = child
+
+            node = child
+
+        if _END not in node:
+            node[_END] = value
+            self.size += 1
+
+    def longest_match(self, sequence, start=0):
+        """
+        Return the longest key that matches ``sequence``
+        beginning at index ``start``.
+
+        Returns:
+            tuple: ``(length, value)`` of the longest matching key or
+            ``None`` if no key matches.
+        """
+        node = self.root
+        best = None
+        end = len(sequence)
+        i = start
+
+        while i < end:
+            node = node.get(sequence[i])
+
+            if node is None:
+                break
+
+            i += 1
+
+            if _END in node:
+                best = (i - start, node[_END])
+
+        return best
+
+    def shortest_match(self, sequence, start=0):
+        """
+        Return the shortest key that matches ``sequence``
+        beginning at index ``start``.
+
+        Returns:
+            tuple: ``(length, value)`` of the shortest matching key or
+            ``None`` if no key matches.
+        """
+        node = self.root
+        end = len(sequence)
+        i = start
+
+        while i < end:
+            node = node.get(sequence[i])
+
+            if node is None:
+                break
+
+            i += 1
+
+            if _END in node:
+                return (i - start, node[_END])
+
+        return None
+
+    def to_regex(self, longest=True):
+        """
+        Return a regular expression, that matches the same key
+        at the start of a string as :meth:`longest_match`
+        (or :meth:`shortest_match` if ``longest`` is ``False``).
+        The expression has the structure of the trie, so the regex engine
+        never tries more than one branch per character.
+        Only possible if all keys are strings.
+
+        Returns:
+            str: The regular expression or ``None`` if the trie is empty.
+        """
+        if self.size == 0:
+            return None
+
+        return _node_regex(self.root, longest)
+
+
+def _node_regex(node, longest):
+    chars = []
+    branches = []
+
+    for x, child in node.items():
+        if x is _END:
+            continue
+
+        sub = ''
+
+        # Below the end of a key, only the longest match has to go deeper
+        if longest or _END not in child:
+            sub = _node_regex(child, longest)
+
+        if sub == '':
+            chars.append(re.escape(x))
+        else:
+            branches.append(re.escape(x) + sub)
+
+    if len(chars) == 1:
+        branches.append(chars[0])
+    elif len(chars) > 1:
+        branches.append('[{}]'.format(''.join(chars)))
+
+    if len(branches) == 0:
+        return ''
+
+    pattern = '|'.join(branches)
+
+    if longest and _END in node:
+        return '(?:{})?'.format(pattern)
+    elif len(branches) > 1:
+        return '(?:{})'.format(pattern)
+    else:
+        return pattern
@@ -11,13 +11,16 @@ PYTEST_VERSION_ = '5.2.3'
 
 # Packages required in 'production'
 REQUIRED = [
+    'click==7.0',
     'tqdm==4.39.0',
 ]
 
 # Packages required for dev/ci enrionment
 EXTRAS = {
+    'numpy': [
+        'numpy>=1.16',
+    ],
     'dev': [
-        'click==7.0',
         'pytest==%s' % (PYTEST_VERSION_,),
         'pytest-runner==5.2',
         'pytest-cov==2.8.1',
@@ -81,5 +84,9 @@ setup(name='pyphony',
       extras_require=EXTRAS,
       setup_requires=['pytest-runner'],
       tests_require=TESTS,
-      entry_points={}
+      entry_points={
+          'console_scripts': [
+              'pyphony = pyphony.cli:main',
+          ],
+      }
       )
@@ -0,0 +1,135 @@
+"""
+Fixtures for the benchmarks of the hot paths.
+
+The benchmarks run on synthetic lexicons, that are created from the
+bundled alphabets. By default lexicons with 10k entries are used.
+Other sizes can be set with the environment variable
+``PYPHONY_BENCHMARK_SIZES`` (e.g. ``10000,100000,1000000``).
+"""
+import os
+import random
+import string
+import tracemalloc
+
+import pytest
+
+import pyphony
+
+
+SIZES = [
+    int(x)
+    for x in os.environ.get('PYPHONY_BENCHMARK_SIZES', '10000').split(',')
+]
+
+SEED = 1234
+
+
+@pytest.fixture(scope='session', params=SIZES, ids=lambda s: str(s))
+def size(request):
+    return request.param
+
+
+@pytest.fixture(scope='session')
+def ipa_symbols():
+    """
+    IPA symbols, that can be converted to X-SAMPA.
+    """
+    converter = pyphony.Converter.ipa_to_xsampa()
+    alphabet = pyphony.Alphabet.ipa()
+
+    return sorted({
+        in_sym[0]
+        for in_sym, _ in converter.mapping
+        if len(in_sym) == 1 and in_sym[0] in alphabet.symbols
+    })
+
+
+@pytest.fixture(scope='session')
+def entries(size, ipa_symbols):
+    """
+    List of ``size`` random tuples ``(word, tokens)``.
+    Some words have multiple transcriptions.
+    """
+    rand = random.Random(SEED)
+    result = []
+
+    while len(result) < size:
+        word = ''.join(rand.choices(string.ascii_lowercase, k=8))
+
+        for _ in range(rand.choice([1, 1, 1, 2])):
+            length = rand.randint(3, 12)
+            result.append((word, rand.choices(ipa_symbols, k=length)))
+
+    return result[:size]
+
+
+@pytest.fixture(scope='session')
+def lexicon(entries):
+    lex = pyphony.Lexicon()
+    lex.add_many(entries)
+    return lex
+
+
+@pytest.fixture(scope='session')
+def lexicon_file(entries, tmp_path_factory):
+    """
+    The entries written to a file, without token separator.
+    """
+    path = tmp_path_factory.mktemp('lexicon') / 'lex.txt'
+    pyphony.Lexicon.save_entries(str(path), entries, token_sep='')
+    return str(path)
+
+
+@pytest.fixture(scope='session')
+def wiktionary_dump(entries, tmp_path_factory):
+    """
+    A Wiktionary dump with a page for every entry.
+    """
+    path = tmp_path_factory.mktemp('wiktionary') / 'dump.xml'
+
+    with open(str(path), 'w', encoding='utf-8') as f:
+        f.write(
+            '<mediawiki xmlns="http://www.mediawiki.org/xml/export-0.10/">'
+        )
+
+        for word, tokens in entries:
+            f.write(
+                '<page><title>{0}</title><revision><text>'
+                '== {0} ({{{{Sprache|Deutsch}}}}) ==\n'
+                '{{{{IPA}}}} {{{{Lautschrift|{1}}}}}'
+                '</text></revision></page>'.format(word, ''.join(tokens))
+            )
+
+        f.write('</mediawiki>')
+
+    return str(path)
+
+
+@pytest.fixture
+def measure(benchmark):
+    """
+    Return a function, that benchmarks ``fn`` and records the peak memory
+    and the throughput (items per second) in the ``extra_info``.
+    """
+
+    def run(fn, num_items, rounds=3):
+        tracemalloc.start()
+
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        result = benchmark.pedantic(fn, rounds=rounds, iterations=1)
+
+        benchmark.extra_info['items'] = num_items
+        benchmark.extra_info['peak_memory_mb'] = peak / 1024 / 1024
+
+        if benchmark.stats is not None:
+            mean = benchmark.stats.stats.mean
+            benchmark.extra_info['items_per_second'] = num_items / mean
+
+        return result
+
+    return run
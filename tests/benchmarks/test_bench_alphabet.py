@@ -0,0 +1,40 @@
+import pytest
+
+import pyphony
+
+
+@pytest.mark.benchmark(group='decode')
+def test_decode(measure, entries):
+    alphabet = pyphony.Alphabet.ipa()
+    transcriptions = [''.join(tokens) for _, tokens in entries]
+
+    def run():
+        return [alphabet.decode(t) for t in transcriptions]
+
+    res = measure(run, len(transcriptions))
+    assert res[0] == entries[0][1]
+
+
+@pytest.mark.benchmark(group='decode')
+def test_decode_many(measure, entries):
+    alphabet = pyphony.Alphabet.ipa()
+    transcriptions = [''.join(tokens) for _, tokens in entries]
+
+    res = measure(
+        lambda: alphabet.decode_many(transcriptions),
+        len(transcriptions)
+    )
+    assert res[0] == entries[0][1]
+
+
+@pytest.mark.benchmark(group='decode')
+def test_decode_regex(measure, entries):
+    alphabet = pyphony.Alphabet.ipa()
+    alphabet.set_backend('regex')
+    transcriptions = [''.join(tokens) for _, tokens in entries]
+
+    def run():
+        return [alphabet.decode(t) for t in transcriptions]
+
+    res = measure(run, len(transcriptions))
+    assert res[0] == entries[0][1]
@@ -0,0 +1,35 @@
+import pytest
+
+import pyphony
+
+
+@pytest.mark.benchmark(group='convert')
+def test_convert(measure, entries):
+    converter = pyphony.Converter.ipa_to_xsampa()
+    transcriptions = [tokens for _, tokens in entries]
+
+    def run():
+        return [converter.convert(t) for t in transcriptions]
+
+    res = measure(run, len(transcriptions))
+    assert len(res) == len(entries)
+
+
+@pytest.mark.benchmark(group='convert')
+def test_convert_many(measure, entries):
+    converter = pyphony.Converter.ipa_to_xsampa()
+    transcriptions = [tokens for _, tokens in entries]
+
+    res = measure(
+        lambda: converter.convert_many(transcriptions),
+        len(transcriptions)
+    )
+    assert res[0] == converter.convert(transcriptions[0])
+
+
+@pytest.mark.benchmark(group='convert_lexicon')
+def test_convert_lexicon(measure, entries, lexicon):
+    converter = pyphony.Converter.ipa_to_xsampa()
+
+    res = measure(lambda: converter.convert_lexicon(lexicon), len(entries))
+    assert len(res.entries) == len(lexicon.entries)
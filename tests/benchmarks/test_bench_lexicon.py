@@ -0,0 +1,56 @@
+import pytest
+
+import pyphony
+
+
+@pytest.mark.benchmark(group='load')
+def test_load(measure, entries, lexicon_file):
+    alphabet = pyphony.Alphabet.ipa()
+
+    res = measure(
+        lambda: pyphony.Lexicon.load(
+            lexicon_file,
+            token_sep='',
+            alphabet=alphabet
+        ),
+        len(entries)
+    )
+    assert len(res.entries) > 0
+
+
+@pytest.mark.benchmark(group='load')
+def test_load_with_workers(measure, entries, lexicon_file):
+    alphabet = pyphony.Alphabet.ipa()
+
+    res = measure(
+        lambda: pyphony.Lexicon.load(
+            lexicon_file,
+            token_sep='',
+            alphabet=alphabet,
+            workers=4
+        ),
+        len(entries)
+    )
+    assert len(res.entries) > 0
+
+
+@pytest.mark.benchmark(group='load')
+def test_load_compact(measure, entries, lexicon_file):
+    alphabet = pyphony.Alphabet.ipa()
+
+    res = measure(
+        lambda: pyphony.CompactLexicon.load(
+            lexicon_file,
+            token_sep='',
+            alphabet=alphabet
+        ),
+        len(entries)
+    )
+    assert len(res.entries) > 0
+
+
+@pytest.mark.benchmark(group='save')
+def test_save(measure, entries, lexicon, tmp_path):
+    path = str(tmp_path / 'lex.txt')
+
+    measure(lambda: lexicon.save(path, all_variants=True), len(entries))
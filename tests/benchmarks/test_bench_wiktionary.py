@@ -0,0 +1,27 @@
+import pytest
+
+from pyphony.parser import wiktionary
+
+
+@pytest.mark.benchmark(group='wiktionary')
+def test_parse_xml_dump(measure, entries, wiktionary_dump):
+    parser = wiktionary.DeWiktionaryParser()
+
+    res = measure(
+        lambda: parser.parse_xml_dump(wiktionary_dump),
+        len(entries),
+        rounds=1
+    )
+    assert len(res.entries) > 0
+
+
+@pytest.mark.benchmark(group='wiktionary')
+def test_parse_page(measure, entries, wiktionary_dump):
+    parser = wiktionary.DeWiktionaryParser()
+    pages = list(parser.iter_page_texts(wiktionary_dump))
+
+    def run():
+        return [parser.parse_page_text(t, x) for t, x in pages]
+
+    res = measure(run, len(pages))
+    assert res[0] is not None
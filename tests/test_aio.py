@@ -0,0 +1,157 @@
+import asyncio
+import concurrent.futures
+
+import pytest
+
+import pyphony
+from pyphony import aio
+
+
+@pytest.fixture
+def service():
+    lex = pyphony.Lexicon()
+    lex.add('ab', ['a', 'b'])
+    lex.add('bc', ['bc'])
+
+    alphabet = pyphony.Alphabet([
+        pyphony.Symbol('a'),
+        pyphony.Symbol('b'),
+        pyphony.Symbol('bc'),
+    ])
+    converter = pyphony.Converter([
+        (['a'], ['A']),
+        (['a', 'b'], ['AB']),
+        (['b'], ['B']),
+        (['bc'], ['C']),
+    ])
+
+    return aio.AsyncLexiconService(
+        lexicon=lex,
+        alphabet=alphabet,
+        converter=converter,
+        window=0.01
+    )
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestBatcher:
+
+    def test_collects_concurrent_calls(self):
+        batches = []
+
+        def fn(items):
+            batches.append(items)
+            return [(None, x * 2) for x in items]
+
+        async def main():
+            batcher = aio.Batcher(fn, window=0.01)
+            return await asyncio.gather(*[batcher.submit(x) for x in range(5)])
+
+        assert run(main()) == [0, 2, 4, 6, 8]
+        assert batches == [[0, 1, 2, 3, 4]]
+
+    def test_max_batch_size(self):
+        batches = []
+
+        def fn(items):
+            batches.append(items)
+            return [(None, x) for x in items]
+
+        async def main():
+            batcher = aio.Batcher(fn, window=10, max_batch_size=2)
+            return await asyncio.gather(*[batcher.submit(x) for x in range(4)])
+
+        assert run(main()) == [0, 1, 2, 3]
+        assert batches == [[0, 1], [2, 3]]
+
+    def test_raises_errors_per_item(self):
+        def fn(items):
+            return [(None, x) if x > 0 else (ValueError(), None) for x in items]
+
+        async def main():
+            batcher = aio.Batcher(fn, window=0.01)
+            return await asyncio.gather(
+                batcher.submit(1),
+                batcher.submit(0),
+                return_exceptions=True
+            )
+
+        res = run(main())
+
+        assert res[0] == 1
+        assert isinstance(res[1], ValueError)
+
+    def test_raises_error_of_batch(self):
+        def fn(items):
+            raise RuntimeError()
+
+        async def main():
+            batcher = aio.Batcher(fn, window=0.01)
+            return await batcher.submit(1)
+
+        with pytest.raises(RuntimeError):
+            run(main())
+
+
+class TestAsyncLexiconService:
+
+    def test_lookup(self, service):
+        async def main():
+            return await asyncio.gather(
+                service.lookup('ab'),
+                service.lookup('bc'),
+                service.lookup('cd'),
+                return_exceptions=True
+            )
+
+        res = run(main())
+
+        assert res[0] == [['a', 'b']]
+        assert res[1] == [['bc']]
+        assert isinstance(res[2], KeyError)
+
+    def test_decode(self, service):
+        async def main():
+            return await asyncio.gather(
+                service.decode('abc'),
+                service.decode('axb'),
+                service.decode('bca'),
+                return_exceptions=True
+            )
+
+        res = run(main())
+
+        assert res[0] == ['a', 'bc']
+        assert isinstance(res[1], pyphony.UnknownSymbolException)
+        assert res[2] == ['bc', 'a']
+
+    def test_convert(self, service):
+        async def main():
+            return await asyncio.gather(
+                service.convert(['a', 'b', 'a']),
+                service.convert(['x']),
+                service.convert(['bc']),
+                return_exceptions=True
+            )
+
+        res = run(main())
+
+        assert res[0] == ['AB', 'A']
+        assert isinstance(res[1], pyphony.conversion.MissingMapping)
+        assert res[2] == ['C']
+
+    def test_with_executor(self, service):
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        service = aio.AsyncLexiconService(
+            converter=service.converter,
+            executor=executor
+        )
+
+        async def main():
+            return await service.convert(['a', 'b'])
+
+        assert run(main()) == ['AB']
+        executor.shutdown()
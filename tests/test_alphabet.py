@@ -1,6 +1,10 @@
+import random
+
 import pytest
 
 from pyphony import Alphabet, Symbol, UnknownSymbolException
+from pyphony.alphabet import DecompositionTable
+from pyphony.stats import Stats
 
 
 class TestAlphabet:
@@ -60,3 +64,290 @@ class TestAlphabet:
 
         with pytest.raises(UnknownSymbolException):
             table.decode('afbcyba')
+
+    def test_decode_prefers_longest_symbol(self):
+        table = Alphabet([
+            Symbol('a'),
+            Symbol('ab'),
+            Symbol('abc'),
+            Symbol('c'),
+        ])
+
+        res = table.decode('abcabac')
+        assert res == ['abc', 'ab', 'a', 'c']
+
+    def test_decode_skips_shortest_ignore_symbol(self):
+        table = Alphabet([
+            Symbol('a'),
+            Symbol('b'),
+        ], ignore_symbols=['--', '-'])
+
+        res = table.decode('a--b')
+        assert res == ['a', 'b']
+
+        res = table.decode('a-b')
+        assert res == ['a', 'b']
+
+    def test_decode_not_strict_ignores_unknown(self):
+        table = Alphabet([
+            Symbol('a'),
+            Symbol('bc'),
+        ])
+
+        res = table.decode('axbcb', strict=False)
+        assert res == ['a', 'bc']
+
+    def test_decode_raises_with_context(self):
+        table = Alphabet([
+            Symbol('a'),
+            Symbol('bc'),
+        ])
+
+        with pytest.raises(UnknownSymbolException) as ex:
+            table.decode('abcxa')
+
+        assert ex.value.unknown_symbol == 'x'
+        assert '"  xa  "' in str(ex.value)
+
+    def test_decode_with_stats(self):
+        stats = Stats()
+        table = Alphabet([
+            Symbol('a'),
+            Symbol('bc'),
+            Symbol('b'),
+        ], ignore_symbols=['-'], stats=stats)
+
+        assert table.decode('abc-xb', strict=False) == ['a', 'bc', 'b']
+
+        with pytest.raises(UnknownSymbolException):
+            table.decode('ax')
+
+        assert stats.calls == 2
+        assert stats.steps == 7
+        assert stats.rule_hits == {'a': 2, 'bc': 1, 'b': 1}
+        assert stats.match_lengths == {1: 3, 2: 1}
+        assert stats.ignored == {'-': 1}
+        assert stats.unknown == {'x': 2}
+        assert stats.time > 0
+
+    def test_best_matching_start_symbol_with_start(self):
+        table = Alphabet([
+            Symbol('a'),
+            Symbol('bc'),
+            Symbol('b'),
+        ])
+
+        assert table.best_matching_start_symbol('abca') == 'a'
+        assert table.best_matching_start_symbol('abca', start=1) == 'bc'
+        assert table.best_matching_start_symbol('abca', start=4) is None
+        assert table.best_matching_start_symbol('xbca') is None
+
+    def test_decode_with_cache(self):
+        table = Alphabet([
+            Symbol('a'),
+            Symbol('bc'),
+        ], cache_size=2)
+
+        res = table.decode('abc')
+        res.append('x')
+
+        assert table.decode('abc') == ['a', 'bc']
+        assert table.decode('bca') == ['bc', 'a']
+        assert table.decode('a') == ['a']
+        assert table.decode('abc') == ['a', 'bc']
+
+        info = table.cache_info()
+        assert info.hits == 1
+        assert info.misses == 4
+        assert info.maxsize == 2
+        assert info.currsize == 2
+
+    def test_decode_with_cache_raises(self):
+        table = Alphabet([Symbol('a')], cache_size=10)
+
+        with pytest.raises(UnknownSymbolException):
+            table.decode('ax')
+
+        with pytest.raises(UnknownSymbolException):
+            table.decode('ax')
+
+        assert table.decode('ax', strict=False) == ['a']
+
+    def test_cache_is_disabled_by_default(self):
+        table = Alphabet([Symbol('a')])
+        assert table.cache_info() is None
+
+        table.set_cache_size(None)
+        table.decode('a')
+        assert table.cache_info() == (0, 1, None, 1)
+
+    def test_decode_many(self):
+        table = Alphabet([
+            Symbol('a'),
+            Symbol('bc'),
+        ])
+
+        res, info = table.decode_many(
+            ['abc', 'a', 'abc', 'abc'],
+            return_info=True
+        )
+
+        assert res == [['a', 'bc'], ['a'], ['a', 'bc'], ['a', 'bc']]
+        assert info.hits == 2
+        assert info.misses == 2
+        assert table.cache_info() is None
+
+    def test_decode_many_shares_cache(self):
+        table = Alphabet([
+            Symbol('a'),
+            Symbol('bc'),
+        ], cache_size=10)
+
+        table.decode('abc')
+        res, info = table.decode_many(['abc', 'bc'], return_info=True)
+
+        assert res == [['a', 'bc'], ['bc']]
+        assert info.hits == 1
+        assert info.misses == 1
+        assert table.cache_info().hits == 1
+        assert table.cache_info().misses == 2
+
+    def test_decompose_keeps_alphabet_symbols(self):
+        combined = chr(int('00f5', 16))
+        s1 = chr(int('006f', 16))
+        s2 = chr(int('0303', 16))
+
+        table = Alphabet([
+            Symbol('a'),
+            Symbol(combined),
+        ], ignore_symbols=['ü'])
+
+        assert table.decompose('a' + combined) == 'a' + combined
+        assert table.decompose('ü') == 'ü'
+        assert table.decompose('xé' + s1) == 'xe' + chr(int('0301', 16)) + s1
+        assert table.decompose(s1 + s2) == s1 + s2
+
+
+def random_transcriptions(alphabet, count=2000, seed=0):
+    """
+    Create random transcriptions of symbols, ignore-symbols, parts of
+    symbols and characters that are not in the alphabet.
+    """
+    rand = random.Random(seed)
+    pool = list(alphabet.symbols.keys())
+    pool.extend(alphabet.ignore_symbols)
+    pool.extend({c for s in pool for c in s})
+    pool.extend(['x', 'õ', 'ä', ' ', '\n', '-', '.', '[', '\\'])
+
+    return [
+        ''.join(rand.choice(pool) for _ in range(rand.randint(0, 12)))
+        for _ in range(count)
+    ]
+
+
+def decode_or_error(alphabet, transcription, strict):
+    try:
+        return alphabet.decode(transcription, strict=strict)
+    except UnknownSymbolException as ex:
+        return ex.unknown_symbol, str(ex)
+
+
+class TestRegexBackend:
+
+    @pytest.mark.parametrize('name', ['ipa', 'sampa', 'xsampa', 'marytts_de'])
+    def test_same_result_as_trie(self, name):
+        trie = Alphabet.with_name(name)
+        regex = Alphabet(
+            trie.symbols.values(),
+            ignore_symbols=trie.ignore_symbols,
+            backend='regex'
+        )
+
+        for t in random_transcriptions(trie):
+            for strict in [True, False]:
+                assert decode_or_error(regex, t, strict) == \
+                    decode_or_error(trie, t, strict)
+
+            for start in range(len(t) + 1):
+                assert regex.best_matching_start_symbol(t, start) == \
+                    trie.best_matching_start_symbol(t, start)
+                assert regex.best_matching_start_ignore_symbol(t, start) == \
+                    trie.best_matching_start_ignore_symbol(t, start)
+
+    @pytest.mark.parametrize('name', ['ipa', 'sampa', 'xsampa', 'marytts_de'])
+    def test_same_stats_as_trie(self, name):
+        trie = Alphabet.with_name(name)
+        trie.stats = Stats()
+        regex = Alphabet.with_name(name)
+        regex.set_backend('regex')
+        regex.stats = Stats()
+
+        for t in random_transcriptions(trie, count=100):
+            for strict in [True, False]:
+                assert decode_or_error(regex, t, strict) == \
+                    decode_or_error(trie, t, strict)
+
+        assert regex.stats.calls == trie.stats.calls == 200
+        assert regex.stats._counters()[3:] == trie.stats._counters()[3:]
+        assert regex.stats.steps == trie.stats.steps
+        assert regex.stats.time > 0
+
+    def test_decode(self):
+        table = Alphabet([
+            Symbol('a'),
+            Symbol('abc'),
+            Symbol('b'),
+            Symbol('.'),
+        ], ignore_symbols=['--', '-'], backend='regex')
+
+        assert table.decode('abcab--.a-b') == [
+            'abc', 'a', 'b', '.', 'a', 'b'
+        ]
+        assert table.decode('axb', strict=False) == ['a', 'b']
+
+    def test_decode_raises_with_context(self):
+        table = Alphabet([
+            Symbol('a'),
+            Symbol('bc'),
+        ], ignore_symbols=['x'], backend='regex')
+
+        with pytest.raises(UnknownSymbolException) as ex:
+            table.decode('abcxyza')
+
+        assert ex.value.unknown_symbol == 'y'
+        assert '"  yza  "' in str(ex.value)
+
+    def test_without_symbols(self):
+        table = Alphabet(backend='regex')
+
+        assert table.decode('abc', strict=False) == []
+        assert table.best_matching_start_symbol('abc') is None
+        assert table.best_matching_start_ignore_symbol('abc') is None
+
+    def test_set_backend(self):
+        table = Alphabet([Symbol('a')])
+        table.set_backend('regex')
+        assert table.backend == 'regex'
+        assert table.decode('aa') == ['a', 'a']
+
+        table.set_backend('trie')
+        assert table.backend == 'trie'
+        assert table.decode('aa') == ['a', 'a']
+
+        with pytest.raises(ValueError):
+            table.set_backend('other')
+
+
+class TestDecompositionTable:
+
+    def test_translate(self):
+        table = DecompositionTable(keep=['é'])
+
+        assert 'éõa'.translate(table) == 'éo' + chr(int('0303', 16)) + 'a'
+        assert ord('õ') in table
+        assert ord('a') in table
+
+    def test_ignores_compat_tag(self):
+        table = DecompositionTable()
+
+        assert 'ﬁ'.translate(table) == 'fi'
@@ -0,0 +1,106 @@
+import pickle
+
+from pyphony.cache import LRUCache, PersistentCache
+
+
+class TestLRUCache:
+
+    def test_get_and_put(self):
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+
+        assert cache.get('a') == 1
+        assert cache.get('c') is None
+        assert cache.get('c', default=5) == 5
+        assert cache.info() == (1, 2, 2, 2)
+
+    def test_discards_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        assert len(cache) == 2
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+    def test_clear(self):
+        cache = LRUCache()
+        cache.put('a', 1)
+        cache.get('a')
+        cache.clear()
+
+        assert cache.info() == (0, 0, None, 0)
+
+    def test_pickle(self):
+        cache = LRUCache(maxsize=3)
+        cache.put('a', 1)
+
+        restored = pickle.loads(pickle.dumps(cache))
+
+        assert restored.get('a') == 1
+        restored.put('b', 2)
+        assert len(restored) == 2
+
+
+class TestPersistentCache:
+
+    def test_put_and_get(self, tmp_path):
+        path = str(tmp_path / 'cache.db')
+
+        with PersistentCache(path) as cache:
+            cache.put_many([(b'a', 'A'), (b'b', 'B')])
+
+            assert cache.get_many([b'a', b'x']) == {b'a': 'A'}
+            assert cache.info() == (1, 1, None, 2)
+
+        with PersistentCache(path) as cache:
+            assert cache.get_many([b'b']) == {b'b': 'B'}
+
+    def test_get_many_with_many_keys(self, tmp_path):
+        with PersistentCache(str(tmp_path / 'cache.db')) as cache:
+            items = [(str(i).encode('ascii'), str(i)) for i in range(1200)]
+            cache.put_many(items)
+
+            assert cache.get_many(k for k, _ in items) == dict(items)
+
+    def test_bind(self, tmp_path):
+        path = str(tmp_path / 'cache.db')
+
+        with PersistentCache(path) as cache:
+            assert not cache.bind('one')
+            cache.put_many([(b'a', 'A')])
+
+        with PersistentCache(path) as cache:
+            assert not cache.bind('one')
+            assert len(cache) == 1
+
+            assert cache.bind('two')
+            assert len(cache) == 0
+
+    def test_clear(self, tmp_path):
+        with PersistentCache(str(tmp_path / 'cache.db')) as cache:
+            cache.put_many([(b'a', 'A')])
+            cache.get_many([b'a'])
+            cache.clear()
+
+            assert cache.info() == (0, 0, None, 0)
+
+    def test_preload(self, tmp_path):
+        path = str(tmp_path / 'cache.db')
+
+        with PersistentCache(path) as cache:
+            cache.put_many([('a', 'A'), ('b', 'B')])
+
+        with PersistentCache(path) as cache:
+            cache.preload()
+            cache.put_many([('c', 'C')])
+
+            assert cache.get_many(['a', 'c', 'x']) == {'a': 'A', 'c': 'C'}
+            assert cache.info() == (2, 1, None, 3)
+
+            cache.bind('other')
+            assert cache.get_many(['a']) == {}
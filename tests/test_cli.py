@@ -0,0 +1,149 @@
+import bz2
+import gzip
+
+import pytest
+
+from click.testing import CliRunner
+
+from pyphony import cli
+from pyphony import Alphabet
+
+
+LEXICON = (
+    '# comment\n'
+    'haus haʊs\n'
+    '\n'
+    'tisch tɪʃ\n'
+)
+
+
+def invoke(args, input=None):
+    runner = CliRunner()
+    return runner.invoke(cli.main, args, input=input)
+
+
+class TestDecode:
+
+    def test_decode(self):
+        res = invoke(['decode', 'ipa'], input=LEXICON)
+
+        assert res.exit_code == 0
+        assert res.output == 'haus h a ʊ s\ntisch t ɪ ʃ\n'
+
+    def test_decode_with_workers(self):
+        lines = ''.join('w{} haʊs\n'.format(i) for i in range(20))
+        res = invoke(
+            ['decode', 'ipa', '--workers', '2', '--chunksize', '3'],
+            input=lines
+        )
+
+        assert res.exit_code == 0
+        assert res.output == ''.join(
+            'w{} h a ʊ s\n'.format(i) for i in range(20)
+        )
+
+    def test_decode_fails_with_unknown_symbol(self):
+        res = invoke(['decode', 'ipa'], input='haus ha$s\n')
+
+        assert res.exit_code != 0
+        assert 'Line 1' in res.output
+
+    def test_decode_skips_errors(self):
+        res = invoke(
+            ['decode', 'ipa', '--skip-errors'],
+            input='haus ha$s\ntisch tɪʃ\n'
+        )
+
+        assert res.exit_code == 0
+        assert 'tisch t ɪ ʃ\n' in res.output
+
+    def test_decode_not_strict(self):
+        res = invoke(['decode', 'ipa', '--no-strict'], input='haus ha$s\n')
+
+        assert res.exit_code == 0
+        assert res.output == 'haus h a s\n'
+
+    def test_decode_compressed_files(self, tmp_path):
+        in_path = str(tmp_path / 'in.txt.gz')
+        out_path = str(tmp_path / 'out.txt.bz2')
+
+        with gzip.open(in_path, 'wt', encoding='utf-8') as f:
+            f.write(LEXICON)
+
+        res = invoke(['decode', 'ipa', in_path, '-o', out_path])
+        assert res.exit_code == 0
+
+        res = invoke(['validate', 'ipa', out_path])
+        assert res.exit_code == 0
+
+    def test_decode_compressed_stdin(self):
+        for compress in (gzip.compress, bz2.compress):
+            res = invoke(
+                ['decode', 'ipa'],
+                input=compress(LEXICON.encode('utf-8'))
+            )
+
+            assert res.exit_code == 0
+            assert res.output == 'haus h a ʊ s\ntisch t ɪ ʃ\n'
+
+
+class TestConvert:
+
+    def test_convert(self):
+        res = invoke(
+            ['convert', 'ipa', 'xsampa', '--in-token-sep', ''],
+            input=LEXICON
+        )
+
+        assert res.exit_code == 0
+        assert res.output == 'haus h a U s\ntisch t I S\n'
+
+    def test_convert_separated(self):
+        res = invoke(
+            ['convert', 'ipa', 'xsampa', '--word-sep', ';',
+             '--out-token-sep', ','],
+            input='haus;h a ʊ s\n'
+        )
+
+        assert res.exit_code == 0
+        assert res.output == 'haus;h,a,U,s\n'
+
+    def test_convert_fails_without_conversion(self):
+        res = invoke(['convert', 'sampa', 'ipa'], input=LEXICON)
+
+        assert res.exit_code != 0
+        assert 'No conversion' in res.output
+
+
+class TestValidate:
+
+    def test_validate(self):
+        res = invoke(
+            ['validate', 'ipa'],
+            input='haus h a ʊ s\nbaum b a $ m\ntisch t ɪ ʃ\ninvalid\n'
+        )
+
+        assert res.exit_code == 1
+        assert 'Line 2: Unknown symbol: $' in res.output
+        assert 'Line 4: Invalid line: invalid' in res.output
+
+
+class TestLinePipeline:
+
+    def test_process(self):
+        pipeline = cli.LinePipeline(in_token_sep='', alphabet=Alphabet.ipa())
+        out_lines, errors = pipeline.process(
+            ['# comment', '', 'haus haʊs', 'baum ba$m', 'invalid'],
+            first_line=10
+        )
+
+        assert out_lines == ['haus h a ʊ s']
+        assert len(errors) == 2
+        assert errors[0].startswith('Line 13: ')
+        assert errors[1] == 'Line 14: Invalid line: invalid'
+
+    def test_process_raises_programming_errors(self):
+        pipeline = cli.LinePipeline(converter=object())
+
+        with pytest.raises(AttributeError):
+            pipeline.process(['haus h a ʊ s'])
@@ -1,6 +1,9 @@
 import pytest
 
 import pyphony
+from pyphony import progress
+from pyphony.cache import PersistentCache
+from pyphony.stats import Stats
 
 
 @pytest.fixture
@@ -50,6 +53,38 @@ class TestConverter:
         )
         assert res == ['A', 'C', 'Ab', 'B', '8']
 
+    def test_convert_prefers_longest_match(self):
+        converter = pyphony.Converter([
+            (['a'], ['A']),
+            (['a', 'b', 'c'], ['ABC']),
+            (['a', 'b'], ['AB']),
+            (['c'], ['C']),
+        ])
+
+        res = converter.convert(['a', 'b', 'c', 'a', 'b', 'a', 'c'])
+        assert res == ['ABC', 'AB', 'A', 'C']
+
+    def test_convert_with_dict_mapping(self):
+        converter = pyphony.Converter({
+            'a:': ['a', ':'],
+            'b': ['B'],
+        })
+
+        res = converter.convert(['a:', 'b'])
+        assert res == ['a', ':', 'B']
+
+    def test_best_match(self, converter):
+        assert converter.best_match(['a', 'b']) == (['a', 'b'], ['Ab'])
+        assert converter.best_match(['a', 'c'], start=1) == (['c'], ['C'])
+        assert converter.best_match(['x', 'a']) is None
+
+    def test_bundled_converters(self):
+        converter = pyphony.Converter.ipa_to_xsampa()
+        assert converter.convert(['a', 'ɓ']) == ['a', 'b_<']
+
+        converter = pyphony.Converter.marytts_de_to_ipa()
+        assert converter.convert(['i:']) == ['i', 'ː']
+
     def test_convert_lexicon(self, converter, lexicon):
         res = converter.convert_lexicon(lexicon)
 
@@ -66,3 +101,313 @@ class TestConverter:
         assert res.get('aba')[0] == ['Ab', 'A']
         assert res.get('aba')[1] == ['Ab', 'B', '8', 'A']
         assert res.get('acba')[0] == ['A', 'C', 'B', '8', 'A']
+
+    def test_convert_lexicon_with_workers(self, converter, lexicon):
+        lexicon.add('cab', ['c', 'a', 'b'])
+        lexicon.add('baba', ['b', 'a', 'b', 'a'])
+        lexicon.add('baba', ['b', 'a', 'b', 'x', 'a'])
+
+        expected, expected_err = converter.convert_lexicon(
+            lexicon,
+            strict=False,
+            return_errors=True
+        )
+        res, err = converter.convert_lexicon(
+            lexicon,
+            strict=False,
+            return_errors=True,
+            workers=2,
+            chunksize=1
+        )
+
+        assert res.entries == expected.entries
+        assert list(res.entries.keys()) == list(expected.entries.keys())
+        assert err == expected_err == {'x': 1}
+
+    def test_convert_lexicon_reports_progress(self, converter, lexicon):
+        infos = []
+        hook = progress.CallbackProgress(infos.append)
+
+        converter.convert_lexicon(lexicon, progress=hook)
+        converter.convert_lexicon(
+            lexicon,
+            progress=hook,
+            workers=2,
+            chunksize=1
+        )
+
+        assert [(i.count, i.total, i.done) for i in infos] == [
+            (2, 2, True),
+            (2, 2, True),
+        ]
+
+    def test_convert_with_stats(self, converter):
+        converter.stats = Stats()
+
+        res = converter.convert(
+            ['a', 'b', 'x', '.', 'a'],
+            strict=False,
+            ignore_symbols=['.']
+        )
+
+        assert res == ['Ab', 'A']
+        assert converter.stats.calls == 1
+        assert converter.stats.steps == 4
+        assert converter.stats.rule_hits == {('a', 'b'): 1, ('a',): 1}
+        assert converter.stats.match_lengths == {2: 1, 1: 1}
+        assert converter.stats.ignored == {'.': 1}
+        assert converter.stats.unknown == {'x': 1}
+
+    def test_convert_many_with_stats(self, converter):
+        converter.stats = Stats()
+        res = converter.convert_many([['a'], ['c', 'a'], ['a', 'b']])
+
+        assert res == [['A'], ['C', 'A'], ['Ab']]
+        assert converter.stats.calls == 3
+        assert converter.stats.rule_hits == {
+            ('a',): 2,
+            ('c',): 1,
+            ('a', 'b'): 1,
+        }
+
+    def test_convert_lexicon_with_workers_merges_stats(
+            self, converter, lexicon):
+        converter.stats = Stats()
+        converter.convert_lexicon(lexicon)
+        expected = converter.stats.pop()
+
+        converter.convert_lexicon(lexicon, workers=2, chunksize=1)
+
+        assert converter.stats.calls == expected.calls == 3
+        assert converter.stats.steps == expected.steps
+        assert converter.stats.rule_hits == expected.rule_hits
+
+    def test_convert_lexicon_with_cache(self, converter, lexicon, tmp_path):
+        lexicon.add('axba', ['a', 'x', 'b', 'a'])
+        expected, expected_err = converter.convert_lexicon(
+            lexicon,
+            strict=False,
+            return_errors=True
+        )
+
+        with PersistentCache(str(tmp_path / 'cache.db')) as cache:
+            for _ in range(2):
+                res, err = converter.convert_lexicon(
+                    lexicon,
+                    strict=False,
+                    return_errors=True,
+                    cache=cache,
+                    chunksize=2
+                )
+
+                assert res.entries == expected.entries
+                assert err == expected_err
+
+            assert cache.info() == (4, 4, None, 4)
+
+    def test_convert_lexicon_with_cache_converts_changes(
+            self, converter, lexicon, tmp_path):
+        converter.stats = Stats()
+
+        with PersistentCache(str(tmp_path / 'cache.db')) as cache:
+            converter.convert_lexicon(lexicon, cache=cache)
+            lexicon.add('cab', ['c', 'a', 'b'])
+            res = converter.convert_lexicon(lexicon, cache=cache)
+
+        assert res.get('cab') == [['C', 'Ab']]
+        assert converter.stats.calls == 4
+
+    def test_convert_lexicon_with_cache_raises(self, converter, lexicon,
+                                               tmp_path):
+        lexicon.add('axba', ['a', 'x', 'b', 'a'])
+
+        with PersistentCache(str(tmp_path / 'cache.db')) as cache:
+            for _ in range(2):
+                with pytest.raises(pyphony.conversion.MissingMapping):
+                    converter.convert_lexicon(lexicon, cache=cache)
+
+            res = converter.convert_lexicon(
+                lexicon,
+                cache=cache,
+                ignore_unmappable_words=True
+            )
+
+        assert 'axba' not in res.entries
+
+    def test_convert_lexicon_cache_is_cleared_on_new_mapping(
+            self, converter, lexicon, tmp_path):
+        with PersistentCache(str(tmp_path / 'cache.db')) as cache:
+            converter.convert_lexicon(lexicon, cache=cache)
+
+            other = pyphony.Converter([
+                (['a'], ['1']),
+                (['b'], ['2']),
+                (['c'], ['3']),
+            ])
+            res = other.convert_lexicon(lexicon, cache=cache)
+
+            assert res.get('acba') == [['1', '3', '2', '1']]
+            assert cache.info().hits == 0
+
+    def test_convert_lexicon_with_cache_empty_tokens(self, tmp_path):
+        converter = pyphony.Converter([
+            ([''], ['EMPTY']),
+            (['a'], ['']),
+        ])
+        lexicon = pyphony.Lexicon()
+        lexicon.add('w1', [])
+        lexicon.add('w2', [''])
+        lexicon.add('w3', ['a'])
+        expected = converter.convert_lexicon(lexicon)
+
+        with PersistentCache(str(tmp_path / 'cache.db')) as cache:
+            for _ in range(2):
+                res = converter.convert_lexicon(lexicon, cache=cache)
+                assert res.entries == expected.entries
+
+        assert expected.entries == {
+            'w1': [[]],
+            'w2': [['EMPTY']],
+            'w3': [['']],
+        }
+
+    def test_convert_lexicon_cache_is_cleared_on_new_options(
+            self, converter, lexicon, tmp_path):
+        lexicon.add('axba', ['a', 'x', 'b', 'a'])
+
+        with PersistentCache(str(tmp_path / 'cache.db')) as cache:
+            converter.convert_lexicon(lexicon, strict=False, cache=cache)
+
+            with pytest.raises(pyphony.conversion.MissingMapping):
+                converter.convert_lexicon(lexicon, cache=cache)
+
+            assert cache.info().hits == 0
+
+    def test_digest(self, converter):
+        same = pyphony.Converter(list(converter.mapping))
+        other = pyphony.Converter(converter.mapping[1:])
+
+        assert converter.digest() == same.digest()
+        assert converter.digest() != other.digest()
+
+    def test_convert_lexicon_with_workers_raises(self, converter, lexicon):
+        lexicon.add('axba', ['a', 'x'])
+
+        with pytest.raises(pyphony.conversion.MissingMapping) as ex:
+            converter.convert_lexicon(lexicon, workers=2, chunksize=1)
+
+        assert ex.value.symbol == 'x'
+
+    def test_convert_lexicon_with_workers_ignores_words(
+            self, converter, lexicon):
+        lexicon.add('axba', ['a', 'x'])
+        res = converter.convert_lexicon(
+            lexicon,
+            ignore_unmappable_words=True,
+            workers=2,
+            chunksize=2
+        )
+
+        assert len(res.entries) == 2
+        assert res.get('aba')[0] == ['Ab', 'A']
+        assert res.get('aba')[1] == ['Ab', 'B', '8', 'A']
+        assert res.get('acba')[0] == ['A', 'C', 'B', '8', 'A']
+
+    def test_convert_compact_lexicon(self, converter, lexicon):
+        compact = pyphony.CompactLexicon(lexicon.entries)
+        res = converter.convert_lexicon(compact)
+
+        assert res.entries == converter.convert_lexicon(lexicon).entries
+
+    def test_compose(self, converter):
+        second = pyphony.Converter([
+            (['A'], ['1']),
+            (['Ab'], ['2']),
+            (['C'], ['3']),
+            (['B'], ['4']),
+            (['8'], ['5']),
+        ])
+
+        composed = pyphony.Converter.compose(converter, second)
+        in_symbols = ['a', 'c', 'a', 'b', 'b']
+
+        res = composed.convert(in_symbols)
+        assert res == ['1', '3', '2', '4', '5']
+        assert res == second.convert(converter.convert(in_symbols))
+
+    def test_compose_returns_errors(self):
+        first = pyphony.Converter([
+            (['a'], ['A']),
+            (['b'], ['B']),
+            (['c'], ['C', 'x']),
+        ])
+        second = pyphony.Converter([
+            (['A'], ['1']),
+            (['B'], ['2']),
+            (['C'], ['3']),
+            (['B', 'A'], ['4']),
+        ])
+
+        composed, errors = pyphony.Converter.compose(
+            first,
+            second,
+            return_errors=True
+        )
+
+        assert errors == {
+            'unmappable': [('c',)],
+            'ambiguous': [('b',)],
+        }
+        assert composed.mapping == [
+            (['a'], ['1']),
+            (['b'], ['2']),
+        ]
+
+    def test_convert_many(self, converter):
+        transcriptions = [
+            ['a', 'c', 'a', 'b', 'b'],
+            ['c', 'b'],
+            [],
+            ['b', 'c', 'c'],
+            ['a'],
+        ]
+
+        res = converter.convert_many(transcriptions)
+
+        assert res == [converter.convert(t) for t in transcriptions]
+
+    def test_convert_many_return_errors(self, converter):
+        transcriptions = [
+            ['c', 'x', 'b'],
+            ['c', 'b'],
+            ['x', 'a', 'y', 'x'],
+        ]
+
+        res, err = converter.convert_many(
+            transcriptions,
+            strict=False,
+            return_errors=True
+        )
+
+        assert res == [['C', 'B', '8'], ['C', 'B', '8'], ['A']]
+        assert err == {'x': 3, 'y': 1}
+
+    def test_convert_many_raises(self, converter):
+        with pytest.raises(pyphony.conversion.MissingMapping):
+            converter.convert_many([['c'], ['c', 'x']])
+
+    def test_convert_many_ignores_symbols(self, converter):
+        res = converter.convert_many(
+            [['c', 'x', 'b']],
+            ignore_symbols=['x']
+        )
+
+        assert res == [['C', 'B', '8']]
+
+    def test_convert_many_without_numpy(self, converter, monkeypatch):
+        monkeypatch.setattr(pyphony.conversion, 'np', None)
+        transcriptions = [['a', 'c', 'a', 'b', 'b'], ['c', 'b']]
+
+        res = converter.convert_many(transcriptions)
+
+        assert res == [converter.convert(t) for t in transcriptions]
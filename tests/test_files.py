@@ -0,0 +1,93 @@
+import io
+import bz2
+import gzip
+
+import pytest
+
+from pyphony import files
+
+
+class TestOpenFile:
+
+    @pytest.mark.parametrize('name, decompress', [
+        ('lex.txt', lambda b: b),
+        ('lex.txt.gz', gzip.decompress),
+        ('lex.txt.bz2', bz2.decompress),
+    ])
+    def test_write_and_read(self, tmp_path, name, decompress):
+        path = str(tmp_path / name)
+
+        with files.open_file(path, 'w', encoding='utf-8') as f:
+            f.write('äbc\n')
+
+        with open(path, 'rb') as f:
+            assert decompress(f.read()) == 'äbc\n'.encode('utf-8')
+
+        with files.open_file(path, 'r', encoding='utf-8') as f:
+            assert f.read() == 'äbc\n'
+
+        with files.open_file(path, 'rb') as f:
+            assert f.read() == 'äbc\n'.encode('utf-8')
+
+
+class TestOpenStream:
+
+    @pytest.mark.parametrize('compress', [
+        lambda b: b,
+        gzip.compress,
+        bz2.compress,
+    ])
+    def test_read(self, compress):
+        data = compress('äbc\nBZh\n'.encode('utf-8'))
+
+        with files.open_stream(io.BytesIO(data), encoding='utf-8') as f:
+            assert f.read() == 'äbc\nBZh\n'
+
+    def test_read_uncompressed_with_magic_prefix(self):
+        data = 'BZh? x\n'.encode('utf-8')
+
+        with files.open_stream(io.BytesIO(data), encoding='utf-8') as f:
+            assert f.read() == 'BZh? x\n'
+
+    def test_read_empty(self):
+        with files.open_stream(io.BytesIO(b''), encoding='utf-8') as f:
+            assert f.read() == ''
+
+
+class TestLineRanges:
+
+    def test_ranges_are_aligned_on_lines(self, tmp_path):
+        path = tmp_path / 'lex.txt'
+        data = ''.join('wörd{} w ö r d\n'.format(i) for i in range(100))
+        path.write_bytes(data.encode('utf-8'))
+
+        ranges = files.line_ranges(str(path), 7)
+
+        assert len(ranges) == 7
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(data.encode('utf-8'))
+
+        parts = []
+
+        with open(str(path), 'rb') as f:
+            for start, end in ranges:
+                f.seek(start)
+                part = f.read(end - start)
+                assert part.endswith(b'\n')
+                parts.append(part)
+
+        assert b''.join(parts) == data.encode('utf-8')
+
+    def test_more_ranges_than_lines(self, tmp_path):
+        path = tmp_path / 'lex.txt'
+        path.write_bytes(b'a a\nb b')
+
+        ranges = files.line_ranges(str(path), 10)
+
+        assert ranges == [(0, 4), (4, 7)]
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / 'lex.txt'
+        path.write_bytes(b'')
+
+        assert files.line_ranges(str(path), 4) == []
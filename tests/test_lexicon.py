@@ -1,8 +1,12 @@
+import logging
+
 import pytest
 
 from tests import resources
 
-from pyphony import Lexicon
+from pyphony import Lexicon, CompactLexicon, Alphabet, Symbol
+from pyphony import lexicon
+from pyphony.stats import Stats
 
 
 class TestLexicon:
@@ -25,6 +29,76 @@ class TestLexicon:
             'bravo;b r a v o',
         ]
 
+    def test_save_all_variants(self, tmp_path):
+        target = tmp_path / 'lex.txt'
+
+        lex = Lexicon()
+        lex.add('bravo', ['b', 'r', 'a', 'v', 'o'])
+        lex.add('alpha', ['a', 'l', 'p', 'h', 'a'])
+        lex.add('alpha', ['a', 'l', 'f', 'a'])
+        lex.save(str(target), all_variants=True)
+
+        assert target.read_text() == (
+            'alpha a l p h a\n'
+            'alpha a l f a\n'
+            'bravo b r a v o\n'
+        )
+
+        loaded = Lexicon.load(str(target))
+        assert loaded.entries == lex.entries
+
+    def test_save_first_variant(self, tmp_path, caplog):
+        caplog.set_level(logging.INFO)
+        target = tmp_path / 'lex.txt'
+
+        lex = Lexicon()
+        lex.add('bravo', ['b', 'r', 'a', 'v', 'o'])
+        lex.add('alpha', ['a', 'l', 'p', 'h', 'a'])
+        lex.add('alpha', ['a', 'l', 'f', 'a'])
+        lex.save(str(target))
+
+        assert target.read_text() == (
+            'alpha a l p h a\n'
+            'bravo b r a v o\n'
+        )
+        assert caplog.messages == [
+            'Ignored additional transcriptions of 1 words'
+        ]
+
+    def test_save_unsorted(self, tmp_path):
+        target = tmp_path / 'lex.txt'
+
+        lex = Lexicon()
+        lex.add('bravo', ['b', 'r', 'a', 'v', 'o'])
+        lex.add('alpha', ['a', 'l', 'p', 'h', 'a'])
+        lex.save(str(target), sort=False)
+
+        assert target.read_text() == (
+            'bravo b r a v o\n'
+            'alpha a l p h a\n'
+        )
+
+    def test_save_empty(self, tmp_path):
+        target = tmp_path / 'lex.txt'
+        Lexicon().save(str(target))
+
+        assert target.read_text() == ''
+
+    def test_save_in_chunks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(lexicon, 'WRITE_CHUNK_SIZE', 2)
+        target = tmp_path / 'lex.txt'
+
+        lex = Lexicon()
+
+        for i in range(5):
+            lex.add('w{}'.format(i), ['a', str(i)])
+
+        lex.save(str(target))
+
+        assert target.read_text().split('\n') == [
+            'w0 a 0', 'w1 a 1', 'w2 a 2', 'w3 a 3', 'w4 a 4', ''
+        ]
+
     def test_load_word_space_separated(self):
         path = resources.get_resource_path([
             'separator',
@@ -77,3 +151,372 @@ class TestLexicon:
 
         with pytest.raises(ValueError):
             Lexicon.load(str(lex_file), word_sep=' ', token_sep=' ')
+
+    def test_iter_load(self):
+        path = resources.get_resource_path([
+            'separator',
+            'semicolon.txt'
+        ])
+
+        entries = list(Lexicon.iter_load(path, word_sep=';', token_sep=' '))
+
+        assert entries == [
+            ('alpha', ['a', 'l', 'p', 'h', 'a']),
+            ('bravo', ['b', 'r', 'a', 'v', 'o']),
+            ('charlie', ['c', 'h', 'a', 'r', 'l', 'i', 'e']),
+        ]
+
+    def test_iter_load_with_alphabet(self, tmp_path):
+        alphabet = Alphabet([Symbol('a'), Symbol('ph'), Symbol('l')])
+
+        lex_file = tmp_path / 'lex.txt'
+        lex_file.write_text('alpha alpha\nalpha ala\n')
+
+        entries = list(Lexicon.iter_load(
+            str(lex_file),
+            token_sep='',
+            alphabet=alphabet
+        ))
+
+        assert entries == [
+            ('alpha', ['a', 'l', 'ph', 'a']),
+            ('alpha', ['a', 'l', 'a']),
+        ]
+
+    def test_load_with_workers(self, tmp_path):
+        alphabet = Alphabet([Symbol('a'), Symbol('ph'), Symbol('l')])
+        lines = []
+
+        for i in range(200):
+            lines.append('w{} alpha'.format(i % 70))
+            lines.append('w{} ala'.format(i % 30))
+
+            if i % 50 == 0:
+                lines.append('# comment')
+                lines.append('')
+
+        lex_file = tmp_path / 'lex.txt'
+        lex_file.write_text('\n'.join(lines))
+
+        expected = Lexicon.load(str(lex_file), token_sep='', alphabet=alphabet)
+        lex = Lexicon.load(
+            str(lex_file),
+            token_sep='',
+            alphabet=alphabet,
+            workers=3
+        )
+
+        assert lex.entries == expected.entries
+        assert list(lex.entries.keys()) == list(expected.entries.keys())
+
+        lex = CompactLexicon.load(
+            str(lex_file),
+            token_sep='',
+            alphabet=alphabet,
+            workers=3
+        )
+
+        assert isinstance(lex, CompactLexicon)
+        assert dict(lex.entries.items()) == expected.entries
+
+    def test_load_with_workers_merges_stats(self, tmp_path):
+        alphabet = Alphabet(
+            [Symbol('a'), Symbol('ph'), Symbol('l')],
+            stats=Stats()
+        )
+
+        lex_file = tmp_path / 'lex.txt'
+        lex_file.write_text(
+            ''.join('w{} alpha\n'.format(i) for i in range(100))
+        )
+
+        Lexicon.load(str(lex_file), token_sep='', alphabet=alphabet)
+        expected = alphabet.stats.pop()
+
+        Lexicon.load(
+            str(lex_file),
+            token_sep='',
+            alphabet=alphabet,
+            workers=2
+        )
+
+        assert expected.calls == 100
+        assert alphabet.stats.calls == expected.calls
+        assert alphabet.stats.rule_hits == expected.rule_hits
+
+    def test_load_with_workers_raises(self, tmp_path):
+        lex_file = tmp_path / 'lex.txt'
+        lex_file.write_text('alpha a l p h a\ncharlie\n')
+
+        with pytest.raises(ValueError):
+            Lexicon.load(str(lex_file), workers=2)
+
+    def test_iter_parse_skips_invalid_lines(self):
+        lines = ['alpha a l p h a', 'charlie', '# comment', 'beta b e t a']
+
+        entries = list(Lexicon.iter_parse(lines, skip_invalid_lines=True))
+
+        assert entries == [
+            ('alpha', ['a', 'l', 'p', 'h', 'a']),
+            ('beta', ['b', 'e', 't', 'a']),
+        ]
+
+    def test_save_entries(self, tmp_path):
+        target = tmp_path / 'lex.txt'
+
+        entries = iter([
+            ('bravo', ['b', 'r', 'a', 'v', 'o']),
+            ('alpha', ['a', 'l', 'p', 'h', 'a']),
+            ('alpha', ['a', 'l', 'f', 'a']),
+        ])
+
+        count = Lexicon.save_entries(str(target), entries, word_sep=';')
+
+        assert count == 3
+        assert target.read_text() == (
+            'bravo;b r a v o\n'
+            'alpha;a l p h a\n'
+            'alpha;a l f a\n'
+        )
+
+        loaded = list(Lexicon.iter_load(str(target), word_sep=';'))
+        assert loaded[2] == ('alpha', ['a', 'l', 'f', 'a'])
+
+    def test_add_ignores_duplicates(self):
+        lex = Lexicon()
+        lex.add('alpha', ['a', 'l', 'f', 'a'])
+        lex.add('alpha', ['a', 'l', 'p', 'h', 'a'])
+        lex.add('alpha', ['a', 'l', 'f', 'a'])
+        lex.add('alpha', ['a', 'l', 'p', 'h', 'a'])
+        lex.add('beta', ['b', 'e', 't', 'a'])
+        lex.add('beta', ['b', 'e', 't', 'a'])
+
+        assert lex.get('alpha') == [
+            ['a', 'l', 'f', 'a'],
+            ['a', 'l', 'p', 'h', 'a'],
+        ]
+        assert lex.get('beta') == [['b', 'e', 't', 'a']]
+
+    def test_add_ignores_duplicates_of_initial_entries(self):
+        lex = Lexicon({
+            'alpha': [['a', 'l', 'f', 'a'], ['a', 'l', 'p', 'h', 'a']],
+        })
+        lex.add('alpha', ['a', 'l', 'p', 'h', 'a'])
+        lex.add('alpha', ['a', 'f'])
+
+        assert lex.get('alpha') == [
+            ['a', 'l', 'f', 'a'],
+            ['a', 'l', 'p', 'h', 'a'],
+            ['a', 'f'],
+        ]
+
+    def test_add_many(self):
+        lex = Lexicon()
+        lex.add_many([
+            ('beta', ['b', 'e', 't', 'a']),
+            ('alpha', ['a', 'l', 'f', 'a']),
+            ('beta', ['b', 'e', 't', 'a']),
+            ('beta', ['b', 'e', 'd', 'a']),
+        ])
+
+        assert list(lex.entries.keys()) == ['beta', 'alpha']
+        assert lex.get('beta') == [['b', 'e', 't', 'a'], ['b', 'e', 'd', 'a']]
+        assert lex.get('alpha') == [['a', 'l', 'f', 'a']]
+
+    def test_update(self):
+        lex = Lexicon()
+        lex.add('alpha', ['a', 'l', 'f', 'a'])
+
+        other = Lexicon()
+        other.add('beta', ['b', 'e', 't', 'a'])
+        other.add('alpha', ['a', 'l', 'f', 'a'])
+        other.add('alpha', ['a', 'l', 'p', 'h', 'a'])
+
+        lex.update(other)
+
+        assert list(lex.entries.keys()) == ['alpha', 'beta']
+        assert lex.get('alpha') == [
+            ['a', 'l', 'f', 'a'],
+            ['a', 'l', 'p', 'h', 'a'],
+        ]
+        assert lex.get('beta') == [['b', 'e', 't', 'a']]
+
+    def test_symbols(self):
+        lex = Lexicon({'alpha': [['a', 'l', 'f', 'a']]})
+        assert lex.symbols() == {'a', 'l', 'f'}
+
+        lex.add('beta', ['b', 'e', 't', 'a'])
+        assert lex.symbols() == {'a', 'l', 'f', 'b', 'e', 't'}
+
+    def test_symbol_counts(self):
+        lex = Lexicon()
+        lex.add('alpha', ['a', 'l', 'f', 'a'])
+        assert lex.symbol_counts() == {'a': 2, 'l': 1, 'f': 1}
+
+        lex.add('alpha', ['a', 'l', 'f', 'a'])
+        lex.add('alpha', ['a', 'l', 'p', 'h', 'a'])
+        lex.add('beta', ['b', 'e', 't', 'a'])
+
+        assert lex.symbol_counts() == {
+            'a': 5, 'l': 2, 'f': 1, 'p': 1, 'h': 1, 'b': 1, 'e': 1, 't': 1
+        }
+
+    def test_words_with_symbol(self):
+        lex = Lexicon()
+        lex.add('alpha', ['a', 'l', 'f', 'a'])
+        lex.add('beta', ['b', 'e', 't', 'a'])
+
+        assert lex.words_with_symbol('a') == ['alpha', 'beta']
+        assert lex.words_with_symbol('x') == []
+
+        lex.add('alpha', ['a', 'l', 'p', 'h', 'a'])
+        lex.add('gamma', ['g', 'a', 'm', 'a'])
+
+        assert lex.words_with_symbol('a') == ['alpha', 'beta', 'gamma']
+        assert lex.words_with_symbol('p') == ['alpha']
+
+    def test_symbol_index_is_updated_by_add(self):
+        lex = Lexicon()
+        lex.add('alpha', ['a'])
+        lex.symbols()
+
+        index = lex._symbol_index
+        lex.add('beta', ['b'])
+
+        assert lex._symbol_index is index
+        assert lex.symbols() == {'a', 'b'}
+
+    def test_symbols_doesnt_index_words(self):
+        lex = Lexicon({'alpha': [['a', 'l', 'f', 'a']]})
+
+        assert lex.symbol_counts() == {'a': 2, 'l': 1, 'f': 1}
+        assert lex._symbol_index.words is None
+
+        assert lex.words_with_symbol('f') == ['alpha']
+
+        lex.add('beta', ['b', 'f'])
+        assert lex.words_with_symbol('f') == ['alpha', 'beta']
+
+    def test_reset_index(self):
+        entries = {'alpha': [['a', 'l', 'f', 'a']]}
+        lex = Lexicon(entries)
+        lex.add('alpha', ['a', 'l', 'p', 'h', 'a'])
+        lex.words_with_symbol('a')
+
+        # Modified directly, so the index is stale until it is reset
+        entries['alpha'] = [['a', 'x']]
+        entries['beta'] = [['b']]
+        lex.reset_index()
+
+        assert lex.symbols() == {'a', 'x', 'b'}
+        assert lex.words_with_symbol('l') == []
+        assert lex.words_with_symbol('b') == ['beta']
+
+        lex.add('alpha', ['a', 'l', 'f', 'a'])
+        lex.add('alpha', ['a', 'x'])
+
+        assert lex.get('alpha') == [['a', 'x'], ['a', 'l', 'f', 'a']]
+        assert lex.symbol_counts()['a'] == 3
+
+
+class TestCompactLexicon:
+
+    def test_add_and_get(self):
+        lex = CompactLexicon()
+        lex.add('alpha', ['a', 'l', 'p', 'h', 'a'])
+        lex.add('beta', ['b', 'e', 't', 'a'])
+        lex.add('alpha', ['a', 'l', 'f', 'a'])
+        lex.add('alpha', ['a', 'l', 'p', 'h', 'a'])
+
+        assert lex.get('alpha') == [
+            ['a', 'l', 'p', 'h', 'a'],
+            ['a', 'l', 'f', 'a'],
+        ]
+        assert lex.get('beta') == [['b', 'e', 't', 'a']]
+
+        with pytest.raises(KeyError):
+            lex.get('gamma')
+
+    def test_entries(self):
+        lex = CompactLexicon({
+            'alpha': [['a', 'l', 'f', 'a']],
+            'beta': [['b', 'e', 't', 'a'], ['b', 'e', 'd', 'a']],
+        })
+
+        assert len(lex.entries) == 2
+        assert 'alpha' in lex.entries
+        assert 'gamma' not in lex.entries
+        assert list(lex.entries) == ['alpha', 'beta']
+        assert dict(lex.entries.items()) == {
+            'alpha': [['a', 'l', 'f', 'a']],
+            'beta': [['b', 'e', 't', 'a'], ['b', 'e', 'd', 'a']],
+        }
+
+    def test_empty_transcription(self):
+        lex = CompactLexicon()
+        lex.add('alpha', [])
+        lex.add('alpha', ['a'])
+
+        assert lex.get('alpha') == [[], ['a']]
+
+    def test_update(self):
+        lex = CompactLexicon()
+        lex.add('alpha', ['a', 'l', 'f', 'a'])
+
+        other = Lexicon()
+        other.add('alpha', ['a', 'l', 'f', 'a'])
+        other.add('beta', ['b', 'e', 't', 'a'])
+
+        lex.update(other)
+
+        assert lex.get('alpha') == [['a', 'l', 'f', 'a']]
+        assert lex.get('beta') == [['b', 'e', 't', 'a']]
+
+    def test_symbols(self):
+        lex = CompactLexicon()
+        lex.add('alpha', ['a', 'l', 'f', 'a'])
+        lex.add('beta', ['b', 'e', 't', 'a'])
+
+        assert lex.symbols() == {'a', 'l', 'f', 'b', 'e', 't'}
+
+    def test_words_with_symbol(self):
+        lex = CompactLexicon()
+        lex.add('alpha', ['a', 'l', 'f', 'a'])
+
+        assert lex.words_with_symbol('a') == ['alpha']
+
+        lex.add('alpha', ['a', 'l', 'f', 'a'])
+        lex.add('beta', ['b', 'e', 't', 'a'])
+
+        assert lex.words_with_symbol('a') == ['alpha', 'beta']
+        assert lex.symbol_counts()['a'] == 3
+
+    def test_many_symbols(self):
+        lex = CompactLexicon()
+        tokens = [str(i) for i in range(70000)]
+        lex.add('many', tokens)
+        lex.add('few', ['69999', '1'])
+
+        assert lex.get('many') == [tokens]
+        assert lex.get('few') == [['69999', '1']]
+
+    def test_load_and_save(self, tmp_path):
+        path = resources.get_resource_path([
+            'separator',
+            'space.txt'
+        ])
+
+        lex = CompactLexicon.load(path, word_sep=' ', token_sep=' ')
+
+        assert isinstance(lex, CompactLexicon)
+        assert lex.get('alpha') == [['a', 'l', 'p', 'h', 'a']]
+        assert lex.get('charlie') == [['c', 'h', 'a', 'r', 'l', 'i', 'e']]
+
+        target = tmp_path / 'lex.txt'
+        lex.save(str(target))
+
+        assert target.read_text() == (
+            'alpha a l p h a\n'
+            'bravo b r a v o\n'
+            'charlie c h a r l i e\n'
+        )
@@ -0,0 +1,112 @@
+import pytest
+
+from tests import resources
+
+from pyphony import Lexicon
+from pyphony import mmap_lexicon
+
+
+@pytest.fixture
+def lexicon():
+    lex = Lexicon()
+    lex.add('charlie', ['tʃ', 'a', 'r', 'l', 'i'])
+    lex.add('alpha', ['a', 'l', 'f', 'a'])
+    lex.add('alpha', ['a', 'l', 'p', 'h', 'a'])
+    lex.add('über', ['y', 'b', 'ɐ'])
+    lex.add('bravo', ['b', 'r', 'a', 'v', 'o'])
+    lex.add('empty', [])
+    return lex
+
+
+class TestMmapLexicon:
+
+    def test_get(self, lexicon, tmp_path):
+        path = str(tmp_path / 'lex.bin')
+        lexicon.save_mmap(path)
+
+        with Lexicon.open_mmap(path) as lex:
+            for word, transcriptions in lexicon.entries.items():
+                assert lex.get(word) == transcriptions
+
+            with pytest.raises(KeyError):
+                lex.get('delta')
+
+            with pytest.raises(KeyError):
+                lex.get('a')
+
+    def test_entries(self, lexicon, tmp_path):
+        path = str(tmp_path / 'lex.bin')
+        lexicon.save_mmap(path)
+
+        with Lexicon.open_mmap(path) as lex:
+            assert len(lex.entries) == 5
+            assert 'über' in lex.entries
+            assert 'zulu' not in lex.entries
+            assert list(lex.entries) == [
+                'alpha', 'bravo', 'charlie', 'empty', 'über'
+            ]
+            assert dict(lex.entries.items()) == lexicon.entries
+            assert lex.symbols() == lexicon.symbols()
+
+    def test_empty_lexicon(self, tmp_path):
+        path = str(tmp_path / 'lex.bin')
+        Lexicon().save_mmap(path)
+
+        with Lexicon.open_mmap(path) as lex:
+            assert len(lex.entries) == 0
+            assert lex.symbols() == set()
+
+            with pytest.raises(KeyError):
+                lex.get('alpha')
+
+    def test_add_raises(self, lexicon, tmp_path):
+        path = str(tmp_path / 'lex.bin')
+        lexicon.save_mmap(path)
+
+        with Lexicon.open_mmap(path) as lex:
+            with pytest.raises(TypeError):
+                lex.add('delta', ['d'])
+
+            with pytest.raises(TypeError):
+                lex.add_many([('delta', ['d'])])
+
+            with pytest.raises(TypeError):
+                lex.update(lexicon)
+
+    def test_open_raises_with_invalid_file(self, tmp_path):
+        path = tmp_path / 'lex.bin'
+        path.write_bytes(b'\0' * 100)
+
+        with pytest.raises(ValueError):
+            Lexicon.open_mmap(str(path))
+
+    def test_save(self, lexicon, tmp_path):
+        path = str(tmp_path / 'lex.bin')
+        lexicon.save_mmap(path)
+
+        expected = tmp_path / 'expected.txt'
+        lexicon.save(str(expected), all_variants=True)
+
+        target = tmp_path / 'lex.txt'
+
+        with Lexicon.open_mmap(path) as lex:
+            lex.save(str(target), all_variants=True)
+
+        assert target.read_text() == expected.read_text()
+
+
+class TestConvertText:
+
+    def test_convert_text(self, tmp_path):
+        src = resources.get_resource_path([
+            'separator',
+            'semicolon.txt'
+        ])
+        target = str(tmp_path / 'lex.bin')
+
+        mmap_lexicon.convert_text(src, target, word_sep=';')
+
+        with Lexicon.open_mmap(target) as lex:
+            assert lex.get('alpha') == [['a', 'l', 'p', 'h', 'a']]
+            assert lex.get('bravo') == [['b', 'r', 'a', 'v', 'o']]
+            assert lex.get('charlie') == [['c', 'h', 'a', 'r', 'l', 'i', 'e']]
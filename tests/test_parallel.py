@@ -0,0 +1,43 @@
+import pytest
+
+from pyphony import parallel
+
+
+def square(x):
+    return x * x
+
+
+def fail_on_three(x):
+    if x == 3:
+        raise ValueError('three')
+
+    return x
+
+
+class TestChunked:
+
+    def test_chunked(self):
+        res = list(parallel.chunked(range(7), 3))
+        assert res == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_chunked_empty(self):
+        assert list(parallel.chunked([], 3)) == []
+
+    def test_chunked_raises_with_invalid_size(self):
+        with pytest.raises(ValueError):
+            list(parallel.chunked([1, 2], 0))
+
+
+class TestImapOrdered:
+
+    def test_results_are_ordered(self):
+        res = list(parallel.imap_ordered(square, iter(range(20)), 3))
+        assert res == [x * x for x in range(20)]
+
+    def test_raises_exception_of_worker(self):
+        res = parallel.imap_ordered(fail_on_three, range(10), 2)
+
+        assert next(res) == 0
+
+        with pytest.raises(ValueError):
+            list(res)
@@ -0,0 +1,72 @@
+import logging
+
+from pyphony import progress
+
+
+class TestProgress:
+
+    def test_resolve(self):
+        hook = progress.CallbackProgress(print)
+
+        assert progress.resolve(None) is progress.NO_PROGRESS
+        assert progress.resolve(False) is progress.NO_PROGRESS
+        assert isinstance(progress.resolve(True), progress.TqdmProgress)
+        assert progress.resolve(hook) is hook
+
+    def test_no_progress_returns_iterable(self):
+        items = [1, 2, 3]
+        assert progress.NO_PROGRESS(items, desc='Test') is items
+
+
+class TestCallbackProgress:
+
+    def test_reports_when_done(self):
+        infos = []
+        hook = progress.CallbackProgress(infos.append, interval=3600)
+
+        assert list(hook(range(5), desc='Test', total=5)) == list(range(5))
+        assert len(infos) == 1
+        assert infos[0].desc == 'Test'
+        assert infos[0].count == 5
+        assert infos[0].total == 5
+        assert infos[0].done
+        assert infos[0].elapsed >= 0
+
+    def test_reports_every_interval(self):
+        infos = []
+        hook = progress.CallbackProgress(infos.append, interval=0)
+
+        list(hook(['a', 'b', 'c']))
+
+        assert [i.count for i in infos] == [1, 2, 3, 3]
+        assert [i.done for i in infos] == [False, False, False, True]
+
+    def test_weight(self):
+        infos = []
+        hook = progress.CallbackProgress(infos.append)
+
+        list(hook([[1, 2], [3], []], weight=len))
+
+        assert infos[-1].count == 3
+
+
+class TestLoggingProgress:
+
+    def test_logs(self, caplog):
+        caplog.set_level(logging.INFO)
+        hook = progress.LoggingProgress(interval=3600)
+
+        list(hook(range(4), desc='Load lexicon', total=4))
+
+        assert len(caplog.messages) == 1
+        assert caplog.messages[0].startswith('Load lexicon: 4/4 in ')
+        assert caplog.messages[0].endswith(' done')
+
+
+class TestTqdmProgress:
+
+    def test_weight(self):
+        hook = progress.TqdmProgress(disable=True)
+        items = [[1, 2], [3]]
+
+        assert list(hook(items, total=3, weight=len)) == items
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from pyphony import resources
+from pyphony import Alphabet, Converter
+from pyphony.stats import Stats
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    resources.clear_registry()
+
+    yield
+
+    resources.clear_registry()
+
+
+loaded_paths = []
+
+
+def load_json(path):
+    loaded_paths.append(path)
+
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+class TestLoadCached:
+
+    def test_loads_once(self):
+        a = Alphabet.with_name('ipa')
+        b = Alphabet.with_name('ipa')
+
+        assert a is not b
+        assert a._symbol_trie is b._symbol_trie
+        assert Alphabet.with_name('sampa')._symbol_trie is not a._symbol_trie
+
+    def test_loads_converter_once(self):
+        a = Converter.ipa_to_xsampa()
+        b = Converter.with_names('ipa', 'xsampa')
+
+        assert a is not b
+        assert a._index is b._index
+
+    def test_loads_again_after_clear(self):
+        a = Alphabet.with_name('ipa')
+        resources.clear_registry()
+
+        assert Alphabet.with_name('ipa')._symbol_trie is not a._symbol_trie
+
+    def test_configure_alphabet_doesnt_affect_others(self):
+        a = Alphabet.ipa()
+        a.set_backend('regex')
+        a.set_cache_size(10)
+        a.stats = Stats()
+
+        b = Alphabet.ipa()
+
+        assert b.backend == 'trie'
+        assert b.cache_info() is None
+        assert b.stats is None
+
+        assert b.decode('ab') == ['a', 'b']
+        assert a.stats.calls == 0
+
+    def test_configure_converter_doesnt_affect_others(self):
+        a = Converter.ipa_to_xsampa()
+        a.stats = Stats()
+
+        b = Converter.ipa_to_xsampa()
+        b.convert(['a'])
+
+        assert b.stats is None
+        assert a.stats.calls == 0
+
+    def test_loads_data_once(self, tmp_path):
+        src = tmp_path / 'data.json'
+        src.write_text('[1, 2]')
+
+        loaded_paths.clear()
+        assert resources.load_cached(str(src), load_json) == [1, 2]
+        assert resources.load_cached(str(src), load_json) == [1, 2]
+        assert loaded_paths == [str(src)]
+
+    def test_builds_once(self, tmp_path):
+        src = tmp_path / 'data.json'
+        src.write_text('[1, 2]')
+
+        a = resources.load_cached(str(src), load_json, build=tuple)
+        b = resources.load_cached(str(src), load_json, build=tuple)
+
+        assert a == (1, 2)
+        assert a is b
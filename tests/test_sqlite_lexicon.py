@@ -0,0 +1,166 @@
+import threading
+
+import pytest
+
+import pyphony
+from pyphony import Lexicon, SqliteLexicon
+
+
+@pytest.fixture
+def lexicon():
+    lex = Lexicon()
+    lex.add('charlie', ['tʃ', 'a', 'r', 'l', 'i'])
+    lex.add('alpha', ['a', 'l', 'f', 'a'])
+    lex.add('alpha', ['a', 'l', 'p', 'h', 'a'])
+    lex.add('über', ['y', 'b', 'ɐ'])
+    lex.add('bravo', ['b', 'r', 'a', 'v', 'o'])
+    lex.add('empty', [])
+    return lex
+
+
+class TestSqliteLexicon:
+
+    def test_add_and_get(self, lexicon):
+        with SqliteLexicon() as lex:
+            for word, transcriptions in lexicon.entries.items():
+                for tokens in transcriptions:
+                    lex.add(word, tokens)
+
+            lex.add('alpha', ['a', 'l', 'f', 'a'])
+
+            for word, transcriptions in lexicon.entries.items():
+                assert lex.get(word) == transcriptions
+
+            with pytest.raises(KeyError):
+                lex.get('delta')
+
+    def test_persists(self, lexicon, tmp_path):
+        path = str(tmp_path / 'lex.db')
+
+        with SqliteLexicon(path) as lex:
+            lex.update(lexicon)
+
+        with SqliteLexicon(path) as lex:
+            assert lex.get('alpha') == lexicon.get('alpha')
+            assert len(lex.entries) == 5
+
+    def test_add_many(self):
+        with SqliteLexicon() as lex:
+            lex.add_many(
+                ('w{}'.format(i % 7), [str(i % 3)]) for i in range(100)
+            )
+
+            assert len(lex.entries) == 7
+            assert lex.get('w0') == [['0'], ['1'], ['2']]
+
+    def test_failed_add_many_keeps_added(self):
+        def entries():
+            yield 'beta', ['b']
+            raise RuntimeError()
+
+        with SqliteLexicon() as lex:
+            lex.add('alpha', ['a'])
+
+            with pytest.raises(RuntimeError):
+                lex.add_many(entries())
+
+            assert lex.get('alpha') == [['a']]
+            assert 'beta' not in lex.entries
+
+    def test_use_from_other_thread(self, lexicon):
+        results = []
+
+        with SqliteLexicon() as lex:
+            lex.update(lexicon)
+
+            def run():
+                lex.add('delta', ['d'])
+                results.append(lex.get('delta'))
+                results.append(list(lex.entries))
+
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+
+        assert results == [
+            [['d']],
+            sorted(list(lexicon.entries.keys()) + ['delta'])
+        ]
+
+    def test_entries(self, lexicon):
+        with SqliteLexicon() as lex:
+            lex.update(lexicon)
+
+            assert list(lex.entries) == sorted(lexicon.entries.keys())
+            assert 'bravo' in lex.entries
+            assert 'delta' not in lex.entries
+            assert lex.entries['über'] == [['y', 'b', 'ɐ']]
+            assert list(lex.entries.items()) == sorted(
+                lexicon.entries.items()
+            )
+
+    def test_symbols(self, lexicon):
+        with SqliteLexicon() as lex:
+            lex.update(lexicon)
+            assert lex.symbols() == lexicon.symbols()
+
+    def test_words_with_symbol(self, lexicon):
+        with SqliteLexicon() as lex:
+            lex.update(lexicon)
+
+            assert lex.words_with_symbol('a') == ['alpha', 'bravo', 'charlie']
+
+            lex.add('delta', ['d', 'a'])
+            lex.add('delta', ['d', 'a'])
+
+            assert lex.words_with_symbol('a')[-1] == 'delta'
+            assert lex.symbol_counts()['d'] == 1
+
+            lex.add_many([('echo', ['e', 'a'])])
+
+            assert lex.words_with_symbol('e') == ['echo']
+
+    def test_save(self, lexicon, tmp_path):
+        expected = tmp_path / 'expected.txt'
+        target = tmp_path / 'lex.txt'
+        lexicon.save(str(expected), all_variants=True)
+
+        with SqliteLexicon() as lex:
+            lex.update(lexicon)
+            lex.save(str(target), all_variants=True)
+
+        assert target.read_text() == expected.read_text()
+
+    def test_load(self, tmp_path):
+        path = tmp_path / 'lex.txt'
+        path.write_text('bravo b r a v o\nalpha a l f a\nalpha a l p h a\n')
+
+        lex = SqliteLexicon.load(str(path))
+
+        assert list(lex.entries.items()) == sorted(
+            Lexicon.load(str(path)).entries.items()
+        )
+        lex.close()
+
+    def test_convert_lexicon(self, lexicon, tmp_path):
+        converter = pyphony.Converter([
+            (['a'], ['A']),
+            (['l'], ['L']),
+        ])
+        expected = converter.convert_lexicon(
+            lexicon,
+            strict=False,
+            ignore_unmappable_words=True
+        )
+
+        with SqliteLexicon() as in_lex, \
+                SqliteLexicon(str(tmp_path / 'out.db')) as out_lex:
+            in_lex.update(lexicon)
+            res = converter.convert_lexicon(
+                in_lex,
+                strict=False,
+                out_lex=out_lex
+            )
+
+            assert res is out_lex
+            assert dict(res.entries.items()) == expected.entries
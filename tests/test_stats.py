@@ -0,0 +1,85 @@
+import pickle
+import threading
+
+from pyphony.stats import Stats
+
+
+class TestStats:
+
+    def test_record(self):
+        stats = Stats()
+        stats.record(calls=1, steps=3, time=0.5, rule_hits={'a': 2},
+                     match_lengths={1: 2}, unknown={'x': 1})
+        stats.record(calls=1, steps=1, rule_hits={'a': 1, 'b': 1},
+                     ignored={'.': 1})
+
+        assert stats.calls == 2
+        assert stats.steps == 4
+        assert stats.time == 0.5
+        assert stats.rule_hits == {'a': 3, 'b': 1}
+        assert stats.match_lengths == {1: 2}
+        assert stats.ignored == {'.': 1}
+        assert stats.unknown == {'x': 1}
+
+    def test_record_from_threads(self):
+        stats = Stats()
+
+        def work():
+            for _ in range(1000):
+                stats.record(calls=1, rule_hits={'a': 1})
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        assert stats.calls == 4000
+        assert stats.rule_hits == {'a': 4000}
+
+    def test_merge(self):
+        a = Stats()
+        a.record(calls=1, steps=2, rule_hits={'a': 1})
+        b = Stats()
+        b.record(calls=2, steps=1, rule_hits={'a': 1, 'b': 2})
+
+        assert a.merge(b) is a
+        assert a.calls == 3
+        assert a.steps == 3
+        assert a.rule_hits == {'a': 2, 'b': 2}
+        assert b.calls == 2
+
+    def test_pop(self):
+        stats = Stats()
+        stats.record(calls=1, unknown={'x': 1})
+
+        popped = stats.pop()
+
+        assert popped.calls == 1
+        assert popped.unknown == {'x': 1}
+        assert stats.calls == 0
+        assert stats.unknown == {}
+
+    def test_copy_and_reset(self):
+        stats = Stats()
+        stats.record(calls=1, ignored={'.': 1})
+
+        copy = stats.copy()
+        stats.reset()
+
+        assert copy.calls == 1
+        assert copy.ignored == {'.': 1}
+        assert stats.calls == 0
+        assert stats.ignored == {}
+
+    def test_pickle(self):
+        stats = Stats()
+        stats.record(calls=1, rule_hits={('a', 'b'): 1})
+
+        res = pickle.loads(pickle.dumps(stats))
+        res.record(calls=1)
+
+        assert res.calls == 2
+        assert res.rule_hits == {('a', 'b'): 1}
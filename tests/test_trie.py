@@ -0,0 +1,72 @@
+import re
+
+from pyphony.trie import PrefixTrie
+
+
+class TestPrefixTrie:
+
+    def test_longest_match(self):
+        trie = PrefixTrie([
+            ('a', 1),
+            ('ab', 2),
+            ('abc', 3),
+        ])
+
+        assert trie.longest_match('abd') == (2, 2)
+        assert trie.longest_match('abcd') == (3, 3)
+        assert trie.longest_match('xabc', start=1) == (3, 3)
+        assert trie.longest_match('x') is None
+
+    def test_shortest_match(self):
+        trie = PrefixTrie([
+            ('--', 1),
+            ('-', 2),
+        ])
+
+        assert trie.shortest_match('---') == (1, 2)
+        assert trie.shortest_match('a--', start=1) == (1, 2)
+        assert trie.shortest_match('a') is None
+
+    def test_sequence_keys(self):
+        trie = PrefixTrie([
+            (['a'], 'A'),
+            (['a', 'b'], 'AB'),
+        ])
+
+        assert trie.longest_match(['x', 'a', 'b'], start=1) == (2, 'AB')
+        assert trie.longest_match(['a', 'c']) == (1, 'A')
+
+    def test_first_value_is_kept(self):
+        trie = PrefixTrie([
+            ('a', 1),
+            ('a', 2),
+        ])
+
+        assert len(trie) == 1
+        assert trie.longest_match('a') == (1, 1)
+
+    def test_empty_key_is_ignored(self):
+        trie = PrefixTrie([
+            ('', 1),
+        ])
+
+        assert len(trie) == 0
+        assert trie.longest_match('a') is None
+
+    def test_to_regex(self):
+        trie = PrefixTrie((k, k) for k in ['a', 'ab', 'abc', 'b', 'c-', ']'])
+
+        longest = re.compile(trie.to_regex())
+        shortest = re.compile(trie.to_regex(longest=False))
+
+        for text in ['abcd', 'abd', 'ax', 'c-', 'c', ']]', 'x']:
+            match = trie.longest_match(text)
+            m = longest.match(text)
+            assert (m and m.group()) == (match and match[1])
+
+            match = trie.shortest_match(text)
+            m = shortest.match(text)
+            assert (m and m.group()) == (match and match[1])
+
+    def test_to_regex_of_empty_trie(self):
+        assert PrefixTrie().to_regex() is None
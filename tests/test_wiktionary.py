@@ -0,0 +1,97 @@
+import bz2
+
+import pytest
+
+from pyphony import progress
+from pyphony.parser import wiktionary
+
+
+def page(title, text):
+    return (
+        '<page>'
+        '<title>{}</title>'
+        '<revision><text>{}</text></revision>'
+        '</page>'
+    ).format(title, text)
+
+
+DUMP = (
+    '<mediawiki xmlns="http://www.mediawiki.org/xml/export-0.10/">'
+    '<siteinfo><sitename>Wiktionary</sitename></siteinfo>'
+    + page('Haus', '== Haus ({{Sprache|Deutsch}}) ==\n'
+                   '{{IPA}} {{Lautschrift|haʊ̯s}}')
+    + page('house', '== house ({{Sprache|Englisch}}) ==\n'
+                    '{{IPA}} {{Lautschrift|haʊs}}')
+    + page('Vorlage:Haus', '== Vorlage:Haus ({{Sprache|Deutsch}}) ==\n'
+                           '{{IPA}} {{Lautschrift|haʊ̯s}}')
+    + page('Baum', '== Baum ({{Sprache|Deutsch}}) ==')
+    + page('guten Tag', '== guten Tag ({{Sprache|Deutsch}}) ==\n'
+                        '{{IPA}} {{Lautschrift|ˈɡuːtn̩ ˈtaːk}}')
+    + '</mediawiki>'
+)
+
+
+@pytest.fixture
+def dump_path(tmp_path):
+    path = tmp_path / 'dump.xml'
+    path.write_text(DUMP, encoding='utf-8')
+    return str(path)
+
+
+class TestDeWiktionaryParser:
+
+    def test_iter_pages(self, dump_path):
+        parser = wiktionary.DeWiktionaryParser()
+        titles = [
+            p.find('mn:title', parser.ns).text
+            for p in parser.iter_pages(dump_path)
+        ]
+
+        assert titles == ['Haus', 'house', 'Vorlage:Haus', 'Baum', 'guten Tag']
+
+    def test_parse_xml_dump(self, dump_path):
+        parser = wiktionary.DeWiktionaryParser()
+        lex = parser.parse_xml_dump(dump_path)
+
+        assert list(lex.entries.keys()) == ['haus', 'guten', 'tag']
+        assert lex.get('haus') == [['haʊ̯s']]
+        assert lex.get('guten') == [['ˈɡuːtn̩']]
+        assert lex.get('tag') == [['ˈtaːk']]
+
+    def test_parse_xml_dump_bz2(self, tmp_path):
+        path = tmp_path / 'dump.xml.bz2'
+        path.write_bytes(bz2.compress(DUMP.encode('utf-8')))
+
+        parser = wiktionary.DeWiktionaryParser()
+        lex = parser.parse_xml_dump(str(path))
+
+        assert list(lex.entries.keys()) == ['haus', 'guten', 'tag']
+
+    def test_parse_xml_dump_with_workers(self, dump_path):
+        parser = wiktionary.DeWiktionaryParser()
+        expected = parser.parse_xml_dump(dump_path)
+        lex = parser.parse_xml_dump(dump_path, workers=2, chunksize=2)
+
+        assert lex.entries == expected.entries
+        assert list(lex.entries.keys()) == list(expected.entries.keys())
+
+    def test_parse_xml_dump_reports_progress(self, dump_path):
+        infos = []
+        hook = progress.CallbackProgress(infos.append)
+
+        parser = wiktionary.DeWiktionaryParser()
+        parser.parse_xml_dump(dump_path, progress=hook)
+        parser.parse_xml_dump(dump_path, workers=2, progress=hook)
+
+        assert [(i.count, i.done) for i in infos] == [(3, True), (3, True)]
+
+    def test_parse_page_text(self):
+        parser = wiktionary.DeWiktionaryParser()
+        res = parser.parse_page_text(
+            ' Haus ',
+            '== Haus ({{Sprache|Deutsch}}) ==\n{{IPA}} {{Lautschrift|haʊ̯s}}'
+        )
+
+        assert res == ('haus', 'deutsch', [('haus', 'haʊ̯s')])
+        assert parser.parse_page_text('Haus', None) is None
+        assert parser.parse_page_text('Baum', 'no pronunciation') is None